@@ -0,0 +1,77 @@
+import asyncio
+import math
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from app.bootstrap.config import Settings
+from app.core.context import remaining_time
+from app.core.exceptions import ServiceOverloadedError
+from app.utils.logger import get_logger
+from app.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class AdmissionController:
+    """
+    Bounds how much work that needs the upstream runs at once.
+    Up to max_concurrent callers run; up to max_queue more wait FIFO for at most
+    queue_timeout seconds (or the request deadline, if sooner). Anyone beyond
+    that is shed at once with ServiceOverloadedError.
+    """
+
+    def __init__(
+        self, max_concurrent: int = 64, max_queue: int = 128, queue_timeout: float = 5.0
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._queued = 0
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AdmissionController":
+        return cls(
+            max_concurrent=settings.admission_max_concurrent,
+            max_queue=settings.admission_max_queue,
+            queue_timeout=settings.admission_queue_timeout,
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    async def _acquire(self) -> None:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+            return
+
+        if self._queued >= self.max_queue:
+            self._shed("queue_full")
+
+        timeout = self.queue_timeout
+        remaining = remaining_time()
+        if remaining is not None:
+            timeout = max(0.0, min(timeout, remaining))
+
+        self._queued += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=timeout)
+        except TimeoutError:
+            self._shed("queue_timeout")
+        finally:
+            self._queued -= 1
+
+    def _shed(self, reason: str) -> None:
+        metrics.increment("requests_shed", reason=reason)
+        logger.warning(
+            "Shedding request (%s): %d running, %d queued",
+            reason,
+            self.max_concurrent,
+            self._queued
+        )
+        raise ServiceOverloadedError(retry_after=math.ceil(self.queue_timeout))
@@ -1,14 +1,34 @@
-from collections.abc import Awaitable, Callable
+import asyncio
+import heapq
+import math
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from itertools import islice, takewhile
 from typing import Any
 
+from app.application.admission import AdmissionController
 from app.bootstrap.config import Settings
+from app.core.context import Priority, mark_degraded, priority
 from app.core.entities import Tweet
+from app.core.exceptions import TwitterServiceUnavailableError
 from app.core.interfaces import CacheService, TweetRepository
 from app.utils.decorators import measure_time
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+MAX_STREAM_LIMIT = 1000
+
+
+def _recency_key(tweet: Tweet) -> float:
+    return tweet.created_at if tweet.created_at is not None else -math.inf
+
+
+def _newer_than(tweets: list[Tweet], since_id: int | None) -> list[Tweet]:
+    if not since_id:
+        return tweets
+    return list(takewhile(lambda tweet: tweet.id > since_id, tweets))
+
 
 class TweetService:
     def __init__(
@@ -16,41 +36,189 @@ class TweetService:
         tweet_repository: TweetRepository,
         cache_service: CacheService,
         settings: Settings,
+        admission: AdmissionController | None = None,
     ) -> None:
         self.tweet_repository = tweet_repository
         self.cache_service = cache_service
         self.settings = settings
+        self.admission = admission or AdmissionController.from_settings(settings)
 
     def _normalize_limit(self, limit: int) -> int:
         return max(1, min(limit, 100)) if limit else 30
 
+    def _normalize_stream_limit(self, limit: int) -> int:
+        return max(1, min(limit, MAX_STREAM_LIMIT)) if limit else 30
+
     async def _get_with_cache(
         self, cache_key: str, fetch_fn: Callable[..., Awaitable[list[Tweet]]], *args: Any
     ) -> list[Tweet]:
-        cached = await self.cache_service.get(cache_key)
-        if cached is not None:
-            return cached
+        """Serve from cache, refreshing stale entries with a since_id delta or a full fetch"""
+        entry = await self.cache_service.get_entry(cache_key)
+        if entry is not None and entry.is_fresh:
+            return entry.tweets
+
+        fetched_at = None
+        try:
+            async with self.admission.slot():
+                if (
+                    entry is not None
+                    and entry.newest_id
+                    and time.time() - entry.fetched_at < self.settings.cache_stale_ttl
+                ):
+                    *_, limit = args
+                    delta = await fetch_fn(*args, since_id=entry.newest_id)
+                    logger.info(
+                        f"Refreshed '{cache_key}' incrementally: {len(delta)} new tweets"
+                    )
+                    tweets = (delta + entry.tweets)[:limit]
+                    fetched_at = entry.fetched_at
+                else:
+                    tweets = await fetch_fn(*args)
+        except TwitterServiceUnavailableError as e:
+            if entry is None:
+                raise
+            logger.warning(f"Serving stale '{cache_key}' while upstream is unavailable: {e}")
+            mark_degraded()
+            return entry.tweets
 
-        tweets = await fetch_fn(*args)
         if tweets:
-            await self.cache_service.set(cache_key, tweets, self.settings.cache_ttl)
+            await self.cache_service.set(
+                cache_key, tweets, self.settings.cache_ttl, fetched_at=fetched_at
+            )
         return tweets
 
     @measure_time
-    async def get_tweets_by_hashtag(self, hashtag: str, limit: int = 30) -> list[Tweet]:
+    async def get_tweets_by_hashtag(
+        self, hashtag: str, limit: int = 30, since_id: int | None = None
+    ) -> list[Tweet]:
         hashtag = hashtag.lstrip("#").strip()
         limit = self._normalize_limit(limit)
         cache_key = f"hashtag:{hashtag}:limit:{limit}"
-        return await self._get_with_cache(
+        tweets = await self._get_with_cache(
             cache_key, self.tweet_repository.get_tweets_by_hashtag, hashtag, limit
         )
+        return _newer_than(tweets, since_id)
+
+    @measure_time
+    async def get_tweets_by_hashtags(
+        self, hashtags: list[str], limit: int = 30
+    ) -> dict[str, list[Tweet]]:
+        """Fetch several hashtags at once, caching each under its single-hashtag key"""
+        unique: dict[str, str] = {}
+        for hashtag in hashtags:
+            hashtag = hashtag.lstrip("#").strip()
+            if hashtag:
+                unique.setdefault(hashtag.lower(), hashtag)
+        hashtags = list(unique.values())
+        limit = self._normalize_limit(limit)
+
+        cache_keys = {hashtag: f"hashtag:{hashtag}:limit:{limit}" for hashtag in hashtags}
+        cached = await asyncio.gather(
+            *(self.cache_service.get(cache_keys[hashtag]) for hashtag in hashtags)
+        )
+
+        results: dict[str, list[Tweet]] = {}
+        missing: list[str] = []
+        for hashtag, tweets in zip(hashtags, cached, strict=True):
+            if tweets is None:
+                missing.append(hashtag)
+            else:
+                results[hashtag] = tweets
+
+        if missing:
+            async with self.admission.slot():
+                fetched = await self.tweet_repository.get_tweets_by_hashtags(missing, limit)
+            await asyncio.gather(
+                *(
+                    self.cache_service.set(cache_keys[hashtag], tweets, self.settings.cache_ttl)
+                    for hashtag, tweets in fetched.items()
+                    if tweets
+                )
+            )
+            results.update(fetched)
+
+        return {hashtag: results.get(hashtag, []) for hashtag in hashtags}
 
     @measure_time
-    async def get_tweets_by_user(self, username: str, limit: int = 30) -> list[Tweet]:
+    async def get_tweets_by_user(
+        self, username: str, limit: int = 30, since_id: int | None = None
+    ) -> list[Tweet]:
         username = username.lstrip("@").strip()
         limit = self._normalize_limit(limit)
         cache_key = f"user:{username}:limit:{limit}"
-        return await self._get_with_cache(
+        tweets = await self._get_with_cache(
             cache_key, self.tweet_repository.get_tweets_by_user, username, limit
         )
+        return _newer_than(tweets, since_id)
+
+
+    @measure_time
+    async def get_tweets_by_users(self, usernames: list[str], limit: int = 30) -> list[Tweet]:
+        """Merge the timelines of several users into a single feed, newest first"""
+        usernames = list(
+            dict.fromkeys(username.lstrip("@").strip() for username in usernames)
+        )
+        usernames = [username for username in usernames if username]
+        limit = self._normalize_limit(limit)
+
+        cache_keys = {username: f"user:{username}:limit:{limit}" for username in usernames}
+        cached = await asyncio.gather(
+            *(self.cache_service.get(cache_keys[username]) for username in usernames)
+        )
 
+        timelines: dict[str, list[Tweet]] = {}
+        missing: list[str] = []
+        for username, tweets in zip(usernames, cached, strict=True):
+            if tweets is None:
+                missing.append(username)
+            else:
+                timelines[username] = tweets
+
+        if missing:
+            async with self.admission.slot():
+                fetched = await self.tweet_repository.get_tweets_by_users(missing, limit)
+            await asyncio.gather(
+                *(
+                    self.cache_service.set(cache_keys[username], tweets, self.settings.cache_ttl)
+                    for username, tweets in fetched.items()
+                    if tweets
+                )
+            )
+            timelines.update(fetched)
+
+        logger.info(
+            f"Merging {len(timelines)} timelines ({len(missing)} fetched, "
+            f"{len(usernames) - len(missing)} cached)"
+        )
+        merged = heapq.merge(*timelines.values(), key=_recency_key, reverse=True)
+        return list(islice(merged, limit))
+
+    async def _continue_at_bulk_priority(
+        self, pages: AsyncIterator[list[Tweet]]
+    ) -> AsyncIterator[list[Tweet]]:
+        """Yield pages, fetching all but the first at bulk priority"""
+        page = await anext(pages, None)
+        while page is not None:
+            yield page
+            with priority(Priority.BULK):
+                page = await anext(pages, None)
+
+    async def stream_tweets_by_hashtag(self, hashtag: str, limit: int = 30) -> AsyncIterator[Tweet]:
+        """Yield up to limit tweets page by page, without buffering or caching them"""
+        hashtag = hashtag.lstrip("#").strip()
+        limit = self._normalize_stream_limit(limit)
+        async with self.admission.slot():
+            pages = self.tweet_repository.iter_tweets_by_hashtag(hashtag, limit)
+            async for page in self._continue_at_bulk_priority(pages):
+                for tweet in page:
+                    yield tweet
+
+    async def stream_tweets_by_user(self, username: str, limit: int = 30) -> AsyncIterator[Tweet]:
+        """Yield up to limit tweets page by page, without buffering or caching them"""
+        username = username.lstrip("@").strip()
+        limit = self._normalize_stream_limit(limit)
+        async with self.admission.slot():
+            pages = self.tweet_repository.iter_tweets_by_user(username, limit)
+            async for page in self._continue_at_bulk_priority(pages):
+                for tweet in page:
+                    yield tweet
@@ -5,14 +5,55 @@ class Settings(BaseModel):
     debug: bool
     host: str
     port: int = Field(ge=1, le=65535)
+    request_timeout: float = Field(default=0.0, ge=0, le=300)
 
     twitter_bearer_token: str
+    twitter_bearer_tokens: list[str] = Field(default_factory=list)
     twitter_api_base_url: str
     twitter_max_results: int = Field(ge=10, le=100)
     twitter_request_timeout: int = Field(ge=5, le=60)
+    twitter_fanout_concurrency: int = Field(default=8, ge=1, le=50)
+    # At least long enough for one hashtag at the routers' 100 character limit
+    twitter_max_query_length: int = Field(default=512, ge=128, le=4096)
+    twitter_max_retries: int = Field(default=3, ge=0, le=10)
+    twitter_retry_base_delay: float = Field(default=0.5, ge=0, le=10)
+    twitter_retry_total_timeout: float = Field(default=10.0, gt=0, le=120)
+    twitter_retry_budget_ratio: float = Field(default=0.1, ge=0, le=1)
+    twitter_hedging_enabled: bool = False
+    twitter_hedge_percentile: float = Field(default=0.95, gt=0, lt=1)
+    twitter_hedge_min_headroom: int = Field(default=10, ge=1)
+    circuit_breaker_failure_threshold: int = Field(default=5, ge=1, le=100)
+    circuit_breaker_recovery_timeout: float = Field(default=30.0, gt=0, le=600)
+
+    rate_limit_max_wait: float = Field(default=0.0, ge=0, le=60)
+    rate_limit_backend: str = "memory"
+    scheduler_background_reserve: float = Field(default=0.2, ge=0, lt=1)
+    scheduler_bulk_reserve: float = Field(default=0.5, ge=0, lt=1)
+    scheduler_max_defer: float = Field(default=5.0, ge=0, le=60)
+
+    admission_max_concurrent: int = Field(default=64, ge=1, le=10000)
+    admission_max_queue: int = Field(default=128, ge=0, le=100000)
+    admission_queue_timeout: float = Field(default=5.0, gt=0, le=60)
+
+    client_rate_limit_enabled: bool = True
+    client_rate_limit_backend: str = "memory"
+    client_rate_limit_rate: float = Field(default=10.0, gt=0, le=10000)
+    client_rate_limit_burst: int = Field(default=100, ge=1, le=100000)
+    client_api_keys: list[str] = Field(default_factory=list)
+
+    mapping_executor: str = "none"
+    mapping_executor_workers: int = Field(default=2, ge=1, le=64)
+    mapping_offload_threshold: int = Field(default=262144, ge=0)
+
+    # At most the HTTP pool's keep-alive limit, or the extra connections are dropped
+    warmup_connections: int = Field(default=4, ge=0, le=20)
+    warmup_timeout: float = Field(default=10.0, gt=0, le=120)
+    warmup_hashtags: list[str] = Field(default_factory=list)
+    warmup_users: list[str] = Field(default_factory=list)
 
     cache_enabled: bool
     cache_ttl: int = Field(ge=0, le=3600)
+    cache_stale_ttl: int = Field(default=3600, ge=0, le=86400)
     redis_url: str
     redis_enabled: bool
 
@@ -37,6 +78,20 @@ class Settings(BaseModel):
             raise ValueError("log_format must be 'json' or 'console'")
         return v
 
+    @field_validator("rate_limit_backend", "client_rate_limit_backend")
+    @classmethod
+    def validate_rate_limit_backend(cls, v: str) -> str:
+        if v not in ["memory", "redis"]:
+            raise ValueError("rate limit backend must be 'memory' or 'redis'")
+        return v
+
+    @field_validator("mapping_executor")
+    @classmethod
+    def validate_mapping_executor(cls, v: str) -> str:
+        if v not in ["none", "thread", "process"]:
+            raise ValueError("mapping_executor must be 'none', 'thread' or 'process'")
+        return v
+
     @field_validator("twitter_bearer_token")
     @classmethod
     def validate_bearer_token(cls, v: str) -> str:
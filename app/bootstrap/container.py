@@ -0,0 +1,103 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass
+
+import httpx
+
+from app.application.admission import AdmissionController
+from app.application.services import TweetService
+from app.bootstrap.config import Settings
+from app.infrastructure.cache.cache_service import RedisCacheService
+from app.infrastructure.http.client import create_http_client
+from app.infrastructure.http.hedging import LatencyTracker
+from app.infrastructure.http.retry import RetryPolicy
+from app.infrastructure.ratelimit.redis_token_bucket import RedisTokenBucketStore
+from app.infrastructure.ratelimit.token_bucket import ShardedTokenBucketStore, TokenBucketStore
+from app.infrastructure.twitter.auth import TwitterAuthenticator
+from app.infrastructure.twitter.circuit_breaker import CircuitBreakers
+from app.infrastructure.twitter.client import TwitterClient
+from app.infrastructure.twitter.mapper import create_mapping_executor
+from app.infrastructure.twitter.rate_limiter import RateLimiter
+from app.infrastructure.twitter.redis_rate_limiter import RedisRateLimiter
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_rate_limiter(settings: Settings) -> RateLimiter:
+    if settings.rate_limit_backend == "redis":
+        return RedisRateLimiter.from_url(settings.redis_url, max_wait=settings.rate_limit_max_wait)
+    return RateLimiter(max_wait=settings.rate_limit_max_wait)
+
+
+def create_client_rate_limit_store(settings: Settings) -> TokenBucketStore:
+    if settings.client_rate_limit_backend == "redis":
+        return RedisTokenBucketStore.from_url(
+            settings.redis_url, settings.client_rate_limit_rate, settings.client_rate_limit_burst
+        )
+    return ShardedTokenBucketStore(
+        settings.client_rate_limit_rate, settings.client_rate_limit_burst
+    )
+
+
+@dataclass(slots=True)
+class Container:
+    """
+    Application-scoped objects, built once in the lifespan and kept on app.state.
+    Everything stateful that requests share (connection pools, limiter windows,
+    token quarantine, circuit state, latency samples, inbound client buckets)
+    lives here, and close() releases what holds connections or workers.
+    """
+
+    settings: Settings
+    http_client: httpx.AsyncClient
+    rate_limiter: RateLimiter
+    client_rate_limit_store: TokenBucketStore
+    cache_service: RedisCacheService
+    mapping_executor: Executor | None
+    twitter_client: TwitterClient
+    tweet_service: TweetService
+
+    @classmethod
+    def build(cls, settings: Settings) -> "Container":
+        http_client = create_http_client(settings)
+        rate_limiter = create_rate_limiter(settings)
+        cache_service = RedisCacheService(settings)
+        mapping_executor = create_mapping_executor(settings)
+        twitter_client = TwitterClient(
+            settings,
+            http_client,
+            rate_limiter,
+            TwitterAuthenticator(settings),
+            RetryPolicy.from_settings(settings),
+            CircuitBreakers(
+                settings.circuit_breaker_failure_threshold,
+                settings.circuit_breaker_recovery_timeout,
+            ),
+            LatencyTracker(),
+            mapping_executor,
+        )
+        tweet_service = TweetService(
+            twitter_client, cache_service, settings, AdmissionController.from_settings(settings)
+        )
+        return cls(
+            settings=settings,
+            http_client=http_client,
+            rate_limiter=rate_limiter,
+            client_rate_limit_store=create_client_rate_limit_store(settings),
+            cache_service=cache_service,
+            mapping_executor=mapping_executor,
+            twitter_client=twitter_client,
+            tweet_service=tweet_service,
+        )
+
+    async def close(self) -> None:
+        await self.http_client.aclose()
+        logger.info("HTTP client closed")
+
+        await self.cache_service.close()
+        await self.rate_limiter.close()
+        await self.client_rate_limit_store.close()
+
+        if self.mapping_executor is not None:
+            self.mapping_executor.shutdown(cancel_futures=True)
+            logger.info("Mapping executor shut down")
@@ -6,6 +6,10 @@ from typing import Any
 from dotenv import load_dotenv
 
 
+def _split_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 def load_environment() -> dict[str, Any]:
     env_file = Path(".env")
 
@@ -31,15 +35,57 @@ def load_environment() -> dict[str, Any]:
         "debug": os.getenv("DEBUG", "false").lower() == "true",
         "host": os.getenv("HOST", "0.0.0.0"),
         "port": int(os.getenv("PORT", "8000")),
+        "request_timeout": float(os.getenv("REQUEST_TIMEOUT", "0")),
         "twitter_bearer_token": bearer_token,
+        "twitter_bearer_tokens": _split_list(os.getenv("TWITTER_BEARER_TOKENS", "")),
         "twitter_api_base_url": os.getenv(
             "TWITTER_API_BASE_URL",
             "https://api.twitter.com/2"
         ),
         "twitter_max_results": int(os.getenv("TWITTER_MAX_RESULTS", "100")),
         "twitter_request_timeout": int(os.getenv("TWITTER_REQUEST_TIMEOUT", "30")),
+        "twitter_fanout_concurrency": int(os.getenv("TWITTER_FANOUT_CONCURRENCY", "8")),
+        "twitter_max_query_length": int(os.getenv("TWITTER_MAX_QUERY_LENGTH", "512")),
+        "twitter_max_retries": int(os.getenv("TWITTER_MAX_RETRIES", "3")),
+        "twitter_retry_base_delay": float(os.getenv("TWITTER_RETRY_BASE_DELAY", "0.5")),
+        "twitter_retry_total_timeout": float(os.getenv("TWITTER_RETRY_TOTAL_TIMEOUT", "10")),
+        "twitter_retry_budget_ratio": float(os.getenv("TWITTER_RETRY_BUDGET_RATIO", "0.1")),
+        "twitter_hedging_enabled": os.getenv("TWITTER_HEDGING_ENABLED", "false").lower() == "true",
+        "twitter_hedge_percentile": float(os.getenv("TWITTER_HEDGE_PERCENTILE", "0.95")),
+        "twitter_hedge_min_headroom": int(os.getenv("TWITTER_HEDGE_MIN_HEADROOM", "10")),
+        "circuit_breaker_failure_threshold": int(
+            os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5")
+        ),
+        "circuit_breaker_recovery_timeout": float(
+            os.getenv("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "30")
+        ),
+        "rate_limit_max_wait": float(os.getenv("RATE_LIMIT_MAX_WAIT", "0")),
+        "rate_limit_backend": os.getenv("RATE_LIMIT_BACKEND", "memory"),
+        "scheduler_background_reserve": float(
+            os.getenv("SCHEDULER_BACKGROUND_RESERVE", "0.2")
+        ),
+        "scheduler_bulk_reserve": float(os.getenv("SCHEDULER_BULK_RESERVE", "0.5")),
+        "scheduler_max_defer": float(os.getenv("SCHEDULER_MAX_DEFER", "5")),
+        "admission_max_concurrent": int(os.getenv("ADMISSION_MAX_CONCURRENT", "64")),
+        "admission_max_queue": int(os.getenv("ADMISSION_MAX_QUEUE", "128")),
+        "admission_queue_timeout": float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "5")),
+        "client_rate_limit_enabled": (
+            os.getenv("CLIENT_RATE_LIMIT_ENABLED", "true").lower() == "true"
+        ),
+        "client_rate_limit_backend": os.getenv("CLIENT_RATE_LIMIT_BACKEND", "memory"),
+        "client_rate_limit_rate": float(os.getenv("CLIENT_RATE_LIMIT_RATE", "10")),
+        "client_rate_limit_burst": int(os.getenv("CLIENT_RATE_LIMIT_BURST", "100")),
+        "client_api_keys": _split_list(os.getenv("CLIENT_API_KEYS", "")),
+        "mapping_executor": os.getenv("MAPPING_EXECUTOR", "none"),
+        "mapping_executor_workers": int(os.getenv("MAPPING_EXECUTOR_WORKERS", "2")),
+        "mapping_offload_threshold": int(os.getenv("MAPPING_OFFLOAD_THRESHOLD", "262144")),
+        "warmup_connections": int(os.getenv("WARMUP_CONNECTIONS", "4")),
+        "warmup_timeout": float(os.getenv("WARMUP_TIMEOUT", "10")),
+        "warmup_hashtags": _split_list(os.getenv("WARMUP_HASHTAGS", "")),
+        "warmup_users": _split_list(os.getenv("WARMUP_USERS", "")),
         "cache_enabled": os.getenv("CACHE_ENABLED", "false").lower() == "true",
         "cache_ttl": int(os.getenv("CACHE_TTL", "300")),
+        "cache_stale_ttl": int(os.getenv("CACHE_STALE_TTL", "3600")),
         "redis_url": os.getenv("REDIS_URL", "redis://localhost:6379"),
         "redis_enabled": os.getenv("REDIS_ENABLED", "false").lower() == "true",
         "log_level": os.getenv("LOG_LEVEL", "INFO"),
@@ -1,10 +1,14 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any
 
 from fastapi import FastAPI
 
 from app import __version__
+from app.bootstrap.config import get_settings
+from app.bootstrap.container import Container
+from app.bootstrap.warmup import warm_up
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,20 +16,20 @@ logger = get_logger(__name__)
 
 def create_lifespan() -> Any:
     @asynccontextmanager
-    async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.info(f"Application starting (version: {__version__})")
-        yield
-        logger.info("Application shutting down")
-
-        global _http_client, _cache_service
-
-        if _http_client:
-            await _http_client.aclose()
-            logger.info("HTTP client closed")
-
-        if _cache_service:
-            await _cache_service.close()
-            logger.info("Cache service closed")
+        container = Container.build(get_settings())
+        app.state.container = container
+        # Warmup runs alongside serving so /health answers at once; /ready waits for it
+        warmup = asyncio.create_task(warm_up(container))
+        app.state.warmup = warmup
+        try:
+            yield
+        finally:
+            logger.info("Application shutting down")
+            warmup.cancel()
+            with suppress(asyncio.CancelledError):
+                await warmup
+            await container.close()
 
     return lifespan
-
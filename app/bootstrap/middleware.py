@@ -3,27 +3,42 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.bootstrap.config import get_settings
 from app.core.exceptions import TwitterAPIError
+from app.presentation.api.cursors import CURSOR_HEADER
+from app.presentation.middleware.client_rate_limit import (
+    API_KEY_HEADER,
+    RATE_LIMIT_HEADERS,
+    ClientRateLimitMiddleware,
+)
 from app.presentation.middleware.error_handler import (
     global_exception_handler,
     twitter_api_error_handler,
 )
 from app.presentation.middleware.logging import LoggingMiddleware
+from app.presentation.middleware.request_context import (
+    DEGRADED_HEADER,
+    TIMEOUT_HEADER,
+    RequestContextMiddleware,
+)
 
 settings = get_settings()
 
 
 def setup_middleware(app: FastAPI) -> None:
+    # The last middleware added is the outermost
+    app.add_middleware(LoggingMiddleware)
+    if settings.client_rate_limit_enabled:
+        app.add_middleware(ClientRateLimitMiddleware, api_keys=settings.client_api_keys)
+    app.add_middleware(RequestContextMiddleware, default_timeout=settings.request_timeout)
+    # Outermost, so 429 and 504 responses from the middleware above carry CORS headers too
     if settings.cors_origins:
         app.add_middleware(
             CORSMiddleware,
             allow_origins=settings.cors_origins_list,
             allow_credentials=False,
             allow_methods=["GET"],
-            allow_headers=["Accept", "Content-Type"],
+            allow_headers=["Accept", "Content-Type", TIMEOUT_HEADER, API_KEY_HEADER],
+            expose_headers=[CURSOR_HEADER, DEGRADED_HEADER, *RATE_LIMIT_HEADERS, "Retry-After"],
         )
-
-
-    app.add_middleware(LoggingMiddleware)
     app.add_exception_handler(TwitterAPIError, twitter_api_error_handler)  # type: ignore[arg-type]
     app.add_exception_handler(Exception, global_exception_handler)
 
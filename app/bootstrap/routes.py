@@ -1,18 +1,43 @@
-from fastapi import FastAPI
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 
 from app import __version__
-from app.presentation.api.v1 import hashtags, users
+from app.presentation.api.v1 import hashtags, search, users
 from app.presentation.schemas.common import HealthResponse
+from app.utils.metrics import metrics
 
 
 def setup_routes(app: FastAPI) -> None:
     app.include_router(hashtags.router, prefix="/api/v1")
     app.include_router(users.router, prefix="/api/v1")
+    app.include_router(search.router, prefix="/api/v1")
 
     @app.get("/health", response_model=HealthResponse, tags=["health"])
     async def health_check() -> HealthResponse:
         return HealthResponse(status="healthy", version=__version__)
 
+    @app.get(
+        "/ready",
+        response_model=HealthResponse,
+        responses={503: {"model": HealthResponse}},
+        tags=["health"],
+    )
+    async def readiness_check(request: Request) -> Any:
+        warmup = getattr(request.app.state, "warmup", None)
+        if warmup is None or not warmup.done():
+            return JSONResponse(
+                status_code=503,
+                content=HealthResponse(status="warming_up", version=__version__).model_dump(),
+            )
+        return HealthResponse(status="ready", version=__version__)
+
+    @app.get("/metrics", tags=["health"])
+    async def metrics_snapshot() -> dict[str, int]:
+        """In-process counters (retries, deferred and dropped upstream calls, ...)"""
+        return metrics.snapshot()
+
     @app.get("/", tags=["root"])
     async def root() -> dict[str, str]:
         return {
@@ -20,6 +45,7 @@ def setup_routes(app: FastAPI) -> None:
             "version": __version__,
             "docs": "/docs",
             "health": "/health",
+            "ready": "/ready",
         }
 
 
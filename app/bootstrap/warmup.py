@@ -0,0 +1,79 @@
+import asyncio
+
+from app.bootstrap.container import Container
+from app.core.context import Priority, priority
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+async def warm_up(container: Container) -> None:
+    """
+    Pay the first requests' setup costs before the app reports ready: open pooled
+    upstream connections (DNS, TCP, TLS), connect to Redis and fill the cache for
+    the configured hot hashtags and users. Every step is best effort and the whole
+    phase is bounded by warmup_timeout, so a slow or failing dependency delays
+    readiness but never prevents it.
+    """
+    settings = container.settings
+    try:
+        async with asyncio.timeout(settings.warmup_timeout):
+            await asyncio.gather(
+                _open_connections(container),
+                _ping_backends(container),
+            )
+            await _prefetch(container)
+    except TimeoutError:
+        logger.warning("Warmup did not finish within %.1fs", settings.warmup_timeout)
+    else:
+        logger.info("Warmup complete")
+
+
+async def _open_connections(container: Container) -> None:
+    # Concurrent requests on an empty pool each open their own connection,
+    # which stays in the pool for keepalive_expiry once the response is read
+    count = container.settings.warmup_connections
+    if not count:
+        return
+    url = container.settings.twitter_api_base_url
+    results = await asyncio.gather(
+        *(container.http_client.head(url) for _ in range(count)),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(
+            "Opened %d of %d upstream connections: %s", count - len(errors), count, errors[0]
+        )
+    else:
+        logger.info("Opened %d upstream connections", count)
+
+
+async def _ping_backends(container: Container) -> None:
+    for name, ping in (
+        ("cache", container.cache_service.ping),
+        ("rate limiter", container.rate_limiter.ping),
+    ):
+        try:
+            await ping()
+        except Exception as e:
+            logger.warning("Could not reach %s backend during warmup: %s", name, e)
+
+
+async def _prefetch(container: Container) -> None:
+    # Background priority keeps warmup from spending budget reserved for real traffic
+    service = container.tweet_service
+    settings = container.settings
+    with priority(Priority.BACKGROUND):
+        results = await asyncio.gather(
+            *(service.get_tweets_by_hashtag(hashtag) for hashtag in settings.warmup_hashtags),
+            *(service.get_tweets_by_user(username) for username in settings.warmup_users),
+            return_exceptions=True,
+        )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        logger.warning(
+            "Prefetched %d of %d feeds: %s", len(results) - len(errors), len(results), errors[0]
+        )
+    elif results:
+        logger.info("Prefetched %d feeds", len(results))
@@ -0,0 +1,76 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+
+from app.core.exceptions import DeadlineExceededError
+
+
+@dataclass
+class RequestState:
+    """
+    Per-request facts gathered while handling it, read back by the presentation layer.
+    The context variable holds a mutable object so that flags set inside child
+    tasks (asyncio.gather, streaming) are still visible to the request handler.
+    """
+
+    degraded: bool = False
+    deadline: float | None = None
+
+
+_request_state: ContextVar[RequestState | None] = ContextVar("request_state", default=None)
+
+
+def begin_request(timeout: float | None = None) -> RequestState:
+    """Start tracking a request; with a timeout, it must finish within that many seconds"""
+    deadline = time.monotonic() + timeout if timeout else None
+    state = RequestState(deadline=deadline)
+    _request_state.set(state)
+    return state
+
+
+def remaining_time() -> float | None:
+    """Seconds left before the current request's deadline, or None if it has none"""
+    state = _request_state.get()
+    if state is None or state.deadline is None:
+        return None
+    return state.deadline - time.monotonic()
+
+
+def check_deadline() -> None:
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        raise DeadlineExceededError()
+
+
+def mark_degraded() -> None:
+    state = _request_state.get()
+    if state is not None:
+        state.degraded = True
+
+
+class Priority(IntEnum):
+    """Upstream priority classes; lower values are served first"""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+    BULK = 2
+
+
+_priority: ContextVar[Priority] = ContextVar("priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    return _priority.get()
+
+
+@contextmanager
+def priority(level: Priority) -> Iterator[None]:
+    """Run the enclosed upstream calls at the given priority"""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
@@ -1,19 +1,39 @@
+import time
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Account:
     fullname: str
     href: str
     id: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tweet:
+    """
+    created_at is in Unix epoch seconds (None if unknown); rendering it for
+    display is left to the presentation layer. hashtags are interned strings.
+    """
+
     account: Account
-    date: str
-    hashtags: list[str]
+    created_at: int | None
+    hashtags: tuple[str, ...]
     likes: int
     replies: int
     retweets: int
     text: str
+    id: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class CachedTweets:
+    tweets: list[Tweet]
+    newest_id: int
+    expires_at: float
+    # When the tweets were last fetched in full; since_id deltas don't update it
+    fetched_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
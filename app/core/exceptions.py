@@ -26,9 +26,35 @@ class TwitterResourceNotFoundError(TwitterAPIError):
 
 
 class TwitterServiceUnavailableError(TwitterAPIError):
-    def __init__(self, message: str = "Twitter service unavailable") -> None:
+    def __init__(
+        self,
+        message: str = "Twitter service unavailable",
+        retry_after: float | None = None
+    ) -> None:
+        self.retry_after = retry_after
         super().__init__(message, status_code=503)
 
 
+class TwitterCircuitOpenError(TwitterServiceUnavailableError):
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        self.endpoint = endpoint
+        super().__init__(
+            f"Twitter API is failing for '{endpoint}'. Try again in {int(retry_after) + 1} seconds.",
+            retry_after=retry_after,
+        )
+
+
+class ServiceOverloadedError(TwitterServiceUnavailableError):
+    def __init__(
+        self, message: str = "Service is overloaded", retry_after: float | None = None
+    ) -> None:
+        super().__init__(message, retry_after=retry_after)
+
+
+class DeadlineExceededError(TwitterAPIError):
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        super().__init__(message, status_code=504)
+
+
 class CacheError(Exception):
     pass
@@ -1,15 +1,40 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from app.core.entities import Tweet
+from app.core.entities import CachedTweets, Tweet
 
 
 class TweetRepository(ABC):
     @abstractmethod
-    async def get_tweets_by_hashtag(self, hashtag: str, limit: int = 30) -> list[Tweet]:
+    async def get_tweets_by_hashtag(
+        self, hashtag: str, limit: int = 30, since_id: int | None = None
+    ) -> list[Tweet]:
         pass
 
     @abstractmethod
-    async def get_tweets_by_user(self, username: str, limit: int = 30) -> list[Tweet]:
+    async def get_tweets_by_hashtags(
+        self, hashtags: list[str], limit: int = 30
+    ) -> dict[str, list[Tweet]]:
+        pass
+
+    @abstractmethod
+    async def get_tweets_by_user(
+        self, username: str, limit: int = 30, since_id: int | None = None
+    ) -> list[Tweet]:
+        pass
+
+    @abstractmethod
+    async def get_tweets_by_users(
+        self, usernames: list[str], limit: int = 30
+    ) -> dict[str, list[Tweet]]:
+        pass
+
+    @abstractmethod
+    def iter_tweets_by_hashtag(self, hashtag: str, limit: int) -> AsyncIterator[list[Tweet]]:
+        pass
+
+    @abstractmethod
+    def iter_tweets_by_user(self, username: str, limit: int) -> AsyncIterator[list[Tweet]]:
         pass
 
 
@@ -19,7 +44,15 @@ class CacheService(ABC):
         pass
 
     @abstractmethod
-    async def set(self, key: str, value: list[Tweet], ttl: int) -> None:
+    async def get_entry(self, key: str) -> CachedTweets | None:
+        """Return the entry for key even if it is past its TTL but not yet evicted"""
+        pass
+
+    @abstractmethod
+    async def set(
+        self, key: str, value: list[Tweet], ttl: int, fetched_at: float | None = None
+    ) -> None:
+        """Store value; fetched_at is when it was last fetched in full (default: now)"""
         pass
 
     @abstractmethod
@@ -1,3 +1,5 @@
+import sys
+import time
 from typing import Any
 from urllib.parse import urlparse
 
@@ -5,19 +7,24 @@ from aiocache import Cache
 from aiocache.serializers import JsonSerializer
 
 from app.bootstrap.config import Settings
-from app.core.entities import Account, Tweet
+from app.core.context import remaining_time
+from app.core.entities import Account, CachedTweets, Tweet
 from app.core.exceptions import CacheError
 from app.core.interfaces import CacheService
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Bumped whenever the stored tweet layout changes; entries in another format are misses.
+CACHE_FORMAT = 2
+
 
 class RedisCacheService(CacheService):
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
         self.enabled = settings.cache_enabled
         self.ttl = settings.cache_ttl
+        self.stale_ttl = settings.cache_stale_ttl
 
         if not self.enabled:
             logger.info("Cache disabled")
@@ -44,27 +51,53 @@ class RedisCacheService(CacheService):
             logger.info("Cache initialized with memory backend")
 
     async def get(self, key: str) -> list[Tweet] | None:
+        entry = await self.get_entry(key)
+        if entry is None or not entry.is_fresh:
+            return None
+        return entry.tweets
+
+    async def get_entry(self, key: str) -> CachedTweets | None:
         if not self.enabled or not self._cache:
             return None
 
         try:
-            cached_data = await self._cache.get(key)
-            if cached_data:
+            cached_data = await self._cache.get(key, **self._timeout())
+            if isinstance(cached_data, dict) and cached_data.get("format") == CACHE_FORMAT:
                 logger.debug(f"Cache hit: {key}")
-                return self._deserialize_tweets(cached_data)
+                return CachedTweets(
+                    tweets=self._deserialize_tweets(cached_data["tweets"]),
+                    newest_id=int(cached_data["newest_id"]),
+                    expires_at=float(cached_data["expires_at"]),
+                    # Entries written before fetched_at was stored get a full refresh
+                    fetched_at=float(cached_data.get("fetched_at", 0.0)),
+                )
             logger.debug(f"Cache miss: {key}")
             return None
         except Exception as e:
             logger.error(f"Cache get error for key '{key}': {e}")
             return None
 
-    async def set(self, key: str, value: list[Tweet], ttl: int) -> None:
+    async def set(
+        self, key: str, value: list[Tweet], ttl: int, fetched_at: float | None = None
+    ) -> None:
+        """
+        Store tweets as fresh for ``ttl`` seconds.
+        The entry is kept for another ``cache_stale_ttl`` seconds so that it can be
+        refreshed incrementally from its newest tweet id once it goes stale.
+        ``fetched_at`` is when the tweets were last fetched in full, now by default.
+        """
         if not self.enabled or not self._cache:
             return
 
         try:
-            serialized = self._serialize_tweets(value)
-            await self._cache.set(key, serialized, ttl=ttl)
+            entry = {
+                "format": CACHE_FORMAT,
+                "newest_id": str(max((tweet.id for tweet in value), default=0)),
+                "expires_at": time.time() + ttl,
+                "fetched_at": time.time() if fetched_at is None else fetched_at,
+                "tweets": self._serialize_tweets(value),
+            }
+            await self._cache.set(key, entry, ttl=ttl + self.stale_ttl)
             logger.debug(f"Cache set: {key} (ttl={ttl}s, items={len(value)})")
         except Exception as e:
             logger.error(f"Cache set error for key '{key}': {e}")
@@ -80,6 +113,13 @@ class RedisCacheService(CacheService):
         except Exception as e:
             logger.error(f"Cache delete error for key '{key}': {e}")
 
+    def _timeout(self) -> dict[str, float]:
+        """Bound a cache read by the request deadline; aiocache's own default applies otherwise"""
+        remaining = remaining_time()
+        if remaining is None:
+            return {}
+        return {"timeout": max(remaining, 0.001)}
+
     def _serialize_tweets(self, tweets: list[Tweet]) -> list[dict[str, Any]]:
         return [
             {
@@ -88,34 +128,39 @@ class RedisCacheService(CacheService):
                     "href": tweet.account.href,
                     "id": tweet.account.id,
                 },
-                "date": tweet.date,
+                "created_at": tweet.created_at,
                 "hashtags": tweet.hashtags,
                 "likes": tweet.likes,
                 "replies": tweet.replies,
                 "retweets": tweet.retweets,
                 "text": tweet.text,
+                "id": str(tweet.id),
             }
             for tweet in tweets
         ]
 
     def _deserialize_tweets(self, data: list[dict[str, Any]]) -> list[Tweet]:
         tweets = []
+        accounts: dict[int, Account] = {}
         for item in data:
             try:
                 account_data = item["account"]
-                account = Account(
-                    fullname=account_data["fullname"],
-                    href=account_data["href"],
-                    id=account_data["id"],
-                )
+                account = accounts.get(account_data["id"])
+                if account is None:
+                    account = accounts[account_data["id"]] = Account(
+                        fullname=account_data["fullname"],
+                        href=account_data["href"],
+                        id=account_data["id"],
+                    )
                 tweet = Tweet(
                     account=account,
-                    date=item["date"],
-                    hashtags=item["hashtags"],
+                    created_at=item["created_at"],
+                    hashtags=tuple(map(sys.intern, item["hashtags"])),
                     likes=item["likes"],
                     replies=item["replies"],
                     retweets=item["retweets"],
                     text=item["text"],
+                    id=int(item.get("id", 0)),
                 )
                 tweets.append(tweet)
             except (KeyError, ValueError) as e:
@@ -123,6 +168,11 @@ class RedisCacheService(CacheService):
                 continue
         return tweets
 
+    async def ping(self) -> None:
+        """Round-trip to the backend so its connection is open before the first request"""
+        if self._cache:
+            await self._cache.exists("warmup")
+
     async def close(self) -> None:
         if self._cache:
             await self._cache.close()
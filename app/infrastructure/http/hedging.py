@@ -0,0 +1,70 @@
+import asyncio
+import math
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from app.utils.metrics import metrics
+
+
+class LatencyTracker:
+    """
+    Recent successful response times per endpoint, used to pick hedge delays.
+    Percentiles are computed over the last window_size samples and are only
+    reported once min_samples have been seen.
+    """
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20) -> None:
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, key: str, latency: float) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window_size)
+        samples.append(latency)
+
+    def percentile(self, key: str, q: float) -> float | None:
+        samples = self._samples.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1)]
+
+
+async def hedged_call(
+    name: str,
+    call: Callable[[], Awaitable[httpx.Response]],
+    delay: float,
+    may_hedge: Callable[[], Awaitable[bool]],
+) -> httpx.Response:
+    """
+    Run call(); if it has not finished after delay seconds and may_hedge()
+    agrees, run a second call() and return whichever succeeds first.
+    The slower call is cancelled. If both fail, the first failure is raised.
+    """
+    primary = asyncio.ensure_future(call())
+    tasks = {primary}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done and await may_hedge():
+            metrics.increment("upstream_hedges", endpoint=name)
+            tasks.add(asyncio.ensure_future(call()))
+
+        errors: list[BaseException] = []
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.exception()
+                if error is None:
+                    if task is not primary:
+                        metrics.increment("upstream_hedges_won", endpoint=name)
+                    return task.result()
+                errors.append(error)
+        raise errors[0]
+    finally:
+        for task in tasks:
+            task.cancel()
+
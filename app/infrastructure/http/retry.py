@@ -0,0 +1,132 @@
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import httpx
+
+from app.bootstrap.config import Settings
+from app.core.context import check_deadline, remaining_time
+from app.core.exceptions import TwitterServiceUnavailableError
+from app.utils.logger import get_logger
+from app.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class RetryBudget:
+    """
+    Token bucket that caps retries to a fraction of traffic.
+    Every call deposits ratio tokens and every retry spends one, so in steady
+    state at most ratio retries happen per call, plus a burst of max_tokens.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    """
+    Retries transient upstream failures with full-jitter exponential backoff.
+    All attempts of one call share total_timeout: each attempt is told how much
+    of it is left, and a retry that would start past it is not made. A Retry-After
+    hint from the upstream is honoured as a floor.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        total_timeout: float = 10.0,
+        budget: RetryBudget | None = None,
+        retry_on: tuple[type[Exception], ...] = (httpx.HTTPError, TwitterServiceUnavailableError),
+    ) -> None:
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.total_timeout = total_timeout
+        self.budget = budget or RetryBudget()
+        self.retry_on = retry_on
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "RetryPolicy":
+        return cls(
+            max_retries=settings.twitter_max_retries,
+            base_delay=settings.twitter_retry_base_delay,
+            total_timeout=settings.twitter_retry_total_timeout,
+            budget=RetryBudget(ratio=settings.twitter_retry_budget_ratio),
+        )
+
+    def backoff(self, retry: int, error: Exception) -> float:
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+        hint = getattr(error, "retry_after", None)
+        if hint is not None:
+            delay = max(delay, hint)
+        return delay
+
+    async def call(self, name: str, attempt: Callable[[float], Awaitable[T]]) -> T:
+        """
+        Run attempt(remaining_seconds) until it succeeds or retrying is no longer allowed.
+        The time budget is cut short by the current request's deadline, if it has one.
+        """
+        check_deadline()
+        deadline = time.monotonic() + self.total_timeout
+        request_remaining = remaining_time()
+        if request_remaining is not None:
+            deadline = min(deadline, time.monotonic() + request_remaining)
+        self.budget.deposit()
+        retry = 0
+
+        while True:
+            try:
+                return await attempt(deadline - time.monotonic())
+            except self.retry_on as e:
+                delay = self.backoff(retry, e)
+                if retry >= self.max_retries:
+                    reason = "exhausted"
+                elif time.monotonic() + delay >= deadline:
+                    reason = "deadline"
+                elif not self.budget.try_spend():
+                    reason = "budget"
+                else:
+                    reason = None
+
+                if reason is not None:
+                    metrics.increment("upstream_retries_abandoned", endpoint=name, reason=reason)
+                    logger.error(
+                        "Not retrying '%s' after %d attempts (%s, error: %s: %s)",
+                        name,
+                        retry + 1,
+                        reason,
+                        type(e).__name__,
+                        str(e)
+                    )
+                    raise
+
+                retry += 1
+                metrics.increment("upstream_retries", endpoint=name)
+                logger.warning(
+                    "Retry attempt %d/%d for '%s' after %.2fs delay (error: %s: %s)",
+                    retry,
+                    self.max_retries,
+                    name,
+                    delay,
+                    type(e).__name__,
+                    str(e)
+                )
+                await asyncio.sleep(delay)
@@ -0,0 +1 @@
+"""Inbound per-client rate limiting"""
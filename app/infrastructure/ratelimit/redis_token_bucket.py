@@ -0,0 +1,91 @@
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infrastructure.ratelimit.token_bucket import (
+    BucketResult,
+    ShardedTokenBucketStore,
+    TokenBucketStore,
+)
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Returns {allowed, tokens * 1000}. The key expires once the bucket would be full,
+# so idle clients cost nothing.
+TAKE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = tonumber(ARGV[1]) / 1000
+local burst = tonumber(ARGV[2])
+
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1])
+if tokens == nil then
+    tokens = burst
+else
+    tokens = math.min(burst, tokens + (now - tonumber(state[2])) * rate)
+end
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+return {allowed, math.floor(tokens * 1000)}
+"""
+
+
+class RedisTokenBucketStore(TokenBucketStore):
+    """
+    Token buckets in Redis, shared by every worker; each take is one script call.
+    While Redis is unreachable, buckets are kept per worker for fallback_seconds.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        rate: float,
+        burst: int,
+        prefix: str = "twitter_api:clientlimit",
+        fallback_seconds: float = 5.0,
+    ) -> None:
+        super().__init__(rate, burst)
+        self.redis = redis
+        self.prefix = prefix
+        self.fallback_seconds = fallback_seconds
+        self._script = redis.register_script(TAKE_SCRIPT)
+        self._fallback = ShardedTokenBucketStore(rate, burst)
+        self._fallback_until = 0.0
+
+    @classmethod
+    def from_url(cls, redis_url: str, rate: float, burst: int) -> "RedisTokenBucketStore":
+        redis = Redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        return cls(redis, rate, burst)
+
+    async def take(self, key: str) -> BucketResult:
+        if time.monotonic() < self._fallback_until:
+            return await self._fallback.take(key)
+
+        try:
+            allowed, tokens = await self._script(
+                keys=[f"{self.prefix}:{key}"], args=[self.rate, self.burst]
+            )
+        except (RedisError, OSError) as e:
+            if time.monotonic() >= self._fallback_until:
+                logger.warning(
+                    "Redis client limiter unavailable (%s), using local buckets for %.0fs",
+                    e,
+                    self.fallback_seconds
+                )
+            self._fallback_until = time.monotonic() + self.fallback_seconds
+            return await self._fallback.take(key)
+
+        return self._result(bool(allowed), tokens / 1000)
+
+    async def close(self) -> None:
+        await self.redis.aclose()
@@ -0,0 +1,100 @@
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class BucketResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the bucket is full again
+    reset_after: float
+    # Seconds until the next request would be allowed (0 when allowed)
+    retry_after: float
+
+
+@dataclass(slots=True)
+class _Bucket:
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketStore(ABC):
+    """
+    Token buckets keyed by client: each holds up to burst tokens and refills
+    at rate tokens per second; a request takes one.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+
+    @abstractmethod
+    async def take(self, key: str) -> BucketResult:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+    def _result(self, allowed: bool, tokens: float) -> BucketResult:
+        return BucketResult(
+            allowed=allowed,
+            limit=self.burst,
+            remaining=int(tokens),
+            reset_after=(self.burst - tokens) / self.rate,
+            retry_after=0.0 if allowed else (1 - tokens) / self.rate,
+        )
+
+
+class ShardedTokenBucketStore(TokenBucketStore):
+    """
+    In-process store split into shards by key hash.
+    A bucket idle long enough to have refilled is indistinguishable from a new
+    one, so expiry is lazy: each shard is swept of full buckets at most once per
+    sweep_interval, on its next access. Sharding keeps each sweep short.
+    """
+
+    def __init__(
+        self, rate: float, burst: int, shards: int = 16, sweep_interval: float = 60.0
+    ) -> None:
+        super().__init__(rate, burst)
+        self.sweep_interval = sweep_interval
+        self._shards: list[dict[str, _Bucket]] = [{} for _ in range(shards)]
+        self._next_sweep = [0.0] * shards
+
+    async def take(self, key: str) -> BucketResult:
+        return self.take_now(key, time.monotonic())
+
+    async def close(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def take_now(self, key: str, now: float) -> BucketResult:
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+        if now >= self._next_sweep[index]:
+            self._sweep(shard, now)
+            self._next_sweep[index] = now + self.sweep_interval
+
+        bucket = shard.get(key)
+        if bucket is None:
+            bucket = shard[key] = _Bucket(float(self.burst), now)
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.updated_at) * self.rate)
+            bucket.updated_at = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return self._result(True, bucket.tokens)
+        return self._result(False, bucket.tokens)
+
+    def _sweep(self, shard: dict[str, _Bucket], now: float) -> None:
+        refill_time = self.burst / self.rate
+        expired = [key for key, bucket in shard.items() if now - bucket.updated_at >= refill_time]
+        for key in expired:
+            del shard[key]
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
@@ -1,12 +1,56 @@
+import time
+from dataclasses import dataclass
+
 from app.bootstrap.config import Settings
-from app.core.exceptions import TwitterAuthenticationError
+from app.core.exceptions import TwitterAuthenticationError, TwitterRateLimitError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# How long a token rejected with 401 stays out of rotation (one Twitter rate-limit window)
+AUTH_FAILURE_QUARANTINE_SECONDS = 900
+# Fallback for a 429 that carries no usable x-rate-limit-reset header
+RATE_LIMIT_QUARANTINE_SECONDS = 60
+
+
+@dataclass(slots=True)
+class BearerToken:
+    """
+    One bearer token from the pool.
+    Headers are built once; callers must treat them as read-only.
+    """
+
+    name: str
+    headers: dict[str, str]
+    quarantined_until: float = 0.0
+    auth_failed: bool = False
 
 
 class TwitterAuthenticator:
+    """
+    Pool of bearer tokens, each from a separately approved Twitter app.
+    The primary TWITTER_BEARER_TOKEN is always first; TWITTER_BEARER_TOKENS
+    adds more. Tokens rejected with 401 or 429 are quarantined until they reset,
+    except that a 401 never takes out the last token in rotation: it stays in so
+    the next request probes it, as a single-token setup has nothing to fall back on.
+    """
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self._validate_credentials()
 
+        secrets = dict.fromkeys([settings.twitter_bearer_token, *settings.twitter_bearer_tokens])
+        self.tokens = [
+            BearerToken(
+                name=f"token{index}",
+                headers={
+                    "Authorization": f"Bearer {secret}",
+                    "Content-Type": "application/json"
+                },
+            )
+            for index, secret in enumerate(secrets)
+        ]
+
     def _validate_credentials(self) -> None:
         if not self.settings.twitter_bearer_token:
             raise TwitterAuthenticationError(
@@ -14,7 +58,53 @@ class TwitterAuthenticator:
             )
 
     def get_headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self.settings.twitter_bearer_token}",
-            "Content-Type": "application/json"
-        }
+        return self.tokens[0].headers
+
+    def available_tokens(self) -> list[BearerToken]:
+        now = time.time()
+        return [token for token in self.tokens if token.quarantined_until <= now]
+
+    def require_available_tokens(self) -> list[BearerToken]:
+        """
+        Return the tokens currently in rotation.
+        Raises the error that took the last token out if none are left.
+        """
+        tokens = self.available_tokens()
+        if tokens:
+            return tokens
+
+        if all(token.auth_failed for token in self.tokens):
+            raise TwitterAuthenticationError("Invalid or expired Twitter API credentials")
+
+        reset_time = int(min(
+            token.quarantined_until for token in self.tokens if not token.auth_failed
+        ))
+        raise TwitterRateLimitError(
+            "All Twitter API tokens are rate limited",
+            reset_time=reset_time,
+        )
+
+    def quarantine(self, token: BearerToken, status_code: int, reset_time: int | None) -> None:
+        """Take token out of rotation after a 401 or 429 response"""
+        if status_code == 401 and all(other is token for other in self.available_tokens()):
+            logger.warning(
+                "Bearer token %s rejected with HTTP 401; kept as the last token in rotation",
+                token.name
+            )
+            return
+
+        now = time.time()
+        token.auth_failed = status_code == 401
+        if token.auth_failed:
+            token.quarantined_until = now + AUTH_FAILURE_QUARANTINE_SECONDS
+        elif reset_time and reset_time > now:
+            token.quarantined_until = reset_time
+        else:
+            token.quarantined_until = now + RATE_LIMIT_QUARANTINE_SECONDS
+
+        logger.warning(
+            "Bearer token %s quarantined after HTTP %d until %d",
+            token.name,
+            status_code,
+            token.quarantined_until
+        )
@@ -0,0 +1,94 @@
+import time
+from enum import Enum
+
+from app.core.exceptions import TwitterCircuitOpenError
+from app.utils.logger import get_logger
+from app.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fails calls to one upstream endpoint fast once it keeps failing.
+    After failure_threshold consecutive failures the circuit opens for
+    recovery_timeout seconds, then lets a single probe through (half-open):
+    its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self) -> None:
+        """Raise TwitterCircuitOpenError unless a call may go upstream now"""
+        if self.state is CircuitState.CLOSED:
+            return
+
+        if self.state is CircuitState.OPEN:
+            retry_after = self._opened_at + self.recovery_timeout - time.monotonic()
+            if retry_after > 0:
+                raise TwitterCircuitOpenError(self.name, retry_after)
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self._probe_in_flight:
+            raise TwitterCircuitOpenError(self.name, self.recovery_timeout)
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        self._probe_in_flight = False
+        self._failures = 0
+        if self.state is not CircuitState.CLOSED:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self._probe_in_flight = False
+        self._failures += 1
+        if self.state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """End a call whose outcome says nothing about upstream health"""
+        self._probe_in_flight = False
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning(
+            "Circuit for '%s' %s -> %s after %d consecutive failures",
+            self.name,
+            self.state.value,
+            state.value,
+            self._failures
+        )
+        metrics.increment("circuit_transitions", endpoint=self.name, state=state.value)
+        self.state = state
+
+
+class CircuitBreakers:
+    """One lazily created CircuitBreaker per upstream endpoint"""
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(
+                endpoint, self.failure_threshold, self.recovery_timeout
+            )
+        return breaker
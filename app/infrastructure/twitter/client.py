@@ -1,9 +1,14 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Mapping
+from concurrent.futures import Executor
 from contextlib import suppress
 from typing import Any
 
 import httpx
 
 from app.bootstrap.config import Settings
+from app.core.context import Priority, current_priority
 from app.core.entities import Tweet
 from app.core.exceptions import (
     TwitterAPIError,
@@ -13,153 +18,450 @@ from app.core.exceptions import (
     TwitterServiceUnavailableError,
 )
 from app.core.interfaces import TweetRepository
-from app.infrastructure.twitter.auth import TwitterAuthenticator
-from app.infrastructure.twitter.mapper import map_tweet
+from app.infrastructure.http.hedging import LatencyTracker, hedged_call
+from app.infrastructure.http.retry import RetryPolicy
+from app.infrastructure.twitter.auth import BearerToken, TwitterAuthenticator
+from app.infrastructure.twitter.circuit_breaker import CircuitBreakers
+from app.infrastructure.twitter.mapper import parse_tweets_page, parse_user, parse_users
 from app.infrastructure.twitter.rate_limiter import RateLimiter
-from app.utils.decorators import measure_time, retry_on_exception
+from app.infrastructure.twitter.scheduler import UpstreamScheduler
+from app.utils.decorators import measure_time
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+SEARCH_MIN_RESULTS = 10
+TIMELINE_MIN_RESULTS = 5
+
 
 class TwitterClient(TweetRepository):
     def __init__(
         self,
         settings: Settings,
         http_client: httpx.AsyncClient,
-        rate_limiter: RateLimiter | None = None
+        rate_limiter: RateLimiter | None = None,
+        authenticator: TwitterAuthenticator | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        latency_tracker: LatencyTracker | None = None,
+        mapping_executor: Executor | None = None,
     ):
         self.settings = settings
         self.http_client = http_client
-        self.authenticator = TwitterAuthenticator(settings)
+        self.authenticator = authenticator or TwitterAuthenticator(settings)
         self.rate_limiter = rate_limiter or RateLimiter()
+        self.scheduler = UpstreamScheduler.from_settings(self.rate_limiter, settings)
+        self.retry_policy = retry_policy or RetryPolicy.from_settings(settings)
+        self.circuit_breakers = circuit_breakers or CircuitBreakers(
+            settings.circuit_breaker_failure_threshold,
+            settings.circuit_breaker_recovery_timeout,
+        )
+        self.latency_tracker = latency_tracker or LatencyTracker()
+        self.mapping_executor = mapping_executor
         self.base_url = settings.twitter_api_base_url
 
     @measure_time
-    async def get_tweets_by_hashtag(self, hashtag: str, limit: int = 30) -> list[Tweet]:
+    async def get_tweets_by_hashtag(
+        self, hashtag: str, limit: int = 30, since_id: int | None = None
+    ) -> list[Tweet]:
         hashtag = hashtag.lstrip("#")
         limit = min(limit, self.settings.twitter_max_results)
-        logger.info(f"Fetching tweets by hashtag: {hashtag}, limit: {limit}")
+        logger.info(f"Fetching tweets by hashtag: {hashtag}, limit: {limit}, since_id: {since_id}")
 
         query = f"#{hashtag}"
-        tweets = await self._search_tweets(query, limit)
+        tweets = await self._search_tweets(query, limit, since_id)
 
         logger.info(f"Tweets fetched for hashtag '{hashtag}': {len(tweets)} tweets")
         return tweets
 
     @measure_time
-    async def get_tweets_by_user(self, username: str, limit: int = 30) -> list[Tweet]:
+    async def get_tweets_by_hashtags(
+        self, hashtags: list[str], limit: int = 30
+    ) -> dict[str, list[Tweet]]:
+        """Search several hashtags with as few OR queries as the query length allows"""
+        hashtags = [hashtag.lstrip("#") for hashtag in hashtags]
+        limit = min(limit, self.settings.twitter_max_results)
+        queries = self._build_hashtag_queries(hashtags)
+        logger.info(f"Fetching tweets by {len(hashtags)} hashtags in {len(queries)} queries")
+
+        results: dict[str, list[Tweet]] = {hashtag: [] for hashtag in hashtags}
+
+        async def search(query: str, tags: list[str]) -> None:
+            # Full hashtags are dropped from the query, which resumes below the oldest tweet seen
+            seen: dict[str, set[int]] = {tag: set() for tag in tags}
+            pending = tags
+            next_token: str | None = None
+            until_id: int | None = None
+            while True:
+                tweets, next_token = await self._fetch_search_page(
+                    query, self.settings.twitter_max_results, next_token, until_id=until_id
+                )
+                wanted = {tag.lower(): tag for tag in pending}
+                added = False
+                for tweet in tweets:
+                    for tag in {tag.lstrip("#").lower() for tag in tweet.hashtags}:
+                        hashtag = wanted.get(tag)
+                        if (
+                            hashtag is not None
+                            and len(results[hashtag]) < limit
+                            and tweet.id not in seen[hashtag]
+                        ):
+                            results[hashtag].append(tweet)
+                            seen[hashtag].add(tweet.id)
+                            added = True
+
+                if next_token is None or not added:
+                    return
+                short = [tag for tag in pending if len(results[tag]) < limit]
+                if not short:
+                    return
+                if len(short) < len(pending):
+                    pending = short
+                    query = " OR ".join(f"#{tag}" for tag in pending)
+                    next_token = None
+                    until_id = min(tweet.id for tweet in tweets)
+
+        await asyncio.gather(*(search(query, tags) for query, tags in queries.items()))
+
+        logger.info(
+            "Tweets fetched for hashtags: "
+            + ", ".join(f"'{hashtag}': {len(tweets)}" for hashtag, tweets in results.items())
+        )
+        return results
+
+    def _build_hashtag_queries(self, hashtags: list[str]) -> dict[str, list[str]]:
+        """OR queries within twitter_max_query_length, mapped to the hashtags they cover"""
+        max_length = self.settings.twitter_max_query_length
+        queries: dict[str, list[str]] = {}
+        current = ""
+        tags: list[str] = []
+
+        for hashtag in hashtags:
+            term = f"#{hashtag}"
+            candidate = f"{current} OR {term}" if current else term
+            if len(candidate) <= max_length:
+                current = candidate
+                tags.append(hashtag)
+                continue
+            if current:
+                queries[current] = tags
+            current = term
+            tags = [hashtag]
+
+        if current:
+            queries[current] = tags
+        return queries
+
+    @measure_time
+    async def get_tweets_by_user(
+        self, username: str, limit: int = 30, since_id: int | None = None
+    ) -> list[Tweet]:
         username = username.lstrip("@")
         limit = min(limit, self.settings.twitter_max_results)
-        logger.info(f"Fetching tweets by user: {username}, limit: {limit}")
+        logger.info(f"Fetching tweets by user: {username}, limit: {limit}, since_id: {since_id}")
 
         user_id = await self._get_user_id(username)
-        tweets = await self._get_user_timeline(user_id, limit)
+        tweets = await self._get_user_timeline(user_id, limit, since_id)
 
         logger.info(f"Tweets fetched for user '{username}': {len(tweets)} tweets")
         return tweets
 
-    @retry_on_exception(
-        max_retries=3,
-        delay=1.0,
-        backoff=2.0,
-        exceptions=(httpx.HTTPError, TwitterServiceUnavailableError),
-    )
-    async def _search_tweets(self, query: str, limit: int) -> list[Tweet]:
-        await self.rate_limiter.acquire("search_tweets")
+    @measure_time
+    async def get_tweets_by_users(
+        self, usernames: list[str], limit: int = 30
+    ) -> dict[str, list[Tweet]]:
+        usernames = [username.lstrip("@") for username in usernames]
+        limit = min(limit, self.settings.twitter_max_results)
+        logger.info(f"Fetching tweets by {len(usernames)} users, limit: {limit}")
+
+        user_ids = await self._get_user_ids(usernames)
+        semaphore = asyncio.Semaphore(self.settings.twitter_fanout_concurrency)
+
+        async def fetch_timeline(username: str, user_id: str) -> tuple[str, list[Tweet]]:
+            async with semaphore:
+                return username, await self._get_user_timeline(user_id, limit)
+
+        timelines = await asyncio.gather(
+            *(fetch_timeline(username, user_id) for username, user_id in user_ids.items())
+        )
+
+        logger.info(f"Timelines fetched for {len(timelines)} users")
+        return dict(timelines)
+
+    async def iter_tweets_by_hashtag(self, hashtag: str, limit: int) -> AsyncIterator[list[Tweet]]:
+        hashtag = hashtag.lstrip("#")
+        logger.info(f"Streaming tweets by hashtag: {hashtag}, limit: {limit}")
+
+        async for page in self._iter_search_pages(f"#{hashtag}", limit):
+            yield page
+
+    async def iter_tweets_by_user(self, username: str, limit: int) -> AsyncIterator[list[Tweet]]:
+        username = username.lstrip("@")
+        logger.info(f"Streaming tweets by user: {username}, limit: {limit}")
+
+        user_id = await self._get_user_id(username)
+        async for page in self._iter_timeline_pages(user_id, limit):
+            yield page
 
+    async def _search_tweets(
+        self, query: str, limit: int, since_id: int | None = None
+    ) -> list[Tweet]:
+        tweets: list[Tweet] = []
+        async for page in self._iter_search_pages(query, limit, since_id):
+            tweets.extend(page)
+        return tweets
+
+    async def _iter_search_pages(
+        self, query: str, limit: int, since_id: int | None = None
+    ) -> AsyncIterator[list[Tweet]]:
+        next_token: str | None = None
+        remaining = limit
+
+        while remaining > 0:
+            page_size = max(SEARCH_MIN_RESULTS, min(remaining, self.settings.twitter_max_results))
+            tweets, next_token = await self._fetch_search_page(
+                query, page_size, next_token, since_id
+            )
+            tweets = tweets[:remaining]
+            remaining -= len(tweets)
+            if tweets:
+                yield tweets
+            if not next_token:
+                return
+
+    async def _fetch_search_page(
+        self,
+        query: str,
+        max_results: int,
+        next_token: str | None = None,
+        since_id: int | None = None,
+        until_id: int | None = None,
+    ) -> tuple[list[Tweet], str | None]:
         url = f"{self.base_url}/tweets/search/recent"
         params = {
             "query": query,
-            "max_results": limit,
+            "max_results": max_results,
             "tweet.fields": "created_at,public_metrics,entities,author_id",
             "expansions": "author_id",
             "user.fields": "id,name,username"
         }
+        if next_token:
+            params["next_token"] = next_token
+        if since_id:
+            params["since_id"] = str(since_id)
+        if until_id:
+            params["until_id"] = str(until_id)
 
         try:
-            response = await self.http_client.get(
-                url,
-                params=params,
-                headers=self.authenticator.get_headers(),
-                timeout=self.settings.twitter_request_timeout,
-            )
-
-            self._handle_response_errors(response)
-
-            data = response.json()
-            return self._parse_tweets_response(data)
+            response = await self._get("search_tweets", url, params)
+            return await self._parse_tweets_page(response.content)
 
         except httpx.HTTPError as e:
             logger.error(f"Twitter API HTTP error for query '{query}': {e}")
             raise TwitterServiceUnavailableError(f"Twitter API request failed: {e}") from e
 
-    @retry_on_exception(
-        max_retries=3,
-        delay=1.0,
-        backoff=2.0,
-        exceptions=(httpx.HTTPError, TwitterServiceUnavailableError),
-    )
     async def _get_user_id(self, username: str) -> str:
-        await self.rate_limiter.acquire("get_user")
-
         url = f"{self.base_url}/users/by/username/{username}"
 
         try:
-            response = await self.http_client.get(
-                url,
-                params={"user.fields": "id,name,username"},
-                headers=self.authenticator.get_headers(),
-                timeout=self.settings.twitter_request_timeout,
-            )
-
-            self._handle_response_errors(response)
-
-            data = response.json()
-            user_data = data.get("data")
+            response = await self._get("get_user", url, {"user.fields": "id,name,username"})
 
-            if not user_data or "id" not in user_data:
+            user = parse_user(response.content)
+            if user is None:
                 raise TwitterResourceNotFoundError(f"User @{username} not found")
 
-            return str(user_data["id"])
+            return str(user.id)
 
         except httpx.HTTPError as e:
             logger.error(f"Twitter API HTTP error for username '{username}': {e}")
             raise TwitterServiceUnavailableError(f"Twitter API request failed: {e}") from e
 
-    @retry_on_exception(
-        max_retries=3,
-        delay=1.0,
-        backoff=2.0,
-        exceptions=(httpx.HTTPError, TwitterServiceUnavailableError),
-    )
-    async def _get_user_timeline(self, user_id: str, limit: int) -> list[Tweet]:
-        await self.rate_limiter.acquire("user_timeline")
+    async def _get_user_ids(self, usernames: list[str]) -> dict[str, str]:
+        """Resolve up to 100 usernames with a single batch lookup, skipping unknown ones"""
+        url = f"{self.base_url}/users/by"
 
+        try:
+            response = await self._get(
+                "get_users",
+                url,
+                {"usernames": ",".join(usernames), "user.fields": "id,name,username"},
+            )
+
+            resolved = {
+                user.username.lower(): str(user.id)
+                for user in parse_users(response.content)
+                if user.username is not None
+            }
+
+            user_ids = {}
+            for username in usernames:
+                user_id = resolved.get(username.lower())
+                if user_id:
+                    user_ids[username] = user_id
+                else:
+                    logger.warning(f"User @{username} not found, skipping")
+            return user_ids
+
+        except httpx.HTTPError as e:
+            logger.error(f"Twitter API HTTP error for usernames {usernames}: {e}")
+            raise TwitterServiceUnavailableError(f"Twitter API request failed: {e}") from e
+
+    async def _get_user_timeline(
+        self, user_id: str, limit: int, since_id: int | None = None
+    ) -> list[Tweet]:
+        tweets: list[Tweet] = []
+        async for page in self._iter_timeline_pages(user_id, limit, since_id):
+            tweets.extend(page)
+        return tweets
+
+    async def _iter_timeline_pages(
+        self, user_id: str, limit: int, since_id: int | None = None
+    ) -> AsyncIterator[list[Tweet]]:
+        pagination_token: str | None = None
+        remaining = limit
+
+        while remaining > 0:
+            page_size = max(TIMELINE_MIN_RESULTS, min(remaining, self.settings.twitter_max_results))
+            tweets, pagination_token = await self._fetch_timeline_page(
+                user_id, page_size, pagination_token, since_id
+            )
+            tweets = tweets[:remaining]
+            remaining -= len(tweets)
+            if tweets:
+                yield tweets
+            if not pagination_token:
+                return
+
+    async def _fetch_timeline_page(
+        self,
+        user_id: str,
+        max_results: int,
+        pagination_token: str | None = None,
+        since_id: int | None = None,
+    ) -> tuple[list[Tweet], str | None]:
         url = f"{self.base_url}/users/{user_id}/tweets"
         params = {
-            "max_results": limit,
+            "max_results": max_results,
             "tweet.fields": "created_at,author_id,public_metrics,entities",
             "expansions": "author_id",
             "user.fields": "id,name,username"
         }
+        if pagination_token:
+            params["pagination_token"] = pagination_token
+        if since_id:
+            params["since_id"] = str(since_id)
 
         try:
-            response = await self.http_client.get(
+            response = await self._get("user_timeline", url, params)
+            return await self._parse_tweets_page(response.content)
+
+        except httpx.HTTPError as e:
+            logger.error(f"Twitter API HTTP error for user_id '{user_id}': {e}")
+            raise TwitterServiceUnavailableError(f"Twitter API request failed: {e}") from e
+
+    async def _get(self, endpoint: str, url: str, params: dict[str, Any]) -> httpx.Response:
+        """Call endpoint under its circuit breaker, retrying per the retry policy"""
+        breaker = self.circuit_breakers.get(endpoint)
+        breaker.before_call()
+        try:
+            response = await self.retry_policy.call(
+                endpoint, lambda remaining: self._send(endpoint, url, params, remaining)
+            )
+        except self.retry_policy.retry_on:
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+
+        breaker.record_success()
+        return response
+
+    async def _send(
+        self, endpoint: str, url: str, params: dict[str, Any], remaining: float
+    ) -> httpx.Response:
+        """Send a GET through the bearer token with the most headroom for endpoint"""
+        tried: set[str] = set()
+        while True:
+            token = self._select_token(endpoint, tried)
+            limiter_key = f"{endpoint}:{token.name}"
+            await self.scheduler.acquire(
+                limiter_key, max_wait=min(self.rate_limiter.max_wait, remaining)
+            )
+
+            response = await self._fetch(
+                endpoint,
+                limiter_key,
                 url,
-                params=params,
-                headers=self.authenticator.get_headers(),
-                timeout=self.settings.twitter_request_timeout,
+                params,
+                token.headers,
+                min(self.settings.twitter_request_timeout, remaining),
             )
+            self.rate_limiter.update_from_headers(limiter_key, response.headers)
 
-            self._handle_response_errors(response)
+            if response.status_code in (401, 429):
+                reset_time = response.headers.get("x-rate-limit-reset")
+                self.authenticator.quarantine(
+                    token, response.status_code, int(reset_time) if reset_time else None
+                )
+                tried.add(token.name)
+                if any(t.name not in tried for t in self.authenticator.available_tokens()):
+                    continue
 
-            data = response.json()
-            return self._parse_tweets_response(data)
+            self._handle_response_errors(response)
+            return response
 
-        except httpx.HTTPError as e:
-            logger.error(f"Twitter API HTTP error for user_id '{user_id}': {e}")
-            raise TwitterServiceUnavailableError(f"Twitter API request failed: {e}") from e
+    async def _fetch(
+        self,
+        endpoint: str,
+        limiter_key: str,
+        url: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+        timeout: float,
+    ) -> httpx.Response:
+        """Send the GET, hedging it with a second request once it runs past the recent p95"""
+        async def call() -> httpx.Response:
+            start = time.perf_counter()
+            response = await self.http_client.get(
+                url, params=params, headers=headers, timeout=timeout
+            )
+            if response.is_success:
+                self.latency_tracker.record(endpoint, time.perf_counter() - start)
+            return response
+
+        async def may_hedge() -> bool:
+            if self.rate_limiter.headroom(limiter_key) < self.settings.twitter_hedge_min_headroom:
+                return False
+            try:
+                await self.rate_limiter.acquire(limiter_key, max_wait=0)
+            except TwitterRateLimitError:
+                return False
+            return True
+
+        delay = None
+        if self.settings.twitter_hedging_enabled and current_priority() is Priority.INTERACTIVE:
+            delay = self.latency_tracker.percentile(
+                endpoint, self.settings.twitter_hedge_percentile
+            )
+        if delay is None:
+            return await call()
+        return await hedged_call(endpoint, call, delay, may_hedge)
+
+    def _select_token(self, endpoint: str, exclude: set[str]) -> BearerToken:
+        tokens = [
+            token
+            for token in self.authenticator.require_available_tokens()
+            if token.name not in exclude
+        ]
+        return max(tokens, key=lambda t: self.rate_limiter.headroom(f"{endpoint}:{t.name}"))
+
+    async def _parse_tweets_page(self, content: bytes) -> tuple[list[Tweet], str | None]:
+        """Decode and map a page, offloading large bodies to the mapping executor"""
+        if self.mapping_executor is None or len(content) < self.settings.mapping_offload_threshold:
+            return parse_tweets_page(content)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.mapping_executor, parse_tweets_page, content)
 
     def _handle_response_errors(self, response: httpx.Response) -> None:
         if response.is_success:
@@ -191,22 +493,15 @@ class TwitterClient(TweetRepository):
                 reset_time=int(reset_time) if reset_time else None,
             )
         elif status_code >= 500:
-            raise TwitterServiceUnavailableError(f"Twitter API error: {error_message}")
+            raise TwitterServiceUnavailableError(
+                f"Twitter API error: {error_message}",
+                retry_after=self._retry_after(response.headers),
+            )
         else:
             raise TwitterAPIError(f"Twitter API error: {error_message}", status_code)
 
-    def _parse_tweets_response(self, data: dict[str, Any]) -> list[Tweet]:
-        tweets_data = data.get("data", [])
-        includes = data.get("includes", {})
-
-        if not tweets_data:
-            logger.warning("No tweets in response")
-            return []
-
-        tweets: list[Tweet] = []
-        for tweet_data in tweets_data:
-            tweet = map_tweet(tweet_data, includes)
-            if tweet:
-                tweets.append(tweet)
-
-        return tweets
+    def _retry_after(self, headers: Mapping[str, str]) -> float | None:
+        """Seconds the upstream asked us to wait before retrying a 5xx, from Retry-After"""
+        with suppress(KeyError, ValueError):
+            return max(0.0, float(headers["retry-after"]))
+        return None
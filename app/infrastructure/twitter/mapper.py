@@ -1,68 +1,161 @@
-from datetime import datetime
-from typing import Any
+import multiprocessing
+import sys
+from collections.abc import Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
+import msgspec
+
+from app.bootstrap.config import Settings
 from app.core.entities import Account, Tweet
+from app.core.exceptions import TwitterServiceUnavailableError
+from app.infrastructure.twitter.models import (
+    HashtagEntity,
+    TweetData,
+    TweetsResponse,
+    UserData,
+    UserResponse,
+    UsersResponse,
+)
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-def map_tweet(tweet_data: dict[str, Any], includes: dict[str, Any]) -> Tweet | None:
-    try:
-        author_id = tweet_data.get("author_id")
-        user_data = _find_user(author_id, includes)
-
-        if not user_data:
-            logger.warning("User not found: author_id=%s", author_id)
-            return None
-
-        account = Account(
-            fullname=user_data.get("name", "Unknown"),
-            href=f"/{user_data.get('username', 'unknown')}",
-            id=int(user_data.get("id", 0))
-        )
-
-        metrics = tweet_data.get("public_metrics", {})
-        created_at = tweet_data.get("created_at", "")
-
-        return Tweet(
-            account=account,
-            date=_format_date(created_at),
-            hashtags=_extract_hashtags(tweet_data),
-            likes=metrics.get("like_count", 0),
-            replies=metrics.get("reply_count", 0),
-            retweets=metrics.get("retweet_count", 0),
-            text=tweet_data.get("text", "")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_SECOND = timedelta(seconds=1)
+
+_tweets_decoder = msgspec.json.Decoder(TweetsResponse, strict=False)
+_user_decoder = msgspec.json.Decoder(UserResponse, strict=False)
+_users_decoder = msgspec.json.Decoder(UsersResponse, strict=False)
+
+
+def parse_tweets_page(content: bytes) -> tuple[list[Tweet], str | None]:
+    """Decode a search or timeline response body into tweets and its next-page token"""
+    with _decoding():
+        page = _tweets_decoder.decode(content)
+    return map_tweets(page.data, page.includes.users), page.meta.next_token
+
+
+def create_mapping_executor(settings: Settings) -> Executor | None:
+    """
+    Pool for decoding and mapping large pages off the event loop (MAPPING_EXECUTOR).
+    Threads keep the loop responsive but still share the GIL; processes map in
+    parallel at the cost of pickling the body in and the tweets back out.
+    """
+    workers = settings.mapping_executor_workers
+    if settings.mapping_executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mapper")
+    if settings.mapping_executor == "process":
+        return ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
         )
+    return None
 
-    except (ValueError, KeyError, TypeError) as e:
-        logger.error("Tweet mapping error: %s (tweet_id=%s)", str(e), tweet_data.get("id"))
-        return None
 
+def parse_user(content: bytes) -> UserData | None:
+    with _decoding():
+        return _user_decoder.decode(content).data
 
-def _find_user(user_id: str | None, includes: dict[str, Any]) -> dict[str, Any] | None:
-    if not user_id:
-        return None
 
-    users = includes.get("users", [])
-    for user in users:
-        if str(user.get("id")) == str(user_id):
-            return user
-    return None
+def parse_users(content: bytes) -> list[UserData]:
+    with _decoding():
+        return _users_decoder.decode(content).data
 
 
-def _extract_hashtags(tweet_data: dict[str, Any]) -> list[str]:
-    entities = tweet_data.get("entities", {})
-    hashtag_entities = entities.get("hashtags", [])
-    return [f"#{ht.get('tag', '')}" for ht in hashtag_entities if ht.get("tag")]
-
+@contextmanager
+def _decoding() -> Iterator[None]:
+    try:
+        yield
+    except msgspec.DecodeError as e:
+        logger.error("Malformed Twitter API response: %s", e)
+        raise TwitterServiceUnavailableError(f"Malformed Twitter API response: {e}") from e
+
+
+def map_tweets(tweets_data: list[TweetData], users: list[UserData]) -> list[Tweet]:
+    """
+    Map a page of tweets. Authors are indexed by id once per response, and each
+    author's Account is built once and shared by all of their tweets.
+    Tweets whose author is not among the included users are skipped.
+    """
+    accounts = {user.id: _map_account(user) for user in users}
+    tweets: list[Tweet] = []
+    for tweet_data in tweets_data:
+        account = accounts.get(tweet_data.author_id) if tweet_data.author_id else None
+        if account is None:
+            logger.warning("User not found: author_id=%s", tweet_data.author_id)
+            continue
+
+        metrics = tweet_data.public_metrics
+        tweets.append(
+            Tweet(
+                account=account,
+                created_at=_parse_timestamp(tweet_data.created_at),
+                hashtags=_extract_hashtags(tweet_data.entities.hashtags),
+                likes=metrics.like_count,
+                replies=metrics.reply_count,
+                retweets=metrics.retweet_count,
+                text=tweet_data.text,
+                id=tweet_data.id,
+            )
+        )
+    return tweets
+
+
+def _map_account(user: UserData) -> Account:
+    return Account(
+        fullname="Unknown" if user.name is None else user.name,
+        href=f"/{'unknown' if user.username is None else user.username}",
+        id=user.id,
+    )
+
+
+def _extract_hashtags(hashtags: list[HashtagEntity]) -> tuple[str, ...]:
+    return tuple(sys.intern(f"#{hashtag.tag}") for hashtag in hashtags if hashtag.tag)
+
+
+def _parse_timestamp(iso_date: str) -> int | None:
+    """
+    Convert an ISO 8601 timestamp to Unix epoch seconds, or None if it cannot be
+    parsed. Timestamps without an offset are taken as UTC.
+    Twitter's "YYYY-MM-DDTHH:MM:SS.mmmZ" shape skips fromisoformat: it is checked
+    by position and its minute is resolved through a cache.
+    """
+    if (
+        len(iso_date) == 24
+        and iso_date[16] == ":"
+        and iso_date[19] == "."
+        and iso_date[23] == "Z"
+        and iso_date.isascii()
+        and iso_date[17:19].isdigit()
+        and iso_date[17:19] < "60"
+        and iso_date[20:23].isdigit()
+    ):
+        minute = _parse_minute(iso_date[:16])
+        if minute is not None:
+            return minute + int(iso_date[17:19])
 
-def _format_date(iso_date: str) -> str:
     try:
         dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
-        formatted = dt.strftime("%I:%M %p - %-d %b %Y")
-        if formatted[0] == "0":
-            formatted = formatted[1:]
-        return formatted
     except (ValueError, AttributeError):
-        return iso_date
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return (dt - _EPOCH) // _SECOND
+
+
+@lru_cache(maxsize=4096)
+def _parse_minute(minute: str) -> int | None:
+    """Epoch seconds of "YYYY-MM-DDTHH:MM" in UTC, or None if it is not a valid date and time"""
+    if minute[4] != "-" or minute[7] != "-" or minute[10] != "T" or minute[13] != ":":
+        return None
+    fields = (minute[0:4], minute[5:7], minute[8:10], minute[11:13], minute[14:16])
+    if not all(field.isdigit() for field in fields):
+        return None
+    year, month, day, hour, minute_of_hour = map(int, fields)
+    try:
+        dt = datetime(year, month, day, hour, minute_of_hour, tzinfo=UTC)
+    except ValueError:
+        return None
+    return (dt - _EPOCH) // _SECOND
@@ -0,0 +1,64 @@
+"""
+Typed Twitter API v2 payloads, decoded straight from response bytes by msgspec.
+Fields Twitter always sends are required, so a payload without them fails to
+decode as a whole. Optional fields declare the default the mapper relies on.
+Ids arrive as strings and are decoded to int (the decoders are non-strict).
+"""
+import msgspec
+
+
+class PublicMetrics(msgspec.Struct):
+    like_count: int = 0
+    reply_count: int = 0
+    retweet_count: int = 0
+
+
+class HashtagEntity(msgspec.Struct):
+    tag: str = ""
+
+
+class Entities(msgspec.Struct):
+    hashtags: list[HashtagEntity] = []
+
+
+class TweetData(msgspec.Struct):
+    id: int
+    text: str = ""
+    author_id: int | None = None
+    created_at: str = ""
+    public_metrics: PublicMetrics = msgspec.field(default_factory=PublicMetrics)
+    entities: Entities = msgspec.field(default_factory=Entities)
+
+
+class UserData(msgspec.Struct):
+    id: int
+    username: str | None = None
+    name: str | None = None
+
+
+class Includes(msgspec.Struct):
+    users: list[UserData] = []
+
+
+class Meta(msgspec.Struct):
+    next_token: str | None = None
+
+
+class TweetsResponse(msgspec.Struct):
+    """Body of the recent search and user timeline endpoints"""
+
+    data: list[TweetData] = []
+    includes: Includes = msgspec.field(default_factory=Includes)
+    meta: Meta = msgspec.field(default_factory=Meta)
+
+
+class UserResponse(msgspec.Struct):
+    """Body of the single username lookup"""
+
+    data: UserData | None = None
+
+
+class UsersResponse(msgspec.Struct):
+    """Body of the batch username lookup; unknown usernames are reported under errors"""
+
+    data: list[UserData] = []
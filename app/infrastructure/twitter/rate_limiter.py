@@ -1,6 +1,10 @@
 import asyncio
+import math
 import time
-from collections import defaultdict
+from collections import deque
+from collections.abc import Mapping
+from contextlib import suppress
+from dataclasses import dataclass, field
 
 from app.core.exceptions import TwitterRateLimitError
 from app.utils.logger import get_logger
@@ -8,51 +12,242 @@ from app.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class UpstreamWindow:
+    limit: int
+    remaining: int
+    reset_at: int
+    deadline: float
+
+
+@dataclass(slots=True)
+class _KeyState:
+    requests_per_window: int
+    window_seconds: float
+    timestamps: deque[float] = field(default_factory=deque)
+    upstream: UpstreamWindow | None = None
+    waiters: deque[asyncio.Future[None]] = field(default_factory=deque)
+    wakeup: asyncio.TimerHandle | None = None
+
+
+def parse_rate_limit_headers(headers: Mapping[str, str]) -> tuple[int, int, int] | None:
+    """Return (limit, remaining, reset epoch) from x-rate-limit-* headers, if all present"""
+    try:
+        return (
+            int(headers["x-rate-limit-limit"]),
+            int(headers["x-rate-limit-remaining"]),
+            int(headers["x-rate-limit-reset"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _to_epoch(deadline: float) -> int:
+    return int(time.time() + (deadline - time.monotonic()))
+
+
 class RateLimiter:
+    """
+    Sliding-window limiter with independent state per key.
+    Timestamps live in a deque on the monotonic clock, so expiring old requests
+    and checking for a free slot cost O(1) per acquire regardless of window size.
+    None of the bookkeeping awaits, so it needs no lock: keys never contend.
+    """
+
+    # Conservative local limits, used for a key until Twitter reports its real budget.
+    # Keys may be scoped as "<endpoint>:<scope>" (e.g. per bearer token); limits are
+    # looked up by the endpoint part.
     LIMITS = {
         "search_tweets": (12, 60),
         "get_user": (20, 60),
+        "get_users": (20, 60),
         "user_timeline": (100, 60),
     }
 
-    def __init__(self) -> None:
-        self._buckets: dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
+    def __init__(self, max_wait: float = 0.0) -> None:
+        self.max_wait = max_wait
+        self._states: dict[str, _KeyState] = {}
 
     def _get_limits(self, key: str) -> tuple[int, int]:
-        return self.LIMITS.get(key, (100, 60))
+        endpoint, _, _ = key.partition(":")
+        return self.LIMITS.get(endpoint, (100, 60))
+
+    def _state(self, key: str) -> _KeyState:
+        state = self._states.get(key)
+        if state is None:
+            requests_per_window, window_seconds = self._get_limits(key)
+            state = self._states[key] = _KeyState(requests_per_window, window_seconds)
+        return state
+
+    def update_from_headers(self, key: str, headers: Mapping[str, str]) -> None:
+        """
+        Sync the budget for key with Twitter's x-rate-limit-* response headers.
+        Within the same window the lower remaining count wins, since responses to
+        requests sent earlier can arrive after ones sent later.
+        """
+        parsed = parse_rate_limit_headers(headers)
+        if parsed is None:
+            return
+        limit, remaining, reset_at = parsed
 
-    async def acquire(self, key: str = "default") -> None:
-        requests_per_window, window_seconds = self._get_limits(key)
+        state = self._state(key)
+        window = state.upstream
+        if window is not None and window.reset_at == reset_at:
+            window.limit = limit
+            window.remaining = min(window.remaining, remaining)
+        else:
+            deadline = time.monotonic() + (reset_at - time.time())
+            window = state.upstream = UpstreamWindow(limit, remaining, reset_at, deadline)
 
-        async with self._lock:
-            now = time.time()
-            bucket = self._buckets[key]
+        logger.debug(
+            "Upstream rate limit for '%s': %d/%d remaining, resets at %d",
+            key,
+            window.remaining,
+            limit,
+            reset_at
+        )
 
-            cutoff = now - window_seconds
-            self._buckets[key] = [ts for ts in bucket if ts > cutoff]
+    def capacity(self, key: str) -> int:
+        """Size of key's current window: Twitter's reported limit, else the local one"""
+        state = self._state(key)
+        window = state.upstream
+        if window is not None and time.monotonic() < window.deadline:
+            return window.limit
+        return state.requests_per_window
 
-            if len(self._buckets[key]) >= requests_per_window:
-                oldest = min(self._buckets[key])
-                reset_time = int(oldest + window_seconds)
-                wait_time = reset_time - now
+    def headroom(self, key: str) -> int:
+        """Number of requests key could make right now without waiting"""
+        state = self._state(key)
+        now = time.monotonic()
+        window = state.upstream
+        if window is not None and now < window.deadline:
+            available = window.remaining
+        else:
+            timestamps = state.timestamps
+            cutoff = now - state.window_seconds
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+            available = state.requests_per_window - len(timestamps)
+        return max(0, available - len(state.waiters))
 
-                logger.warning(
-                    "Rate limit exceeded for '%s': %d/%d requests. Reset in %.1fs",
-                    key,
-                    len(self._buckets[key]),
-                    requests_per_window,
-                    wait_time
-                )
+    async def acquire(self, key: str = "default", max_wait: float | None = None) -> None:
+        """
+        Take one request slot for key.
+        Callers queue FIFO for up to max_wait seconds (default: the limiter's max_wait)
+        and are woken when a slot frees up. If the queue position cannot be served
+        within max_wait, TwitterRateLimitError is raised immediately instead.
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        state = self._state(key)
+        now = time.monotonic()
+        waiters = state.waiters
+        if not waiters and self._try_acquire(key, state, now) is None:
+            return
 
-                raise TwitterRateLimitError(
-                    f"Rate limit exceeded. Try again in {int(wait_time)} seconds."
-                )
+        ready_at = self._ready_at(state, len(waiters), now)
+        wait_time = ready_at - now
+        if wait_time > max_wait:
+            logger.warning(
+                "Rate limit exceeded for '%s' with %d queued. Reset in %.1fs",
+                key,
+                len(waiters),
+                wait_time
+            )
+            if math.isinf(wait_time):
+                raise TwitterRateLimitError("Rate limit exceeded. Too many queued requests.")
+            raise TwitterRateLimitError(
+                f"Rate limit exceeded. Try again in {int(wait_time)} seconds.",
+                reset_time=self._reset_time(state, ready_at),
+            )
 
-            self._buckets[key].append(now)
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        if state.wakeup is None:
+            self._schedule_wakeup(key, state, self._ready_at(state, 0, now))
+
+        logger.debug("Queued for '%s' at position %d (%.2fs)", key, len(waiters), wait_time)
+        try:
+            await asyncio.wait_for(waiter, timeout=max_wait)
+        except TimeoutError as e:
+            raise TwitterRateLimitError(
+                f"Rate limit exceeded. No slot within {max_wait:.1f} seconds."
+            ) from e
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                with suppress(ValueError):
+                    waiters.remove(waiter)
+
+    async def ping(self) -> None:
+        """Open backend connections early; the in-process limiter holds none"""
+
+    async def close(self) -> None:
+        """Release backend connections; the in-process limiter holds none"""
+
+    def _try_acquire(self, key: str, state: _KeyState, now: float) -> float | None:
+        """Take a slot if one is free, otherwise return the time the next one frees up"""
+        window = state.upstream
+        if window is not None and now < window.deadline:
+            if window.remaining <= 0:
+                return window.deadline
+            window.remaining -= 1
             logger.debug(
-                "Rate limit acquired for '%s': %d/%d requests used",
+                "Rate limit acquired for '%s': %d/%d upstream requests remaining",
                 key,
-                len(self._buckets[key]),
-                requests_per_window
+                window.remaining,
+                window.limit
             )
+            return None
+
+        timestamps = state.timestamps
+        cutoff = now - state.window_seconds
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+
+        if len(timestamps) >= state.requests_per_window:
+            return timestamps[0] + state.window_seconds
+
+        timestamps.append(now)
+        logger.debug(
+            "Rate limit acquired for '%s': %d/%d requests used",
+            key,
+            len(timestamps),
+            state.requests_per_window
+        )
+        return None
+
+    def _ready_at(self, state: _KeyState, position: int, now: float) -> float:
+        """Estimate when the caller at the given queue position will get a slot"""
+        window = state.upstream
+        if window is not None and now < window.deadline and window.remaining <= 0:
+            return window.deadline if position < window.limit else math.inf
+
+        if len(state.timestamps) < state.requests_per_window:
+            return now
+        cycles, index = divmod(position, state.requests_per_window)
+        return state.timestamps[index] + state.window_seconds * (cycles + 1)
+
+    def _reset_time(self, state: _KeyState, ready_at: float) -> int:
+        window = state.upstream
+        if window is not None and ready_at == window.deadline:
+            return window.reset_at
+        return _to_epoch(ready_at)
+
+    def _schedule_wakeup(self, key: str, state: _KeyState, at: float) -> None:
+        loop = asyncio.get_running_loop()
+        state.wakeup = loop.call_later(max(0.0, at - time.monotonic()), self._wake, key)
+
+    def _wake(self, key: str) -> None:
+        state = self._states[key]
+        state.wakeup = None
+        waiters = state.waiters
+        now = time.monotonic()
+
+        while waiters:
+            if waiters[0].done():
+                waiters.popleft()
+                continue
+            ready_at = self._try_acquire(key, state, now)
+            if ready_at is not None:
+                self._schedule_wakeup(key, state, ready_at)
+                return
+            waiters.popleft().set_result(None)
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import uuid
+from collections.abc import Mapping
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.exceptions import TwitterRateLimitError
+from app.infrastructure.twitter.rate_limiter import RateLimiter, parse_rate_limit_headers
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Returns 0 when a slot was taken, otherwise the milliseconds until one frees up.
+# Redis' own clock is used so that replicas with skewed clocks agree on the window.
+ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+
+local reset = tonumber(redis.call('HGET', KEYS[2], 'reset_ms') or '0')
+if reset > now then
+    local remaining = tonumber(redis.call('HGET', KEYS[2], 'remaining'))
+    if remaining <= 0 then
+        return reset - now
+    end
+    redis.call('HINCRBY', KEYS[2], 'remaining', -1)
+    return 0
+end
+
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return 0
+end
+
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return tonumber(oldest[2]) + window - now
+"""
+
+# Within the same upstream window the lower remaining count wins
+UPDATE_SCRIPT = """
+local reset = tonumber(ARGV[3])
+local remaining = tonumber(ARGV[2])
+if tonumber(redis.call('HGET', KEYS[1], 'reset_ms') or '-1') == reset then
+    remaining = math.min(remaining, tonumber(redis.call('HGET', KEYS[1], 'remaining')))
+end
+redis.call('HSET', KEYS[1], 'limit', ARGV[1], 'remaining', remaining, 'reset_ms', reset)
+redis.call('PEXPIREAT', KEYS[1], reset)
+return remaining
+"""
+
+
+class RedisRateLimiter(RateLimiter):
+    """
+    RateLimiter whose windows and upstream budgets live in Redis, shared by every
+    worker and replica. Each acquire is a single atomic script call.
+    While Redis is unreachable it degrades to the in-process limiter it extends,
+    and tries Redis again after fallback_seconds.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        max_wait: float = 0.0,
+        prefix: str = "twitter_api:ratelimit",
+        fallback_seconds: float = 5.0,
+    ) -> None:
+        super().__init__(max_wait=max_wait)
+        self.redis = redis
+        self.prefix = prefix
+        self.fallback_seconds = fallback_seconds
+        self._acquire_script = redis.register_script(ACQUIRE_SCRIPT)
+        self._update_script = redis.register_script(UPDATE_SCRIPT)
+        self._fallback_until = 0.0
+        self._pending_updates: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def from_url(cls, redis_url: str, max_wait: float = 0.0) -> "RedisRateLimiter":
+        redis = Redis.from_url(redis_url, socket_connect_timeout=0.5, socket_timeout=0.5)
+        return cls(redis, max_wait=max_wait)
+
+    def _keys(self, key: str) -> list[str]:
+        return [f"{self.prefix}:{key}:window", f"{self.prefix}:{key}:upstream"]
+
+    def _use_fallback(self, error: Exception) -> None:
+        if time.monotonic() >= self._fallback_until:
+            logger.warning(
+                "Redis rate limiter unavailable (%s), using local limits for %.0fs",
+                error,
+                self.fallback_seconds
+            )
+        self._fallback_until = time.monotonic() + self.fallback_seconds
+
+    def update_from_headers(self, key: str, headers: Mapping[str, str]) -> None:
+        super().update_from_headers(key, headers)
+
+        parsed = parse_rate_limit_headers(headers)
+        if parsed is None or time.monotonic() < self._fallback_until:
+            return
+        limit, remaining, reset_at = parsed
+
+        task = asyncio.get_running_loop().create_task(
+            self._store_upstream(key, limit, remaining, reset_at)
+        )
+        self._pending_updates.add(task)
+        task.add_done_callback(self._pending_updates.discard)
+
+    async def _store_upstream(self, key: str, limit: int, remaining: int, reset_at: int) -> None:
+        try:
+            await self._update_script(
+                keys=self._keys(key)[1:], args=[limit, remaining, reset_at * 1000]
+            )
+        except (RedisError, OSError) as e:
+            self._use_fallback(e)
+
+    async def acquire(self, key: str = "default", max_wait: float | None = None) -> None:
+        """
+        Take one request slot for key from the shared Redis window.
+        Waiting callers poll Redis when their slot is due; unlike the local
+        limiter, ordering between workers is not FIFO.
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+        if time.monotonic() < self._fallback_until:
+            return await super().acquire(key, max_wait)
+
+        requests_per_window, window_seconds = self._get_limits(key)
+        deadline = time.monotonic() + max_wait
+        member = uuid.uuid4().hex
+
+        while True:
+            try:
+                wait_ms = await self._acquire_script(
+                    keys=self._keys(key),
+                    args=[int(window_seconds * 1000), requests_per_window, member],
+                )
+            except (RedisError, OSError) as e:
+                self._use_fallback(e)
+                return await super().acquire(key, max(0.0, deadline - time.monotonic()))
+
+            if wait_ms <= 0:
+                return
+
+            wait_time = wait_ms / 1000
+            if time.monotonic() + wait_time > deadline:
+                logger.warning(
+                    "Shared rate limit exceeded for '%s'. Reset in %.1fs", key, wait_time
+                )
+                raise TwitterRateLimitError(
+                    f"Rate limit exceeded. Try again in {int(wait_time)} seconds.",
+                    reset_time=int(time.time() + wait_time),
+                )
+            await asyncio.sleep(wait_time)
+
+    async def ping(self) -> None:
+        await self.redis.ping()  # type: ignore[misc]
+
+    async def close(self) -> None:
+        await self.redis.aclose()
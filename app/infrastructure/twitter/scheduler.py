@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+from app.bootstrap.config import Settings
+from app.core.context import Priority, current_priority, remaining_time
+from app.core.exceptions import TwitterRateLimitError
+from app.infrastructure.twitter.rate_limiter import RateLimiter
+from app.utils.logger import get_logger
+from app.utils.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class UpstreamScheduler:
+    """
+    Hands out RateLimiter slots by priority class (see app.core.context.Priority).
+    Interactive calls take slots as before. Background and bulk calls only take
+    one while the key's headroom stays above their reserve, a fraction of its
+    window kept for interactive traffic. Otherwise they are deferred, polling
+    for headroom, and dropped with TwitterRateLimitError after max_defer seconds.
+    """
+
+    POLL_INTERVAL = 0.1
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        background_reserve: float = 0.2,
+        bulk_reserve: float = 0.5,
+        max_defer: float = 5.0,
+    ) -> None:
+        self.rate_limiter = rate_limiter
+        self.reserves = {
+            Priority.INTERACTIVE: 0.0,
+            Priority.BACKGROUND: background_reserve,
+            Priority.BULK: bulk_reserve,
+        }
+        self.max_defer = max_defer
+
+    @classmethod
+    def from_settings(cls, rate_limiter: RateLimiter, settings: Settings) -> "UpstreamScheduler":
+        return cls(
+            rate_limiter,
+            background_reserve=settings.scheduler_background_reserve,
+            bulk_reserve=settings.scheduler_bulk_reserve,
+            max_defer=settings.scheduler_max_defer,
+        )
+
+    async def acquire(self, key: str, max_wait: float | None = None) -> None:
+        level = current_priority()
+        if level is Priority.INTERACTIVE:
+            await self.rate_limiter.acquire(key, max_wait)
+            return
+
+        reserve = self.reserves[level] * self.rate_limiter.capacity(key)
+        max_defer = self.max_defer
+        remaining = remaining_time()
+        if remaining is not None:
+            max_defer = min(max_defer, remaining)
+        deadline = time.monotonic() + max_defer
+
+        deferred = False
+        while self.rate_limiter.headroom(key) <= reserve:
+            if time.monotonic() + self.POLL_INTERVAL > deadline:
+                metrics.increment("upstream_dropped", endpoint=key, priority=level.name.lower())
+                logger.warning(
+                    "Dropping %s call for '%s': headroom at or below reserve of %.0f",
+                    level.name.lower(),
+                    key,
+                    reserve
+                )
+                raise TwitterRateLimitError(
+                    f"Upstream budget reserved for interactive requests ({level.name.lower()})"
+                )
+            if not deferred:
+                deferred = True
+                metrics.increment("upstream_deferred", endpoint=key, priority=level.name.lower())
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+        await self.rate_limiter.acquire(key, max_wait=0)
@@ -0,0 +1,41 @@
+import base64
+import binascii
+
+from fastapi import HTTPException, Response
+
+from app.core.entities import Tweet
+
+CURSOR_HEADER = "X-Next-Cursor"
+_CURSOR_PREFIX = "v1:"
+
+
+def encode_cursor(tweet_id: int) -> str:
+    raw = f"{_CURSOR_PREFIX}{tweet_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        if not raw.startswith(_CURSOR_PREFIX):
+            raise ValueError(raw)
+        return int(raw.removeprefix(_CURSOR_PREFIX))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail="Invalid cursor") from e
+
+
+def resolve_since_id(since_id: int | None, cursor: str | None) -> int | None:
+    if cursor is not None:
+        return decode_cursor(cursor)
+    return since_id
+
+
+def set_next_cursor(response: Response, tweets: list[Tweet], since_id: int | None) -> None:
+    """
+    Point the client at the newest tweet it has seen.
+    With nothing new, the cursor it sent is handed back unchanged.
+    """
+    newest_id = max((tweet.id for tweet in tweets), default=since_id or 0)
+    if newest_id:
+        response.headers[CURSOR_HEADER] = encode_cursor(newest_id)
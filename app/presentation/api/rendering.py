@@ -0,0 +1,51 @@
+from typing import Any
+
+import msgspec
+from fastapi import Response
+
+from app.core.entities import Tweet
+from app.presentation.schemas.tweet import format_tweet_date
+
+JSON_MEDIA_TYPE = "application/json"
+
+_encoder = msgspec.json.Encoder()
+
+
+def tweet_to_dict(tweet: Tweet) -> dict[str, Any]:
+    """The TweetSchema shape of tweet, with keys in the schema's field order"""
+    account = tweet.account
+    return {
+        "account": {"fullname": account.fullname, "href": account.href, "id": account.id},
+        "date": format_tweet_date(tweet.created_at),
+        "hashtags": tweet.hashtags,
+        "likes": tweet.likes,
+        "replies": tweet.replies,
+        "retweets": tweet.retweets,
+        "text": tweet.text,
+    }
+
+
+def encode_tweet(tweet: Tweet) -> bytes:
+    return _encoder.encode(tweet_to_dict(tweet))
+
+
+def tweets_response(tweets: list[Tweet]) -> Response:
+    """
+    Encode tweets straight to the bytes FastAPI would send for list[TweetSchema],
+    skipping the schema models and the response_model validation pass.
+    Routes keep response_model for the OpenAPI schema.
+    """
+    return Response(
+        content=_encoder.encode([tweet_to_dict(tweet) for tweet in tweets]),
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+def grouped_tweets_response(groups: dict[str, list[Tweet]]) -> Response:
+    """Like tweets_response, for dict[str, list[TweetSchema]]"""
+    return Response(
+        content=_encoder.encode(
+            {key: [tweet_to_dict(tweet) for tweet in tweets] for key, tweets in groups.items()}
+        ),
+        media_type=JSON_MEDIA_TYPE,
+    )
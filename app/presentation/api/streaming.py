@@ -0,0 +1,41 @@
+from collections.abc import AsyncIterator
+from contextlib import suppress
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+from app.core.entities import Tweet
+from app.presentation.api.rendering import encode_tweet
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+NDJSON_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "One JSON-encoded tweet per line, sent as upstream pages arrive",
+        "content": {NDJSON_MEDIA_TYPE: {}},
+    }
+}
+
+
+def _encode(tweet: Tweet) -> bytes:
+    return encode_tweet(tweet) + b"\n"
+
+
+async def ndjson_response(tweets: AsyncIterator[Tweet]) -> StreamingResponse:
+    """
+    Stream tweets as newline-delimited JSON.
+    The first tweet is awaited before the response starts, so errors on the first
+    upstream page still produce a regular error response with the right status code.
+    """
+    first: Tweet | None = None
+    with suppress(StopAsyncIteration):
+        first = await anext(tweets)
+
+    async def body() -> AsyncIterator[bytes]:
+        if first is None:
+            return
+        yield _encode(first)
+        async for tweet in tweets:
+            yield _encode(tweet)
+
+    return StreamingResponse(body(), media_type=NDJSON_MEDIA_TYPE)
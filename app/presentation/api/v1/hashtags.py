@@ -1,9 +1,13 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import StreamingResponse
 
-from app.application.services import TweetService
+from app.application.services import MAX_STREAM_LIMIT, TweetService
+from app.presentation.api.cursors import CURSOR_HEADER, resolve_since_id, set_next_cursor
 from app.presentation.api.dependencies import get_tweet_service
+from app.presentation.api.rendering import tweets_response
+from app.presentation.api.streaming import NDJSON_RESPONSES, ndjson_response
 from app.presentation.schemas.tweet import TweetSchema
 
 router = APIRouter(prefix="/hashtags", tags=["hashtags"])
@@ -13,9 +17,25 @@ router = APIRouter(prefix="/hashtags", tags=["hashtags"])
 async def get_tweets_by_hashtag(
     hashtag: Annotated[str, Path(min_length=1, max_length=100)],
     limit: Annotated[int, Query(ge=1, le=100)] = 30,
+    since_id: Annotated[
+        int | None, Query(ge=1, description="Only return tweets newer than this tweet id")
+    ] = None,
+    cursor: Annotated[
+        str | None, Query(description=f"Value of a previous {CURSOR_HEADER} response header")
+    ] = None,
     tweet_service: TweetService = Depends(get_tweet_service),
-) -> list[TweetSchema]:
-    tweets = await tweet_service.get_tweets_by_hashtag(hashtag, limit)
-    return [TweetSchema.from_entity(tweet) for tweet in tweets]
+) -> Response:
+    since_id = resolve_since_id(since_id, cursor)
+    tweets = await tweet_service.get_tweets_by_hashtag(hashtag, limit, since_id=since_id)
+    response = tweets_response(tweets)
+    set_next_cursor(response, tweets, since_id)
+    return response
 
 
+@router.get("/{hashtag}/stream", response_class=StreamingResponse, responses=NDJSON_RESPONSES)
+async def stream_tweets_by_hashtag(
+    hashtag: Annotated[str, Path(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=MAX_STREAM_LIMIT)] = 30,
+    tweet_service: TweetService = Depends(get_tweet_service),
+) -> StreamingResponse:
+    return await ndjson_response(tweet_service.stream_tweets_by_hashtag(hashtag, limit))
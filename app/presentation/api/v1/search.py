@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from app.application.services import TweetService
+from app.presentation.api.dependencies import get_tweet_service
+from app.presentation.api.rendering import grouped_tweets_response
+from app.presentation.schemas.tweet import TweetSchema
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+MAX_HASHTAGS = 20
+MAX_HASHTAG_LENGTH = 100  # as for /hashtags/{hashtag}; always fits one search query
+HASHTAG_PATTERN = rf"#?[^,#\s]{{1,{MAX_HASHTAG_LENGTH}}}"
+HASHTAGS_PATTERN = rf"^{HASHTAG_PATTERN}(,{HASHTAG_PATTERN}){{0,{MAX_HASHTAGS - 1}}}$"
+
+
+@router.get("/hashtags", response_model=dict[str, list[TweetSchema]])
+async def get_tweets_by_hashtags(
+    tags: Annotated[
+        str,
+        Query(
+            max_length=MAX_HASHTAGS * (MAX_HASHTAG_LENGTH + 2),
+            pattern=HASHTAGS_PATTERN,
+            description=f"Comma-separated list of up to {MAX_HASHTAGS} hashtags",
+        ),
+    ],
+    limit: Annotated[int, Query(ge=1, le=100)] = 30,
+    tweet_service: TweetService = Depends(get_tweet_service),
+) -> Response:
+    results = await tweet_service.get_tweets_by_hashtags(tags.split(","), limit)
+    return grouped_tweets_response(results)
+
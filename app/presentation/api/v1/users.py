@@ -1,21 +1,60 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Response
+from fastapi.responses import StreamingResponse
 
-from app.application.services import TweetService
+from app.application.services import MAX_STREAM_LIMIT, TweetService
+from app.presentation.api.cursors import CURSOR_HEADER, resolve_since_id, set_next_cursor
 from app.presentation.api.dependencies import get_tweet_service
+from app.presentation.api.rendering import tweets_response
+from app.presentation.api.streaming import NDJSON_RESPONSES, ndjson_response
 from app.presentation.schemas.tweet import TweetSchema
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+MAX_USERNAMES = 50
+USERNAMES_PATTERN = rf"^@?[A-Za-z0-9_]{{4,15}}(,@?[A-Za-z0-9_]{{4,15}}){{0,{MAX_USERNAMES - 1}}}$"
+
+
+@router.get("", response_model=list[TweetSchema])
+async def get_tweets_by_users(
+    usernames: Annotated[
+        str,
+        Query(
+            pattern=USERNAMES_PATTERN,
+            description=f"Comma-separated list of up to {MAX_USERNAMES} usernames",
+        ),
+    ],
+    limit: Annotated[int, Query(ge=1, le=100)] = 30,
+    tweet_service: TweetService = Depends(get_tweet_service),
+) -> Response:
+    tweets = await tweet_service.get_tweets_by_users(usernames.split(","), limit)
+    return tweets_response(tweets)
+
 
 @router.get("/{username}", response_model=list[TweetSchema])
 async def get_tweets_by_user(
     username: Annotated[str, Path(min_length=4, max_length=15)],
     limit: Annotated[int, Query(ge=1, le=100)] = 30,
+    since_id: Annotated[
+        int | None, Query(ge=1, description="Only return tweets newer than this tweet id")
+    ] = None,
+    cursor: Annotated[
+        str | None, Query(description=f"Value of a previous {CURSOR_HEADER} response header")
+    ] = None,
     tweet_service: TweetService = Depends(get_tweet_service),
-) -> list[TweetSchema]:
-    tweets = await tweet_service.get_tweets_by_user(username, limit)
-    return [TweetSchema.from_entity(tweet) for tweet in tweets]
+) -> Response:
+    since_id = resolve_since_id(since_id, cursor)
+    tweets = await tweet_service.get_tweets_by_user(username, limit, since_id=since_id)
+    response = tweets_response(tweets)
+    set_next_cursor(response, tweets, since_id)
+    return response
 
 
+@router.get("/{username}/stream", response_class=StreamingResponse, responses=NDJSON_RESPONSES)
+async def stream_tweets_by_user(
+    username: Annotated[str, Path(min_length=4, max_length=15)],
+    limit: Annotated[int, Query(ge=1, le=MAX_STREAM_LIMIT)] = 30,
+    tweet_service: TweetService = Depends(get_tweet_service),
+) -> StreamingResponse:
+    return await ndjson_response(tweet_service.stream_tweets_by_user(username, limit))
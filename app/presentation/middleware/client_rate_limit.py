@@ -0,0 +1,94 @@
+import math
+from collections.abc import Collection
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.ratelimit.token_bucket import BucketResult, TokenBucketStore
+from app.presentation.schemas.common import ErrorResponse
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+API_KEY_HEADER = "X-API-Key"
+RATE_LIMIT_HEADERS = ["RateLimit-Limit", "RateLimit-Remaining", "RateLimit-Reset"]
+
+
+def rate_limit_headers(result: BucketResult) -> dict[str, str]:
+    return {
+        "RateLimit-Limit": str(result.limit),
+        "RateLimit-Remaining": str(result.remaining),
+        "RateLimit-Reset": str(math.ceil(result.reset_after)),
+    }
+
+
+class ClientRateLimitMiddleware:
+    """
+    Pure ASGI middleware enforcing a token bucket per API consumer, keyed by the
+    X-API-Key header when it is one of api_keys, or else the client IP. Unknown
+    keys are not trusted, so sending a fresh one per request can't dodge the limit.
+    It runs before routing, so rejected requests cost one bucket lookup.
+    Only paths under path_prefix are limited, and CORS preflights never are.
+    Without an explicit store, buckets live in the app container's
+    client_rate_limit_store, which the lifespan builds and closes.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: TokenBucketStore | None = None,
+        api_keys: Collection[str] = (),
+        path_prefix: str = "/api/",
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.api_keys = frozenset(api_keys)
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not scope["path"].startswith(self.path_prefix)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        store = self.store
+        if store is None:
+            store = scope["app"].state.container.client_rate_limit_store
+        result = await store.take(self._client_key(scope))
+        headers = rate_limit_headers(result)
+
+        if not result.allowed:
+            retry_after = str(math.ceil(result.retry_after))
+            logger.warning(
+                "client_rate_limited: path=%s, retry_after=%ss", scope["path"], retry_after
+            )
+            error_response = ErrorResponse(
+                error="ClientRateLimitExceeded",
+                status_code=429,
+                detail=f"Too many requests. Try again in {retry_after} seconds.",
+            )
+            response = JSONResponse(
+                status_code=429,
+                content=error_response.model_dump(),
+                headers={**headers, "Retry-After": retry_after},
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(headers)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _client_key(self, scope: Scope) -> str:
+        api_key = Headers(scope=scope).get(API_KEY_HEADER)
+        if api_key in self.api_keys:
+            return f"key:{api_key}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
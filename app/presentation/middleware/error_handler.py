@@ -1,3 +1,5 @@
+import math
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
@@ -10,10 +12,10 @@ logger = get_logger(__name__)
 
 async def twitter_api_error_handler(request: Request, exc: TwitterAPIError) -> JSONResponse:
     logger.error(
-        "twitter_api_error",
-        path=request.url.path,
-        error=exc.message,
-        status_code=exc.status_code,
+        "twitter_api_error: path=%s, error=%s, status_code=%d",
+        request.url.path,
+        exc.message,
+        exc.status_code,
     )
 
     error_response = ErrorResponse(
@@ -22,18 +24,24 @@ async def twitter_api_error_handler(request: Request, exc: TwitterAPIError) -> J
         detail=exc.message,
     )
 
+    headers = None
+    retry_after = getattr(exc, "retry_after", None)
+    if retry_after is not None:
+        headers = {"Retry-After": str(math.ceil(retry_after))}
+
     return JSONResponse(
         status_code=exc.status_code,
         content=error_response.model_dump(),
+        headers=headers,
     )
 
 
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     logger.exception(
-        "unhandled_exception",
-        path=request.url.path,
-        error=str(exc),
-        exc_type=type(exc).__name__,
+        "unhandled_exception: path=%s, error=%s, exc_type=%s",
+        request.url.path,
+        str(exc),
+        type(exc).__name__,
     )
 
     error_response = ErrorResponse(
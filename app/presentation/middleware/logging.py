@@ -14,22 +14,22 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         start_time = time.perf_counter()
 
         logger.info(
-            "request_started",
-            method=request.method,
-            path=request.url.path,
-            query_params=dict(request.query_params),
-            client_host=request.client.host if request.client else None,
+            "request_started: method=%s, path=%s, query_params=%s, client_host=%s",
+            request.method,
+            request.url.path,
+            dict(request.query_params),
+            request.client.host if request.client else None,
         )
 
         response = await call_next(request)
         duration_ms = round((time.perf_counter() - start_time) * 1000, 2)
 
         logger.info(
-            "request_completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=duration_ms,
+            "request_completed: method=%s, path=%s, status_code=%d, duration_ms=%.2f",
+            request.method,
+            request.url.path,
+            response.status_code,
+            duration_ms,
         )
 
         return response
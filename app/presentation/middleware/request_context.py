@@ -0,0 +1,89 @@
+import asyncio
+
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.context import begin_request
+from app.core.exceptions import DeadlineExceededError
+from app.presentation.schemas.common import ErrorResponse
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEGRADED_HEADER = "X-Degraded"
+TIMEOUT_HEADER = "X-Request-Timeout"
+MAX_REQUEST_TIMEOUT = 300.0
+
+
+class RequestContextMiddleware:
+    """
+    Pure ASGI middleware that opens a RequestState for each HTTP request and
+    turns what it collected into response headers before they are sent.
+    A request with a deadline (X-Request-Timeout seconds, else default_timeout)
+    is cancelled when it passes: 504 if nothing was sent yet, otherwise the
+    response is aborted so the client sees an incomplete transfer.
+    """
+
+    def __init__(self, app: ASGIApp, default_timeout: float = 0.0) -> None:
+        self.app = app
+        self.default_timeout = default_timeout
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self._timeout(Headers(scope=scope))
+        state = begin_request(timeout)
+        started = False
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+                if state.degraded:
+                    headers = MutableHeaders(scope=message)
+                    headers[DEGRADED_HEADER] = "stale-cache"
+            await send(message)
+
+        if not timeout:
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        try:
+            async with asyncio.timeout(timeout) as scope_timeout:
+                await self.app(scope, receive, send_with_headers)
+        except TimeoutError:
+            if not scope_timeout.expired():
+                raise
+            logger.warning(
+                "request_deadline_exceeded: path=%s, timeout=%.2fs, response_started=%s",
+                scope["path"],
+                timeout,
+                started,
+            )
+            if started:
+                # Ending the body cleanly would pass a truncated stream off as complete
+                raise DeadlineExceededError(
+                    f"Response did not complete within {timeout:g} seconds"
+                ) from None
+
+            error_response = ErrorResponse(
+                error="DeadlineExceededError",
+                status_code=504,
+                detail=f"Request did not complete within {timeout:g} seconds",
+            )
+            response = JSONResponse(status_code=504, content=error_response.model_dump())
+            await response(scope, receive, send)
+
+    def _timeout(self, headers: Headers) -> float:
+        value = headers.get(TIMEOUT_HEADER)
+        if value is not None:
+            try:
+                timeout = float(value)
+            except ValueError:
+                timeout = 0.0
+            if timeout > 0:
+                return min(timeout, MAX_REQUEST_TIMEOUT)
+        return self.default_timeout
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, Field
@@ -7,6 +9,31 @@ from pydantic import BaseModel, Field
 if TYPE_CHECKING:
     from app.core.entities import Tweet
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def format_tweet_date(created_at: int | None) -> str:
+    """Render epoch seconds as "12:57 PM - 7 Mar 2018" (UTC), or "" if unknown"""
+    if created_at is None:
+        return ""
+    return _format_minute(created_at // 60)
+
+
+@lru_cache(maxsize=4096)
+def _format_minute(minute: int) -> str:
+    # Same output as strftime("%I:%M %p - %-d %b %Y") in the C locale, without the
+    # glibc-only %-d or a dependency on the process locale.
+    try:
+        dt = _EPOCH + timedelta(minutes=minute)
+    except OverflowError:
+        return ""
+    period = "AM" if dt.hour < 12 else "PM"
+    return (
+        f"{dt.hour % 12 or 12}:{dt.minute:02d} {period} - "
+        f"{dt.day} {_MONTHS[dt.month - 1]} {dt.year}"
+    )
+
 
 class AccountSchema(BaseModel):
     fullname: str
@@ -31,8 +58,8 @@ class TweetSchema(BaseModel):
                 href=tweet.account.href,
                 id=tweet.account.id,
             ),
-            date=tweet.date,
-            hashtags=tweet.hashtags,
+            date=format_tweet_date(tweet.created_at),
+            hashtags=list(tweet.hashtags),
             likes=tweet.likes,
             replies=tweet.replies,
             retweets=tweet.retweets,
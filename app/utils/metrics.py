@@ -0,0 +1,31 @@
+from collections import Counter
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+class Metrics:
+    """
+    In-process counters keyed by name and labels.
+    Cheap enough to bump on hot paths; snapshot() is what gets exported.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Counter[tuple[str, LabelSet]] = Counter()
+
+    def increment(self, name: str, value: int = 1, **labels: str) -> None:
+        self._counters[(name, tuple(sorted(labels.items())))] += value
+
+    def get(self, name: str, **labels: str) -> int:
+        return self._counters[(name, tuple(sorted(labels.items())))]
+
+    def snapshot(self) -> dict[str, int]:
+        return {
+            name + "".join(f",{k}={v}" for k, v in labels): count
+            for (name, labels), count in sorted(self._counters.items())
+        }
+
+    def reset(self) -> None:
+        self._counters.clear()
+
+
+metrics = Metrics()
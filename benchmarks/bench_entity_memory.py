@@ -0,0 +1,98 @@
+"""
+Memory held by 100k tweets: slotted entities with epoch timestamps and interned hashtag
+tuples versus the previous dict-backed dataclasses with display strings and lists.
+
+Run with: python -m benchmarks.bench_entity_memory
+"""
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.entities import Account, Tweet
+from app.presentation.schemas.tweet import format_tweet_date
+
+TWEETS = 100_000
+AUTHORS = 1_000
+TAGS = ("python", "asyncio", "fastapi", "redis", "coding")
+
+
+@dataclass(frozen=True)
+class LegacyAccount:
+    fullname: str
+    href: str
+    id: int
+
+
+@dataclass(frozen=True)
+class LegacyTweet:
+    account: LegacyAccount
+    date: str
+    hashtags: list[str]
+    likes: int
+    replies: int
+    retweets: int
+    text: str
+    id: int = 0
+
+
+def make_tweet(index: int, account: Account) -> Tweet:
+    created_at = 1_700_000_000 + index * 37
+    return Tweet(
+        account=account,
+        created_at=created_at,
+        hashtags=tuple(sys.intern(f"#{tag}") for tag in TAGS[: index % 3 + 1]),
+        likes=index % 500,
+        replies=index % 50,
+        retweets=index % 100,
+        text=f"tweet number {index}",
+        id=1_790_000_000_000_000_000 + index,
+    )
+
+
+def make_legacy_tweet(index: int, account: LegacyAccount) -> LegacyTweet:
+    created_at = 1_700_000_000 + index * 37
+    return LegacyTweet(
+        account=account,
+        date=format_tweet_date(created_at),
+        hashtags=[f"#{tag}" for tag in TAGS[: index % 3 + 1]],
+        likes=index % 500,
+        replies=index % 50,
+        retweets=index % 100,
+        text=f"tweet number {index}",
+        id=1_790_000_000_000_000_000 + index,
+    )
+
+
+def measure(build: Callable[[], list[Any]]) -> int:
+    tracemalloc.start()
+    tweets = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tweets
+    return size
+
+
+def build_current() -> list[Tweet]:
+    accounts = [Account(f"User {i}", f"/user{i}", i) for i in range(AUTHORS)]
+    return [make_tweet(i, accounts[i % AUTHORS]) for i in range(TWEETS)]
+
+
+def build_legacy() -> list[LegacyTweet]:
+    accounts = [LegacyAccount(f"User {i}", f"/user{i}", i) for i in range(AUTHORS)]
+    return [make_legacy_tweet(i, accounts[i % AUTHORS]) for i in range(TWEETS)]
+
+
+def main() -> None:
+    format_tweet_date(1_700_000_000)
+    current = measure(build_current)
+    legacy = measure(build_legacy)
+    print(f"Memory for {TWEETS:,} tweets by {AUTHORS:,} authors")
+    print(f"{'slotted':>10} {current / 2**20:>8.1f} MiB ({current / TWEETS:.0f} B/tweet)")
+    print(f"{'legacy':>10} {legacy / 2**20:>8.1f} MiB ({legacy / TWEETS:.0f} B/tweet)")
+    print(f"{'saved':>10} {(legacy - current) / 2**20:>8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
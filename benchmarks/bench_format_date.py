@@ -0,0 +1,70 @@
+"""
+Cost of turning an upstream timestamp into its display string: the minute-cached
+parse (mapper) and render (presentation) versus fromisoformat + strftime.
+
+Run with: python -m benchmarks.bench_format_date
+"""
+import random
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+from app.infrastructure.twitter.mapper import _parse_minute, _parse_timestamp
+from app.presentation.schemas.tweet import _format_minute, format_tweet_date
+
+CALLS = 100_000
+
+
+def strftime_format_date(iso_date: str) -> str:
+    """The previous implementation"""
+    try:
+        dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
+        formatted = dt.strftime("%I:%M %p - %-d %b %Y")
+        if formatted[0] == "0":
+            formatted = formatted[1:]
+        return formatted
+    except (ValueError, AttributeError):
+        return iso_date
+
+
+def format_date(iso_date: str) -> str:
+    return format_tweet_date(_parse_timestamp(iso_date))
+
+
+def make_dates(minutes: int) -> list[str]:
+    """Twitter-shaped timestamps spread over the given number of distinct minutes"""
+    rng = random.Random(0)
+    dates = []
+    for _ in range(CALLS):
+        m = rng.randrange(minutes)
+        seconds = f"{rng.randrange(60):02d}.{rng.randrange(1000):03d}"
+        dates.append(f"2024-03-07T{m // 60 % 24:02d}:{m % 60:02d}:{seconds}Z")
+    return dates
+
+
+def measure(format_date: Callable[[str], str], dates: list[str]) -> float:
+    start = time.perf_counter()
+    for iso_date in dates:
+        format_date(iso_date)
+    return (time.perf_counter() - start) / len(dates)
+
+
+def main() -> None:
+    print("Formatting Twitter timestamps (cost per call)")
+    print(f"{'minutes':>8} {'fast':>10} {'strftime':>10}")
+    for minutes in (1, 60, 1440):
+        dates = make_dates(minutes)
+        _parse_minute.cache_clear()
+        _format_minute.cache_clear()
+        fast_cost = measure(format_date, dates)
+        slow_cost = measure(strftime_format_date, dates)
+        print(f"{minutes:>8} {fast_cost * 1e9:>8.0f}ns {slow_cost * 1e9:>8.0f}ns")
+
+    dates = [date.replace("Z", "+00:00") for date in make_dates(1440)]
+    print("\nOffset timestamps (fromisoformat path)")
+    print(f"{'':>8} {measure(format_date, dates) * 1e9:>8.0f}ns "
+          f"{measure(strftime_format_date, dates) * 1e9:>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
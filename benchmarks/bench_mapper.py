@@ -0,0 +1,107 @@
+"""
+Decode and map throughput for upstream tweet pages: msgspec typed decoding with the
+indexed mapper versus response.json() with the previous dict-walking per-tweet path.
+
+Run with: python -m benchmarks.bench_mapper
+"""
+import json
+import time
+from collections.abc import Callable
+from typing import Any
+
+from app.core.entities import Account, Tweet
+from app.infrastructure.twitter.mapper import _parse_timestamp, parse_tweets_page
+
+PAGE_SIZES = (10, 100, 500)
+ROUNDS = 200
+
+
+def find_user(user_id: str | None, includes: dict[str, Any]) -> dict[str, Any] | None:
+    """The previous lookup: a linear scan with str() on both sides per tweet"""
+    if not user_id:
+        return None
+    for user in includes.get("users", []):
+        if str(user.get("id")) == str(user_id):
+            return user
+    return None
+
+
+def dict_parse_tweets_page(content: bytes) -> tuple[list[Tweet], str | None]:
+    """The previous path: json.loads, then one scan and one Account per tweet"""
+    data = json.loads(content)
+    includes = data.get("includes", {})
+    tweets: list[Tweet] = []
+    for tweet_data in data.get("data", []):
+        user_data = find_user(tweet_data.get("author_id"), includes)
+        if not user_data:
+            continue
+        metrics = tweet_data.get("public_metrics", {})
+        hashtags = tweet_data.get("entities", {}).get("hashtags", [])
+        tweets.append(
+            Tweet(
+                account=Account(
+                    fullname=user_data.get("name", "Unknown"),
+                    href=f"/{user_data.get('username', 'unknown')}",
+                    id=int(user_data.get("id", 0)),
+                ),
+                created_at=_parse_timestamp(tweet_data.get("created_at", "")),
+                hashtags=tuple(f"#{ht['tag']}" for ht in hashtags if ht.get("tag")),
+                likes=metrics.get("like_count", 0),
+                replies=metrics.get("reply_count", 0),
+                retweets=metrics.get("retweet_count", 0),
+                text=tweet_data.get("text", ""),
+                id=int(tweet_data.get("id", 0)),
+            )
+        )
+    meta = data.get("meta") or {}
+    return tweets, meta.get("next_token")
+
+
+def make_page(size: int, authors: int) -> bytes:
+    users = [
+        {"id": str(1000 + i), "username": f"user{i}", "name": f"User {i}"} for i in range(authors)
+    ]
+    tweets_data = [
+        {
+            "id": str(1_790_000_000_000_000_000 + i),
+            "author_id": str(1000 + i % authors),
+            "text": f"tweet {i} about #python and #asyncio, with some more text to carry",
+            "created_at": f"2024-03-07T12:{i % 60:02d}:00.000Z",
+            "public_metrics": {"like_count": i, "reply_count": 1, "retweet_count": 2},
+            "entities": {"hashtags": [{"tag": "python"}, {"tag": "asyncio"}]},
+        }
+        for i in range(size)
+    ]
+    body = {
+        "data": tweets_data,
+        "includes": {"users": users},
+        "meta": {"result_count": size, "next_token": "next"},
+    }
+    return json.dumps(body).encode()
+
+
+def measure(parse: Callable[[bytes], Any], content: bytes) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        parse(content)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main() -> None:
+    print("Decoding and mapping one page (cost per page, tweets per second)")
+    print(f"{'tweets':>8} {'authors':>8} {'msgspec':>22} {'json + dicts':>22}")
+    for size in PAGE_SIZES:
+        for authors in (1, size):
+            content = make_page(size, authors)
+            assert parse_tweets_page(content) == dict_parse_tweets_page(content)
+            fast = measure(parse_tweets_page, content)
+            slow = measure(dict_parse_tweets_page, content)
+            print(
+                f"{size:>8} {authors:>8} "
+                f"{fast * 1e6:>8.1f}us {size / fast:>10,.0f}/s "
+                f"{slow * 1e6:>8.1f}us {size / slow:>10,.0f}/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Cost per RateLimiter.acquire as the window fills up and under concurrency.
+
+Run with: python -m benchmarks.bench_rate_limiter
+"""
+import asyncio
+import time
+
+from app.infrastructure.twitter.rate_limiter import RateLimiter
+
+WINDOW_SIZES = (10, 100, 1_000, 10_000)
+CONCURRENCY = (1, 100, 1_000)
+
+
+class ListRateLimiter:
+    """The previous implementation: a global lock and a list rebuilt on every acquire"""
+
+    def __init__(self, requests_per_window: int, window_seconds: float) -> None:
+        self.requests_per_window = requests_per_window
+        self.window_seconds = window_seconds
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, key: str) -> None:
+        async with self._lock:
+            now = time.time()
+            cutoff = now - self.window_seconds
+            bucket = [ts for ts in self._buckets.get(key, []) if ts > cutoff]
+            if len(bucket) >= self.requests_per_window:
+                min(bucket)
+                raise RuntimeError("rate limited")
+            bucket.append(now)
+            self._buckets[key] = bucket
+
+
+def make_limiter(requests_per_window: int) -> RateLimiter:
+    limiter = RateLimiter()
+    limiter.LIMITS = {"bench": (requests_per_window, 3600)}
+    return limiter
+
+
+async def fill_window(limiter: RateLimiter | ListRateLimiter, size: int) -> float:
+    start = time.perf_counter()
+    for _ in range(size):
+        await limiter.acquire("bench")
+    return (time.perf_counter() - start) / size
+
+
+async def concurrent_acquires(
+    limiter: RateLimiter | ListRateLimiter, tasks: int, keys: int
+) -> float:
+    per_task = 10
+
+    async def worker(index: int) -> None:
+        key = f"bench-{index % keys}" if keys > 1 else "bench"
+        for _ in range(per_task):
+            await limiter.acquire(key)
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(tasks)))
+    return (time.perf_counter() - start) / (tasks * per_task)
+
+
+async def main() -> None:
+    await fill_window(make_limiter(1_000), 1_000)
+
+    print("Filling one window (cost per acquire)")
+    print(f"{'window':>8} {'deque':>12} {'list':>12}")
+    for size in WINDOW_SIZES:
+        deque_cost = await fill_window(make_limiter(size), size)
+        list_cost = await fill_window(ListRateLimiter(size, 3600), size)
+        print(f"{size:>8} {deque_cost * 1e6:>10.2f}us {list_cost * 1e6:>10.2f}us")
+
+    print("\nConcurrent acquires, window of 100k (cost per acquire)")
+    print(f"{'tasks':>8} {'keys':>6} {'deque':>12} {'list':>12}")
+    for tasks in CONCURRENCY:
+        for keys in (1, 4):
+            deque_limiter = make_limiter(100_000)
+            deque_limiter.LIMITS.update({f"bench-{i}": (100_000, 3600) for i in range(keys)})
+            deque_cost = await concurrent_acquires(deque_limiter, tasks, keys)
+            list_cost = await concurrent_acquires(ListRateLimiter(100_000, 3600), tasks, keys)
+            print(f"{tasks:>8} {keys:>6} {deque_cost * 1e6:>10.2f}us {list_cost * 1e6:>10.2f}us")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
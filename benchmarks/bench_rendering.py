@@ -0,0 +1,65 @@
+"""
+Cost of rendering a tweet list response: direct msgspec encoding versus TweetSchema
+models, response_model validation and json.dumps (the previous FastAPI path).
+
+Run with: python -m benchmarks.bench_rendering
+"""
+import time
+from collections.abc import Callable
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.entities import Account, Tweet
+from app.presentation.api.rendering import tweets_response
+from app.presentation.schemas.tweet import TweetSchema
+
+ROUNDS = 200
+
+_adapter = TypeAdapter(list[TweetSchema])
+
+
+def schema_response(tweets: list[Tweet]) -> JSONResponse:
+    # What FastAPI does for response_model: dump the returned models, validate, serialize
+    models = [TweetSchema.from_entity(tweet).model_dump() for tweet in tweets]
+    validated = _adapter.validate_python(models)
+    return JSONResponse(_adapter.dump_python(validated, mode="json"))
+
+
+def make_tweets(count: int) -> list[Tweet]:
+    accounts = [Account(f"User {i}", f"/user{i}", 1000 + i) for i in range(10)]
+    return [
+        Tweet(
+            account=accounts[i % 10],
+            created_at=1_700_000_000 + i * 37,
+            hashtags=("#python", "#asyncio"),
+            likes=i,
+            replies=i % 7,
+            retweets=i % 13,
+            text=f"tweet {i} about #python and #asyncio, with some more text to carry",
+            id=1_790_000_000_000_000_000 + i,
+        )
+        for i in range(count)
+    ]
+
+
+def measure(render: Callable[[list[Tweet]], object], tweets: list[Tweet]) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        render(tweets)
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def main() -> None:
+    print("Rendering one response (cost per response)")
+    print(f"{'tweets':>8} {'msgspec':>12} {'schema':>12}")
+    for count in (10, 100):
+        tweets = make_tweets(count)
+        assert tweets_response(tweets).body == schema_response(tweets).body
+        fast = measure(tweets_response, tweets)
+        slow = measure(schema_response, tweets)
+        print(f"{count:>8} {fast * 1e6:>10.1f}us {slow * 1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,7 @@ os.environ.setdefault("REDIS_ENABLED", "false")
 os.environ.setdefault("LOG_LEVEL", "INFO")
 os.environ.setdefault("LOG_FORMAT", "json")
 os.environ.setdefault("CORS_ORIGINS", "")
+os.environ.setdefault("WARMUP_CONNECTIONS", "0")
 
 # Mock load_dotenv to prevent file access in tests
 with patch('dotenv.load_dotenv', return_value=None):
@@ -52,6 +52,20 @@ MOCK_USER_LOOKUP_RESPONSE = {
     }
 }
 
+MOCK_USERS_LOOKUP_RESPONSE = {
+    "data": [
+        {"id": "783214", "name": "Twitter", "username": "Twitter"},
+        {"id": "14159138", "name": "Raymond Hettinger", "username": "raymondh"},
+    ],
+    "errors": [
+        {
+            "value": "ghost_user",
+            "detail": "Could not find user with usernames: [ghost_user].",
+            "title": "Not Found Error",
+        }
+    ],
+}
+
 MOCK_USER_TIMELINE_RESPONSE = {
     "data": [
         {
@@ -1,11 +1,23 @@
-from unittest.mock import AsyncMock
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.context import mark_degraded
 from app.core.entities import Account, Tweet
+from app.core.exceptions import (
+    DeadlineExceededError,
+    ServiceOverloadedError,
+    TwitterCircuitOpenError,
+    TwitterResourceNotFoundError,
+)
 from app.main import app
+from app.presentation.api.cursors import CURSOR_HEADER, decode_cursor, encode_cursor
 from app.presentation.api.dependencies import get_tweet_service
+from app.presentation.middleware.request_context import DEGRADED_HEADER, TIMEOUT_HEADER
+from app.utils.metrics import metrics
 
 
 @pytest.fixture
@@ -17,7 +29,8 @@ def mock_tweet_service():
 def client(mock_tweet_service):
     app.dependency_overrides[get_tweet_service] = lambda: mock_tweet_service
 
-    yield TestClient(app)
+    with TestClient(app) as test_client:
+        yield test_client
 
     app.dependency_overrides.clear()
 
@@ -31,12 +44,13 @@ def mock_tweets():
                 href="/raymondh",
                 id=14159138,
             ),
-            date="12:57 PM - 7 Mar 2018",
-            hashtags=["#python"],
+            created_at=1520427420,
+            hashtags=("#python",),
             likes=169,
             replies=13,
             retweets=27,
             text="Historically, bash filename pattern matching was known as globbing.",
+            id=971408512375865344,
         )
     ]
 
@@ -55,7 +69,10 @@ class TestHashtagEndpoint:
         assert data[0]["text"] == "Historically, bash filename pattern matching was known as globbing."
         assert data[0]["likes"] == 169
         assert data[0]["hashtags"] == ["#python"]
-        mock_tweet_service.get_tweets_by_hashtag.assert_called_once_with("Python", 30)
+        assert data[0]["date"] == "12:57 PM - 7 Mar 2018"
+        mock_tweet_service.get_tweets_by_hashtag.assert_called_once_with(
+            "Python", 30, since_id=None
+        )
 
     def test_get_tweets_by_hashtag_default_limit(self, client, mock_tweet_service, mock_tweets):
         mock_tweet_service.get_tweets_by_hashtag.return_value = mock_tweets
@@ -64,7 +81,34 @@ class TestHashtagEndpoint:
 
         assert response.status_code == 200
         assert len(response.json()) == 1
-        mock_tweet_service.get_tweets_by_hashtag.assert_called_once_with("Python", 30)
+        mock_tweet_service.get_tweets_by_hashtag.assert_called_once_with(
+            "Python", 30, since_id=None
+        )
+
+    def test_get_tweets_by_hashtag_returns_cursor(self, client, mock_tweet_service, mock_tweets):
+        mock_tweet_service.get_tweets_by_hashtag.return_value = mock_tweets
+
+        response = client.get("/api/v1/hashtags/Python")
+
+        assert decode_cursor(response.headers[CURSOR_HEADER]) == 971408512375865344
+
+    def test_get_tweets_by_hashtag_with_cursor(self, client, mock_tweet_service):
+        mock_tweet_service.get_tweets_by_hashtag.return_value = []
+        cursor = encode_cursor(971408512375865344)
+
+        response = client.get(f"/api/v1/hashtags/Python?cursor={cursor}")
+
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers[CURSOR_HEADER] == cursor
+        mock_tweet_service.get_tweets_by_hashtag.assert_called_once_with(
+            "Python", 30, since_id=971408512375865344
+        )
+
+    def test_get_tweets_by_hashtag_invalid_cursor(self, client):
+        response = client.get("/api/v1/hashtags/Python?cursor=not-a-cursor")
+
+        assert response.status_code == 422
 
     def test_get_tweets_by_hashtag_invalid_limit(self, client):
         response = client.get("/api/v1/hashtags/Python?limit=0")
@@ -77,6 +121,73 @@ class TestHashtagEndpoint:
         assert response.status_code == 404  # Not found
 
 
+class TestStreamEndpoints:
+    """Tests for the NDJSON /stream endpoints."""
+
+    def test_stream_tweets_by_hashtag(self, client, mock_tweet_service, mock_tweets):
+        async def tweets(*_args):
+            for tweet in mock_tweets * 3:
+                yield tweet
+
+        mock_tweet_service.stream_tweets_by_hashtag = MagicMock(side_effect=tweets)
+
+        response = client.get("/api/v1/hashtags/Python/stream?limit=500")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["likes"] == 169
+        mock_tweet_service.stream_tweets_by_hashtag.assert_called_once_with("Python", 500)
+
+    def test_stream_tweets_by_user_limit_too_high(self, client):
+        response = client.get("/api/v1/users/twitter/stream?limit=1001")
+
+        assert response.status_code == 422
+
+    def test_stream_error_before_first_tweet(self, client, mock_tweet_service):
+        async def tweets(*_args):
+            raise TwitterResourceNotFoundError("User @twitter not found")
+            yield
+
+        mock_tweet_service.stream_tweets_by_user = MagicMock(side_effect=tweets)
+
+        response = client.get("/api/v1/users/twitter/stream")
+
+        assert response.status_code == 404
+
+
+class TestSearchHashtagsEndpoint:
+    """Tests for /api/v1/search/hashtags endpoint."""
+
+    def test_get_tweets_by_hashtags_success(self, client, mock_tweet_service, mock_tweets):
+        mock_tweet_service.get_tweets_by_hashtags.return_value = {
+            "python": mock_tweets,
+            "rust": [],
+        }
+
+        response = client.get("/api/v1/search/hashtags?tags=python,%23rust&limit=10")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["python"][0]["likes"] == 169
+        assert data["rust"] == []
+        mock_tweet_service.get_tweets_by_hashtags.assert_called_once_with(["python", "#rust"], 10)
+
+    def test_get_tweets_by_hashtags_too_many(self, client):
+        tags = ",".join(f"tag{i}" for i in range(21))
+
+        response = client.get(f"/api/v1/search/hashtags?tags={tags}")
+
+        assert response.status_code == 422
+
+    def test_get_tweets_by_hashtags_too_long(self, client, mock_tweet_service):
+        response = client.get(f"/api/v1/search/hashtags?tags=python,{'a' * 101}")
+
+        assert response.status_code == 422
+        mock_tweet_service.get_tweets_by_hashtags.assert_not_called()
+
+
 class TestUserEndpoint:
     """Tests for /api/v1/users/{username} endpoint."""
 
@@ -89,7 +200,19 @@ class TestUserEndpoint:
         data = response.json()
         assert len(data) == 1
         assert data[0]["account"]["fullname"] == "Raymond Hettinger"
-        mock_tweet_service.get_tweets_by_user.assert_called_once_with("twitter", 20)
+        mock_tweet_service.get_tweets_by_user.assert_called_once_with(
+            "twitter", 20, since_id=None
+        )
+
+    def test_get_tweets_by_user_since_id(self, client, mock_tweet_service, mock_tweets):
+        mock_tweet_service.get_tweets_by_user.return_value = mock_tweets
+
+        response = client.get("/api/v1/users/twitter?since_id=42")
+
+        assert response.status_code == 200
+        mock_tweet_service.get_tweets_by_user.assert_called_once_with(
+            "twitter", 30, since_id=42
+        )
 
     def test_get_tweets_by_user_default_limit(self, client, mock_tweet_service, mock_tweets):
         mock_tweet_service.get_tweets_by_user.return_value = mock_tweets
@@ -98,7 +221,103 @@ class TestUserEndpoint:
 
         assert response.status_code == 200
         assert len(response.json()) == 1
-        mock_tweet_service.get_tweets_by_user.assert_called_once_with("twitter", 30)
+        mock_tweet_service.get_tweets_by_user.assert_called_once_with(
+            "twitter", 30, since_id=None
+        )
+
+
+    def test_stale_result_is_marked_degraded(self, client, mock_tweet_service, mock_tweets):
+        async def serve_stale(*_args, **_kwargs):
+            mark_degraded()
+            return mock_tweets
+
+        mock_tweet_service.get_tweets_by_user.side_effect = serve_stale
+
+        response = client.get("/api/v1/users/twitter")
+
+        assert response.status_code == 200
+        assert response.headers[DEGRADED_HEADER] == "stale-cache"
+
+    def test_fresh_result_is_not_marked_degraded(self, client, mock_tweet_service, mock_tweets):
+        mock_tweet_service.get_tweets_by_user.return_value = mock_tweets
+
+        response = client.get("/api/v1/users/twitter")
+
+        assert DEGRADED_HEADER not in response.headers
+
+    def test_open_circuit_without_cache_returns_503(self, client, mock_tweet_service):
+        mock_tweet_service.get_tweets_by_user.side_effect = TwitterCircuitOpenError(
+            "user_timeline", 10.0
+        )
+
+        response = client.get("/api/v1/users/twitter")
+
+        assert response.status_code == 503
+        assert response.json()["error"] == "TwitterCircuitOpenError"
+
+    def test_request_timeout_header_returns_504(self, client, mock_tweet_service, mock_tweets):
+        async def slow(*_args, **_kwargs):
+            await asyncio.sleep(5)
+            return mock_tweets
+
+        mock_tweet_service.get_tweets_by_user.side_effect = slow
+
+        response = client.get("/api/v1/users/twitter", headers={TIMEOUT_HEADER: "0.05"})
+
+        assert response.status_code == 504
+        assert response.json()["error"] == "DeadlineExceededError"
+
+    def test_invalid_request_timeout_header_is_ignored(
+        self, client, mock_tweet_service, mock_tweets
+    ):
+        mock_tweet_service.get_tweets_by_user.return_value = mock_tweets
+
+        response = client.get("/api/v1/users/twitter", headers={TIMEOUT_HEADER: "soon"})
+
+        assert response.status_code == 200
+
+    def test_deadline_exceeded_downstream_returns_504(self, client, mock_tweet_service):
+        mock_tweet_service.get_tweets_by_user.side_effect = DeadlineExceededError()
+
+        response = client.get("/api/v1/users/twitter")
+
+        assert response.status_code == 504
+
+    def test_shed_request_returns_503_with_retry_after(self, client, mock_tweet_service):
+        mock_tweet_service.get_tweets_by_user.side_effect = ServiceOverloadedError(
+            retry_after=5
+        )
+
+        response = client.get("/api/v1/users/twitter")
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "5"
+
+class TestUsersEndpoint:
+    """Tests for /api/v1/users endpoint."""
+
+    def test_get_tweets_by_users_success(self, client, mock_tweet_service, mock_tweets):
+        mock_tweet_service.get_tweets_by_users.return_value = mock_tweets
+
+        response = client.get("/api/v1/users?usernames=raymondh,@twitter&limit=10")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        mock_tweet_service.get_tweets_by_users.assert_called_once_with(
+            ["raymondh", "@twitter"], 10
+        )
+
+    def test_get_tweets_by_users_invalid_usernames(self, client):
+        response = client.get("/api/v1/users?usernames=raymondh,,x")
+
+        assert response.status_code == 422
+
+    def test_get_tweets_by_users_too_many_usernames(self, client):
+        usernames = ",".join(f"user{i:04d}" for i in range(51))
+
+        response = client.get(f"/api/v1/users?usernames={usernames}")
+
+        assert response.status_code == 422
 
 
 class TestHealthEndpoint:
@@ -111,6 +330,17 @@ class TestHealthEndpoint:
         assert "version" in data
 
 
+class TestMetricsEndpoint:
+    def test_metrics_exposes_counter_snapshot(self, client):
+        metrics.increment("upstream_retries", endpoint="search_tweets")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.json() == metrics.snapshot()
+        assert response.json()["upstream_retries,endpoint=search_tweets"] >= 1
+
+
 class TestRootEndpoint:
     def test_root(self, client):
         response = client.get("/")
@@ -0,0 +1,77 @@
+import asyncio
+import time
+
+import pytest
+
+from app.application.admission import AdmissionController
+from app.core.exceptions import ServiceOverloadedError
+
+
+async def hold(admission: AdmissionController, release: asyncio.Event) -> None:
+    async with admission.slot():
+        await release.wait()
+
+
+class TestAdmissionController:
+    @pytest.mark.asyncio
+    async def test_queued_caller_runs_when_slot_frees(self):
+        admission = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=1.0)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(admission, release))
+        await asyncio.sleep(0)
+
+        async def queued() -> str:
+            async with admission.slot():
+                return "ran"
+
+        waiter = asyncio.create_task(queued())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        release.set()
+        assert await waiter == "ran"
+        await holder
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_shed_immediately(self):
+        admission = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=2.0)
+        release = asyncio.Event()
+        tasks = [asyncio.create_task(hold(admission, release)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        start = time.perf_counter()
+        with pytest.raises(ServiceOverloadedError) as exc_info:
+            async with admission.slot():
+                pass
+
+        assert time.perf_counter() - start < 0.1
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.retry_after == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_sheds_waiter(self):
+        admission = AdmissionController(max_concurrent=1, max_queue=5, queue_timeout=0.05)
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(admission, release))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ServiceOverloadedError):
+            async with admission.slot():
+                pass
+
+        assert admission._queued == 0
+        release.set()
+        await holder
+
+    @pytest.mark.asyncio
+    async def test_slot_is_released_on_error(self):
+        admission = AdmissionController(max_concurrent=1, max_queue=0)
+
+        with pytest.raises(RuntimeError):
+            async with admission.slot():
+                raise RuntimeError("boom")
+
+        async with admission.slot():
+            pass
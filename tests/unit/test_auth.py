@@ -1,7 +1,9 @@
+import time
+
 import pytest
 
 from app.bootstrap.config import Settings
-from app.core.exceptions import TwitterAuthenticationError
+from app.core.exceptions import TwitterAuthenticationError, TwitterRateLimitError
 from app.infrastructure.twitter.auth import TwitterAuthenticator
 
 
@@ -37,3 +39,54 @@ class TestTwitterAuthenticator:
         assert "Authorization" in headers
         assert "Content-Type" in headers
 
+
+    def test_get_headers_is_prebuilt(self, test_settings: Settings):
+        auth = TwitterAuthenticator(test_settings)
+
+        assert auth.get_headers() is auth.get_headers()
+
+
+class TestBearerTokenPool:
+    @pytest.fixture
+    def auth(self, test_settings: Settings) -> TwitterAuthenticator:
+        test_settings.twitter_bearer_tokens = ["second_bearer_token", "test_bearer_token"]
+        return TwitterAuthenticator(test_settings)
+
+    def test_pool_deduplicates_tokens(self, auth: TwitterAuthenticator):
+        assert [token.headers["Authorization"] for token in auth.tokens] == [
+            "Bearer test_bearer_token",
+            "Bearer second_bearer_token",
+        ]
+
+    def test_rate_limited_token_leaves_rotation_until_reset(self, auth: TwitterAuthenticator):
+        reset_time = int(time.time()) + 600
+
+        auth.quarantine(auth.tokens[0], 429, reset_time)
+
+        assert auth.available_tokens() == [auth.tokens[1]]
+        assert auth.tokens[0].quarantined_until == reset_time
+
+    def test_exhausted_pool_raises_rate_limit_error(self, auth: TwitterAuthenticator):
+        reset_time = int(time.time()) + 600
+        auth.quarantine(auth.tokens[0], 401, None)
+        auth.quarantine(auth.tokens[1], 429, reset_time)
+
+        with pytest.raises(TwitterRateLimitError) as exc_info:
+            auth.require_available_tokens()
+
+        assert exc_info.value.reset_time == reset_time
+
+    def test_last_token_stays_in_rotation_after_401(self, auth: TwitterAuthenticator):
+        for token in auth.tokens:
+            auth.quarantine(token, 401, None)
+
+        assert auth.available_tokens() == [auth.tokens[1]]
+        assert auth.tokens[0].auth_failed
+        assert not auth.tokens[1].auth_failed
+
+    def test_single_token_is_not_quarantined_after_401(self, test_settings: Settings):
+        auth = TwitterAuthenticator(test_settings)
+
+        auth.quarantine(auth.tokens[0], 401, None)
+
+        assert auth.require_available_tokens() == auth.tokens
@@ -0,0 +1,114 @@
+import time
+
+import pytest
+
+from app.bootstrap.config import Settings
+from app.core.entities import Account, Tweet
+from app.infrastructure.cache.cache_service import RedisCacheService
+
+
+@pytest.fixture
+def memory_cache(test_settings: Settings) -> RedisCacheService:
+    test_settings.cache_enabled = True
+    return RedisCacheService(test_settings)
+
+
+@pytest.fixture
+def tweets() -> list[Tweet]:
+    account = Account(fullname="Test User", href="/testuser", id=123)
+    return [
+        Tweet(
+            account=account,
+            created_at=1704110400,
+            hashtags=("#test",),
+            likes=10,
+            replies=5,
+            retweets=3,
+            text=f"Tweet {tweet_id}",
+            id=tweet_id,
+        )
+        for tweet_id in (1790000000000000002, 1790000000000000001)
+    ]
+
+
+class TestRedisCacheService:
+    @pytest.mark.asyncio
+    async def test_set_and_get_roundtrip(self, memory_cache: RedisCacheService, tweets):
+        await memory_cache.set("key", tweets, ttl=60)
+
+        assert await memory_cache.get("key") == tweets
+
+    @pytest.mark.asyncio
+    async def test_entry_keeps_newest_id(self, memory_cache: RedisCacheService, tweets):
+        await memory_cache.set("key", tweets, ttl=60)
+
+        entry = await memory_cache.get_entry("key")
+
+        assert entry is not None
+        assert entry.newest_id == 1790000000000000002
+        assert entry.is_fresh
+
+    @pytest.mark.asyncio
+    async def test_entry_keeps_time_of_last_full_fetch(
+        self, memory_cache: RedisCacheService, tweets
+    ):
+        before = time.time()
+        await memory_cache.set("full", tweets, ttl=60)
+        await memory_cache.set("delta", tweets, ttl=60, fetched_at=before - 600)
+
+        full = await memory_cache.get_entry("full")
+        delta = await memory_cache.get_entry("delta")
+
+        assert full is not None and full.fetched_at >= before
+        assert delta is not None and delta.fetched_at == before - 600
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_kept_for_refresh(self, memory_cache: RedisCacheService, tweets):
+        await memory_cache.set("key", tweets, ttl=0)
+        time.sleep(0.01)
+
+        assert await memory_cache.get("key") is None
+        entry = await memory_cache.get_entry("key")
+        assert entry is not None
+        assert not entry.is_fresh
+        assert entry.tweets == tweets
+
+    @pytest.mark.asyncio
+    async def test_roundtrip_shares_accounts_and_interns_hashtags(
+        self, memory_cache: RedisCacheService, tweets
+    ):
+        await memory_cache.set("key", tweets, ttl=60)
+
+        cached = await memory_cache.get("key")
+
+        assert cached is not None
+        assert cached[0].account is cached[1].account
+        assert cached[0].hashtags[0] is cached[1].hashtags[0]
+
+    @pytest.mark.asyncio
+    async def test_entry_in_previous_format_is_a_miss(self, memory_cache: RedisCacheService):
+        legacy = {
+            "newest_id": "1",
+            "expires_at": time.time() + 60,
+            "tweets": [
+                {
+                    "account": {"fullname": "Test User", "href": "/testuser", "id": 123},
+                    "date": "12:00 PM - 1 Jan 2024",
+                    "hashtags": ["#test"],
+                    "likes": 0,
+                    "replies": 0,
+                    "retweets": 0,
+                    "text": "old",
+                    "id": "1",
+                }
+            ],
+        }
+        await memory_cache._cache.set("key", legacy)
+
+        assert await memory_cache.get_entry("key") is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_returns_none(self, cache_service: RedisCacheService, tweets):
+        await cache_service.set("key", tweets, ttl=60)
+
+        assert await cache_service.get_entry("key") is None
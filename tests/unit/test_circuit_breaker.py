@@ -0,0 +1,84 @@
+import pytest
+
+from app.core.exceptions import TwitterCircuitOpenError
+from app.infrastructure.twitter.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakers,
+    CircuitState,
+)
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("search_tweets", failure_threshold=3)
+
+        trip(breaker)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(TwitterCircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.status_code == 503
+        assert 0 < exc_info.value.retry_after <= 30
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker("search_tweets", failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_single_probe(self):
+        breaker = CircuitBreaker("search_tweets", failure_threshold=1, recovery_timeout=0.0)
+        trip(breaker)
+
+        breaker.before_call()
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        with pytest.raises(TwitterCircuitOpenError):
+            breaker.before_call()
+
+    def test_successful_probe_closes_circuit(self):
+        breaker = CircuitBreaker("search_tweets", failure_threshold=1, recovery_timeout=0.0)
+        trip(breaker)
+
+        breaker.before_call()
+        breaker.record_success()
+
+        assert breaker.state is CircuitState.CLOSED
+        breaker.before_call()
+        breaker.before_call()
+
+    def test_failed_probe_reopens_circuit(self):
+        breaker = CircuitBreaker("search_tweets", failure_threshold=1, recovery_timeout=0.0)
+        trip(breaker)
+
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_released_probe_frees_half_open_slot(self):
+        breaker = CircuitBreaker("search_tweets", failure_threshold=1, recovery_timeout=0.0)
+        trip(breaker)
+
+        breaker.before_call()
+        breaker.release()
+        breaker.before_call()
+
+        assert breaker.state is CircuitState.HALF_OPEN
+
+    def test_breakers_are_per_endpoint(self):
+        breakers = CircuitBreakers(failure_threshold=1)
+
+        trip(breakers.get("search_tweets"))
+
+        assert breakers.get("search_tweets").state is CircuitState.OPEN
+        assert breakers.get("user_timeline").state is CircuitState.CLOSED
@@ -0,0 +1,109 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.bootstrap import middleware
+from app.bootstrap.container import Container
+from app.bootstrap.middleware import setup_middleware
+from app.infrastructure.ratelimit.token_bucket import ShardedTokenBucketStore
+from app.presentation.middleware.client_rate_limit import (
+    API_KEY_HEADER,
+    ClientRateLimitMiddleware,
+)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/v1/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(
+        ClientRateLimitMiddleware, store=ShardedTokenBucketStore(0.01, 2), api_keys=["a", "b"]
+    )
+    return TestClient(app)
+
+
+class TestClientRateLimitMiddleware:
+    def test_allowed_response_carries_rate_limit_headers(self, client: TestClient):
+        response = client.get("/api/v1/ping")
+
+        assert response.status_code == 200
+        assert response.headers["RateLimit-Limit"] == "2"
+        assert response.headers["RateLimit-Remaining"] == "1"
+        assert int(response.headers["RateLimit-Reset"]) > 0
+
+    def test_exhausted_client_gets_429(self, client: TestClient):
+        client.get("/api/v1/ping")
+        client.get("/api/v1/ping")
+
+        response = client.get("/api/v1/ping")
+
+        assert response.status_code == 429
+        assert response.json()["error"] == "ClientRateLimitExceeded"
+        assert response.headers["RateLimit-Remaining"] == "0"
+        assert int(response.headers["Retry-After"]) > 0
+
+    def test_api_keys_are_limited_separately(self, client: TestClient):
+        client.get("/api/v1/ping", headers={API_KEY_HEADER: "a"})
+        client.get("/api/v1/ping", headers={API_KEY_HEADER: "a"})
+
+        assert client.get("/api/v1/ping", headers={API_KEY_HEADER: "b"}).status_code == 200
+        assert client.get("/api/v1/ping", headers={API_KEY_HEADER: "a"}).status_code == 429
+
+    def test_unknown_api_keys_share_the_ip_bucket(self, client: TestClient):
+        client.get("/api/v1/ping")
+        client.get("/api/v1/ping")
+
+        response = client.get("/api/v1/ping", headers={API_KEY_HEADER: "made-up"})
+
+        assert response.status_code == 429
+
+    def test_preflight_requests_are_not_limited(self, client: TestClient):
+        for _ in range(5):
+            client.options("/api/v1/ping")
+
+        assert client.get("/api/v1/ping").status_code == 200
+
+    def test_paths_outside_api_are_not_limited(self, client: TestClient):
+        for _ in range(5):
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "RateLimit-Limit" not in response.headers
+
+
+class TestMiddlewareOrder:
+    def test_rejections_carry_cors_headers(self, monkeypatch: pytest.MonkeyPatch):
+        settings = middleware.settings.model_copy(
+            update={
+                "cors_origins": "https://example.com",
+                "client_rate_limit_enabled": True,
+                "client_rate_limit_backend": "memory",
+                "client_rate_limit_burst": 1,
+            }
+        )
+        monkeypatch.setattr(middleware, "settings", settings)
+        app = FastAPI()
+        app.state.container = Container.build(settings)
+
+        @app.get("/api/v1/ping")
+        async def ping() -> dict[str, str]:
+            return {"status": "ok"}
+
+        setup_middleware(app)
+        client = TestClient(app)
+        origin = {"Origin": "https://example.com"}
+
+        client.get("/api/v1/ping", headers=origin)
+        response = client.get("/api/v1/ping", headers=origin)
+
+        assert response.status_code == 429
+        assert response.headers["Access-Control-Allow-Origin"] == "https://example.com"
+        assert "Retry-After" in response.headers["Access-Control-Expose-Headers"]
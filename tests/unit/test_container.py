@@ -0,0 +1,72 @@
+from typing import Annotated
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.bootstrap.config import Settings
+from app.bootstrap.container import Container
+from app.bootstrap.lifecycle import create_lifespan
+from app.infrastructure.twitter.rate_limiter import RateLimiter
+from app.presentation.api.dependencies import get_tweet_service
+
+
+class TestContainer:
+    def test_build_wires_shared_instances(self, test_settings: Settings):
+        container = Container.build(test_settings)
+
+        client = container.twitter_client
+        assert client.http_client is container.http_client
+        assert client.rate_limiter is container.rate_limiter
+        assert container.tweet_service.tweet_repository is client
+        assert container.tweet_service.cache_service is container.cache_service
+
+    def test_memory_backend_builds_in_process_limiter(self, test_settings: Settings):
+        container = Container.build(test_settings)
+
+        assert type(container.rate_limiter) is RateLimiter
+
+    @pytest.mark.asyncio
+    async def test_close_releases_clients_and_executor(self, test_settings: Settings):
+        settings = test_settings.model_copy(update={"mapping_executor": "thread"})
+        container = Container.build(settings)
+        container.cache_service.close = AsyncMock()  # type: ignore[method-assign]
+        container.rate_limiter.close = AsyncMock()  # type: ignore[method-assign]
+        container.client_rate_limit_store.close = AsyncMock()  # type: ignore[method-assign]
+        executor = container.mapping_executor
+        assert executor is not None
+
+        await container.close()
+
+        assert container.http_client.is_closed
+        container.cache_service.close.assert_awaited_once()
+        container.rate_limiter.close.assert_awaited_once()
+        container.client_rate_limit_store.close.assert_awaited_once()
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+
+class TestLifespan:
+    def test_container_lives_for_the_app_lifetime(self):
+        app = FastAPI(lifespan=create_lifespan())
+
+        with TestClient(app):
+            container = app.state.container
+            assert not container.http_client.is_closed
+
+        assert container.http_client.is_closed
+
+    def test_tweet_service_is_resolved_from_app_state(self):
+        app = FastAPI(lifespan=create_lifespan())
+        resolved = []
+
+        @app.get("/service")
+        async def service(tweet_service: Annotated[object, Depends(get_tweet_service)]) -> None:
+            resolved.append(tweet_service)
+
+        with TestClient(app) as client:
+            client.get("/service")
+            client.get("/service")
+
+            assert resolved[0] is resolved[1] is app.state.container.tweet_service
@@ -23,8 +23,8 @@ class TestTweet:
         account = Account(fullname="Test User", href="/testuser", id=123)
         tweet = Tweet(
             account=account,
-            date="12:00 PM - 1 Jan 2024",
-            hashtags=["#test"],
+            created_at=1704110400,
+            hashtags=("#test",),
             likes=10,
             replies=5,
             retweets=3,
@@ -34,14 +34,14 @@ class TestTweet:
         assert tweet.account == account
         assert tweet.text == "Test tweet"
         assert tweet.likes == 10
-        assert tweet.hashtags == ["#test"]
+        assert tweet.hashtags == ("#test",)
 
     def test_tweet_is_immutable(self):
         account = Account(fullname="Test User", href="/testuser", id=123)
         tweet = Tweet(
             account=account,
-            date="12:00 PM - 1 Jan 2024",
-            hashtags=["#test"],
+            created_at=1704110400,
+            hashtags=("#test",),
             likes=10,
             replies=5,
             retweets=3,
@@ -51,3 +51,18 @@ class TestTweet:
         with pytest.raises(AttributeError):
             tweet.text = "Modified"  # type: ignore
 
+
+    def test_tweet_is_slotted(self):
+        account = Account(fullname="Test User", href="/testuser", id=123)
+        tweet = Tweet(
+            account=account,
+            created_at=1704110400,
+            hashtags=("#test",),
+            likes=10,
+            replies=5,
+            retweets=3,
+            text="Test tweet",
+        )
+
+        assert not hasattr(tweet, "__dict__")
+        assert not hasattr(account, "__dict__")
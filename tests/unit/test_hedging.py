@@ -0,0 +1,93 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.infrastructure.http.hedging import LatencyTracker, hedged_call
+
+
+def make_call(*delays: float):
+    """Return a call whose n-th invocation answers after delays[n]"""
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def call() -> httpx.Response:
+        index = len(started)
+        started.append(index)
+        try:
+            await asyncio.sleep(delays[index])
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return httpx.Response(200, json={"index": index})
+
+    return call, started, cancelled
+
+
+class TestLatencyTracker:
+    def test_no_percentile_before_min_samples(self):
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("search_tweets", 0.1)
+        tracker.record("search_tweets", 0.2)
+
+        assert tracker.percentile("search_tweets", 0.95) is None
+
+    def test_percentile_over_recent_window(self):
+        tracker = LatencyTracker(window_size=100, min_samples=1)
+        for latency in range(1, 201):
+            tracker.record("search_tweets", latency / 1000)
+
+        assert tracker.percentile("search_tweets", 0.95) == 0.195
+        assert tracker.percentile("user_timeline", 0.95) is None
+
+
+class TestHedgedCall:
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self):
+        call, started, _ = make_call(0.0)
+        may_hedge = AsyncMock(return_value=True)
+
+        response = await hedged_call("search_tweets", call, 0.05, may_hedge)
+
+        assert response.json() == {"index": 0}
+        assert started == [0]
+        may_hedge.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_hedge(self):
+        call, started, cancelled = make_call(1.0, 0.0)
+
+        response = await hedged_call("search_tweets", call, 0.01, AsyncMock(return_value=True))
+        await asyncio.sleep(0)
+
+        assert response.json() == {"index": 1}
+        assert started == [0, 1]
+        assert cancelled == [0]
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_when_not_allowed(self):
+        call, started, _ = make_call(0.05)
+
+        response = await hedged_call("search_tweets", call, 0.01, AsyncMock(return_value=False))
+
+        assert response.json() == {"index": 0}
+        assert started == [0]
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_falls_back_to_hedge(self):
+        attempts = 0
+
+        async def call() -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(0.05)
+                raise httpx.ReadTimeout("slow")
+            await asyncio.sleep(0.1)
+            return httpx.Response(200)
+
+        response = await hedged_call("search_tweets", call, 0.01, AsyncMock(return_value=True))
+
+        assert response.status_code == 200
+        assert attempts == 2
@@ -1,8 +1,35 @@
 
+import json
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from app.core.entities import Tweet
+from app.core.exceptions import TwitterServiceUnavailableError
 from app.infrastructure.twitter.mapper import (
-    _format_date,
-    map_tweet,
+    _parse_timestamp,
+    create_mapping_executor,
+    parse_tweets_page,
+    parse_user,
+    parse_users,
 )
+from app.presentation.schemas.tweet import format_tweet_date
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def map_tweets(tweets_data: list[dict[str, Any]], includes: dict[str, Any]) -> list[Tweet]:
+    tweets, _ = parse_tweets_page(json.dumps({"data": tweets_data, "includes": includes}).encode())
+    return tweets
+
+
+def map_tweet(tweet_data: dict[str, Any], includes: dict[str, Any]) -> Tweet | None:
+    tweets = map_tweets([tweet_data], includes)
+    return tweets[0] if tweets else None
 
 
 class TestMapTweet:
@@ -42,11 +69,12 @@ class TestMapTweet:
         assert tweet.likes == 42
         assert tweet.replies == 5
         assert tweet.retweets == 10
-        assert tweet.hashtags == ["#python", "#testing"]
+        assert tweet.hashtags == ("#python", "#testing")
         assert tweet.account.fullname == "Test User"
         assert tweet.account.href == "/testuser"
         assert tweet.account.id == 987654321
-        assert tweet.date == "12:57 PM - 7 Mar 2018"
+        assert tweet.created_at == 1520427420
+        assert tweet.id == 1234567890
 
     def test_map_tweet_missing_author_id(self):
         tweet_data = {
@@ -151,7 +179,7 @@ class TestMapTweet:
         tweet = map_tweet(tweet_data, includes)
 
         assert tweet is not None
-        assert tweet.date == "invalid-date-format"
+        assert tweet.created_at is None
 
     def test_map_tweet_missing_created_at(self):
         tweet_data = {
@@ -173,7 +201,7 @@ class TestMapTweet:
         tweet = map_tweet(tweet_data, includes)
 
         assert tweet is not None
-        assert tweet.date == ""
+        assert tweet.created_at is None
 
     def test_map_tweet_empty_entities(self):
         tweet_data = {
@@ -197,7 +225,7 @@ class TestMapTweet:
         tweet = map_tweet(tweet_data, includes)
 
         assert tweet is not None
-        assert tweet.hashtags == []
+        assert tweet.hashtags == ()
 
     def test_map_tweet_no_entities(self):
         tweet_data = {
@@ -220,35 +248,210 @@ class TestMapTweet:
         tweet = map_tweet(tweet_data, includes)
 
         assert tweet is not None
-        assert tweet.hashtags == []
+        assert tweet.hashtags == ()
+
+
+class TestMapTweets:
+    def test_map_tweets_shares_accounts_per_author(self):
+        includes = {
+            "users": [
+                {"id": "1", "username": "alice", "name": "Alice"},
+                {"id": "2", "username": "bob", "name": "Bob"},
+            ]
+        }
+        tweets_data = [
+            {"id": "10", "author_id": "1", "text": "first"},
+            {"id": "11", "author_id": "2", "text": "second"},
+            {"id": "12", "author_id": "1", "text": "third"},
+        ]
+
+        tweets = map_tweets(tweets_data, includes)
+
+        assert [tweet.account.href for tweet in tweets] == ["/alice", "/bob", "/alice"]
+        assert tweets[0].account is tweets[2].account
+
+    def test_map_tweets_skips_unknown_authors(self):
+        includes = {"users": [{"id": "1", "username": "alice", "name": "Alice"}]}
+        tweets_data = [
+            {"id": "10", "author_id": 1, "text": "int author id"},
+            {"id": "11", "author_id": "3", "text": "unknown author"},
+            {"id": "12", "text": "no author"},
+        ]
+
+        tweets = map_tweets(tweets_data, includes)
+
+        assert [tweet.id for tweet in tweets] == [10]
+
+    def test_map_tweets_defaults_missing_user_fields(self):
+        tweet = map_tweet({"id": "10", "author_id": "1"}, {"users": [{"id": "1"}]})
+
+        assert tweet is not None
+        assert tweet.account.fullname == "Unknown"
+        assert tweet.account.href == "/unknown"
+
+
+class TestParseResponses:
+    def test_parse_tweets_page_returns_next_token(self):
+        body = {"data": [], "meta": {"result_count": 0, "next_token": "page-2"}}
+
+        assert parse_tweets_page(json.dumps(body).encode()) == ([], "page-2")
+
+    def test_parse_tweets_page_without_data(self):
+        assert parse_tweets_page(b'{"meta": {"result_count": 0}}') == ([], None)
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            b"not json",
+            b'{"data": [{"text": "no id"}]}',
+            b'{"data": [{"id": "1"}], "includes": {"users": [{"id": "not-a-number"}]}}',
+        ],
+    )
+    def test_malformed_payload_is_an_upstream_error(self, body: bytes):
+        with pytest.raises(TwitterServiceUnavailableError):
+            parse_tweets_page(body)
+
+    def test_parse_user(self):
+        user = parse_user(b'{"data": {"id": "783214", "name": "Twitter", "username": "twitter"}}')
+
+        assert user is not None
+        assert (user.id, user.username) == (783214, "twitter")
+        assert parse_user(b'{"errors": [{"title": "Not Found Error"}]}') is None
+
+    def test_parse_users(self):
+        users = parse_users(b'{"data": [{"id": "1", "username": "a"}, {"id": "2"}]}')
+
+        assert [(user.id, user.username) for user in users] == [(1, "a"), (2, None)]
+
+
+class TestMappingExecutor:
+    def test_no_executor_by_default(self, test_settings):
+        assert create_mapping_executor(test_settings) is None
+
+    def test_thread_executor(self, test_settings):
+        test_settings.mapping_executor = "thread"
+        executor = create_mapping_executor(test_settings)
+
+        assert isinstance(executor, ThreadPoolExecutor)
+        executor.shutdown()
+
+    def test_process_executor_maps_pages(self, test_settings):
+        test_settings.mapping_executor = "process"
+        test_settings.mapping_executor_workers = 1
+        body = {
+            "data": [{"id": "10", "author_id": "1", "entities": {"hashtags": [{"tag": "a"}]}}],
+            "includes": {"users": [{"id": "1", "username": "alice", "name": "Alice"}]},
+            "meta": {"next_token": "next"},
+        }
+        content = json.dumps(body).encode()
+        executor = create_mapping_executor(test_settings)
+        assert isinstance(executor, ProcessPoolExecutor)
+
+        with executor:
+            result = executor.submit(parse_tweets_page, content).result(timeout=60)
+            with pytest.raises(TwitterServiceUnavailableError):
+                executor.submit(parse_tweets_page, b"not json").result(timeout=60)
+
+        assert result == parse_tweets_page(content)
+
+
+class TestParseTimestamp:
+    def test_parse_timestamp_success(self):
+        assert _parse_timestamp("2018-03-07T12:57:00.000Z") == 1520427420
+
+    def test_parse_timestamp_with_offset(self):
+        assert _parse_timestamp("2018-03-07T14:57:00+02:00") == 1520427420
+
+    def test_parse_timestamp_without_offset_is_utc(self):
+        assert _parse_timestamp("2018-03-07T12:57:00") == 1520427420
+
+    def test_parse_timestamp_invalid_format(self):
+        assert _parse_timestamp("invalid-date") is None
+
+    def test_parse_timestamp_empty_string(self):
+        assert _parse_timestamp("") is None
+
+    def test_parse_timestamp_rejects_invalid_twitter_shaped_dates(self):
+        invalid = [
+            "2023-02-29T10:00:00.000Z",
+            "2024-01-01T24:00:00.000Z",
+            "2024-01-01T10:00:60.000Z",
+            "2024-01-01T10:00:00.0a0Z",
+        ]
+        for iso_date in invalid:
+            assert _parse_timestamp(iso_date) is None
+
+
+class TestFormatTweetDate:
+    def test_format_tweet_date(self):
+        assert format_tweet_date(1520427420) == "12:57 PM - 7 Mar 2018"
+
+    def test_format_tweet_date_with_leading_zero(self):
+        assert format_tweet_date(1520415000) == "9:30 AM - 7 Mar 2018"
+
+    def test_format_tweet_date_midnight_and_noon(self):
+        assert format_tweet_date(1735603500) == "12:05 AM - 31 Dec 2024"
+        assert format_tweet_date(1735646700) == "12:05 PM - 31 Dec 2024"
+
+    def test_format_tweet_date_unknown(self):
+        assert format_tweet_date(None) == ""
 
 
-class TestFormatDate:
-    def test_format_date_success(self):
-        iso_date = "2018-03-07T12:57:00.000Z"
+def reference_timestamp(iso_date: str) -> datetime | None:
+    try:
+        dt = datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
 
-        formatted = _format_date(iso_date)
 
-        assert formatted == "12:57 PM - 7 Mar 2018"
+def strftime_format_date(dt: datetime | None) -> str:
+    """The previous strftime-based rendering, in UTC, as the reference"""
+    try:
+        formatted = dt.astimezone(UTC).strftime("%I:%M %p - %-d %b %Y") if dt else ""
+    except OverflowError:
+        return ""
+    return formatted[1:] if formatted.startswith("0") else formatted
 
-    def test_format_date_with_leading_zero(self):
-        iso_date = "2018-03-07T09:30:00.000Z"
 
-        formatted = _format_date(iso_date)
+def random_iso_date(rng: random.Random) -> str:
+    dt = datetime(1, 1, 1) + timedelta(seconds=rng.randrange(315_537_897_600))
+    shape = rng.randrange(5)
+    if shape == 0:
+        return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{rng.randrange(1000):03d}Z"
+    if shape == 1:
+        return dt.isoformat() + "Z"
+    if shape == 2:
+        offset = rng.randrange(-14 * 60, 14 * 60 + 1)
+        sign = "-" if offset < 0 else "+"
+        return dt.isoformat() + f"{sign}{abs(offset) // 60:02d}:{abs(offset) % 60:02d}"
+    if shape == 3:
+        return dt.date().isoformat()
+    return dt.isoformat(timespec="minutes")
 
-        assert formatted == "9:30 AM - 7 Mar 2018"
 
-    def test_format_date_invalid_format(self):
-        iso_date = "invalid-date"
+def mutate(rng: random.Random, iso_date: str) -> str:
+    index = rng.randrange(len(iso_date))
+    return iso_date[:index] + rng.choice("09:-.TZ+ x") + iso_date[index + 1:]
 
-        formatted = _format_date(iso_date)
 
-        assert formatted == "invalid-date"
+def assert_matches_reference(iso_date: str) -> None:
+    dt = reference_timestamp(iso_date)
+    expected = None if dt is None else (dt - EPOCH) // timedelta(seconds=1)
+    created_at = _parse_timestamp(iso_date)
 
-    def test_format_date_empty_string(self):
-        iso_date = ""
+    assert created_at == expected, iso_date
+    assert format_tweet_date(created_at) == strftime_format_date(dt), iso_date
 
-        formatted = _format_date(iso_date)
 
-        assert formatted == ""
+@pytest.mark.skipif(sys.platform == "win32", reason="reference uses the %-d format code")
+class TestTimestampsMatchStrftime:
+    def test_random_dates(self):
+        rng = random.Random(20240307)
+        for _ in range(20_000):
+            assert_matches_reference(random_iso_date(rng))
 
+    def test_random_malformed_dates(self):
+        rng = random.Random(20180307)
+        for _ in range(20_000):
+            assert_matches_reference(mutate(rng, random_iso_date(rng)))
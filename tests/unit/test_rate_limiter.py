@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 import pytest
 
@@ -47,4 +48,159 @@ class TestRateLimiter:
         await limiter.acquire("get_user")
         await limiter.acquire("user_timeline")
 
+    @pytest.mark.asyncio
+    async def test_upstream_headers_replace_local_limits(self):
+        limiter = RateLimiter()
+        reset_at = int(time.time()) + 900
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "20",
+                "x-rate-limit-reset": str(reset_at),
+            },
+        )
+
+        for _ in range(20):
+            await limiter.acquire("search_tweets")
+
+        with pytest.raises(TwitterRateLimitError) as exc_info:
+            await limiter.acquire("search_tweets")
+
+        assert exc_info.value.reset_time == reset_at
+
+    @pytest.mark.asyncio
+    async def test_stale_response_does_not_raise_remaining(self):
+        limiter = RateLimiter()
+        reset_at = str(int(time.time()) + 900)
+        headers = {"x-rate-limit-limit": "450", "x-rate-limit-reset": reset_at}
+
+        limiter.update_from_headers("search_tweets", {**headers, "x-rate-limit-remaining": "1"})
+        limiter.update_from_headers("search_tweets", {**headers, "x-rate-limit-remaining": "5"})
+
+        await limiter.acquire("search_tweets")
+        with pytest.raises(TwitterRateLimitError):
+            await limiter.acquire("search_tweets")
+
+    @pytest.mark.asyncio
+    async def test_expired_upstream_window_falls_back_to_local_limits(self):
+        limiter = RateLimiter()
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "0",
+                "x-rate-limit-reset": str(int(time.time()) - 1),
+            },
+        )
+
+        await limiter.acquire("search_tweets")
+
+    @pytest.mark.asyncio
+    async def test_incomplete_headers_are_ignored(self):
+        limiter = RateLimiter()
+
+        limiter.update_from_headers("search_tweets", {"x-rate-limit-remaining": "0"})
+
+        await limiter.acquire("search_tweets")
+
 
+
+class TestWaitingRateLimiter:
+    @pytest.fixture
+    def limiter(self) -> RateLimiter:
+        limiter = RateLimiter(max_wait=1.0)
+        limiter.LIMITS = {**RateLimiter.LIMITS, "test": (2, 0.2)}
+        return limiter
+
+    @pytest.mark.asyncio
+    async def test_waits_until_slot_frees(self, limiter: RateLimiter):
+        await limiter.acquire("test")
+        await limiter.acquire("test")
+
+        start = time.perf_counter()
+        await limiter.acquire("test")
+
+        assert 0.15 < time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_fifo(self, limiter: RateLimiter):
+        limiter.LIMITS = {**RateLimiter.LIMITS, "test": (1, 0.05)}
+        await limiter.acquire("test")
+        order: list[int] = []
+
+        async def wait_for_slot(index: int) -> None:
+            await limiter.acquire("test")
+            order.append(index)
+
+        tasks = []
+        for index in range(4):
+            tasks.append(asyncio.create_task(wait_for_slot(index)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+
+        assert order == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_rejects_immediately_when_deadline_cannot_be_met(self, limiter: RateLimiter):
+        limiter.LIMITS = {**RateLimiter.LIMITS, "test": (1, 10)}
+        await limiter.acquire("test")
+
+        start = time.perf_counter()
+        with pytest.raises(TwitterRateLimitError) as exc_info:
+            await limiter.acquire("test", max_wait=0.5)
+
+        assert time.perf_counter() - start < 0.1
+        assert exc_info.value.reset_time is not None
+
+    @pytest.mark.asyncio
+    async def test_queue_position_counts_against_deadline(self, limiter: RateLimiter):
+        limiter.LIMITS = {**RateLimiter.LIMITS, "test": (1, 0.3)}
+        await limiter.acquire("test")
+        first = asyncio.create_task(limiter.acquire("test", max_wait=0.5))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TwitterRateLimitError):
+            await limiter.acquire("test", max_wait=0.5)
+        await first
+
+    @pytest.mark.asyncio
+    async def test_queue_beyond_upstream_budget_is_rejected(self, limiter: RateLimiter):
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "1",
+                "x-rate-limit-remaining": "0",
+                "x-rate-limit-reset": str(int(time.time()) + 1),
+            },
+        )
+        first = asyncio.create_task(limiter.acquire("search_tweets", max_wait=2.0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TwitterRateLimitError):
+            await limiter.acquire("search_tweets", max_wait=2.0)
+        first.cancel()
+
+    @pytest.mark.asyncio
+    async def test_keys_do_not_share_state(self):
+        limiter = RateLimiter()
+        limiter.LIMITS = {**RateLimiter.LIMITS, "a": (1, 60), "b": (1, 60)}
+
+        await limiter.acquire("a")
+        await limiter.acquire("b")
+
+        with pytest.raises(TwitterRateLimitError):
+            await limiter.acquire("a")
+
+    @pytest.mark.asyncio
+    async def test_waits_for_upstream_reset(self, limiter: RateLimiter):
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "0",
+                "x-rate-limit-reset": str(int(time.time()) + 1),
+            },
+        )
+
+        await limiter.acquire("search_tweets", max_wait=2.0)
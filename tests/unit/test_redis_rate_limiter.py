@@ -0,0 +1,83 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.core.exceptions import TwitterRateLimitError
+from app.infrastructure.twitter.rate_limiter import RateLimiter
+from app.infrastructure.twitter.redis_rate_limiter import RedisRateLimiter
+
+
+@pytest.fixture
+def redis() -> FakeAsyncRedis:
+    return FakeAsyncRedis()
+
+
+def make_limiter(redis: FakeAsyncRedis, max_wait: float = 0.0) -> RedisRateLimiter:
+    limiter = RedisRateLimiter(redis, max_wait=max_wait)
+    limiter.LIMITS = {**RateLimiter.LIMITS, "test": (2, 0.2)}
+    return limiter
+
+
+class TestRedisRateLimiter:
+    @pytest.mark.asyncio
+    async def test_window_is_shared_between_instances(self, redis: FakeAsyncRedis):
+        first = make_limiter(redis)
+        second = make_limiter(redis)
+
+        await first.acquire("test")
+        await second.acquire("test")
+
+        with pytest.raises(TwitterRateLimitError):
+            await first.acquire("test")
+
+    @pytest.mark.asyncio
+    async def test_waits_until_shared_slot_frees(self, redis: FakeAsyncRedis):
+        limiter = make_limiter(redis, max_wait=1.0)
+        await limiter.acquire("test")
+        await make_limiter(redis).acquire("test")
+
+        start = time.perf_counter()
+        await limiter.acquire("test")
+
+        assert 0.1 < time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_upstream_headers_are_shared_between_instances(self, redis: FakeAsyncRedis):
+        first = make_limiter(redis)
+        second = make_limiter(redis)
+        reset_at = int(time.time()) + 900
+
+        first.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "1",
+                "x-rate-limit-reset": str(reset_at),
+            },
+        )
+        await asyncio.gather(*first._pending_updates)
+
+        await second.acquire("search_tweets")
+        with pytest.raises(TwitterRateLimitError) as exc_info:
+            await second.acquire("search_tweets")
+
+        assert exc_info.value.reset_time is not None
+        assert abs(exc_info.value.reset_time - reset_at) <= 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_limits_when_redis_fails(self):
+        redis = MagicMock()
+        redis.register_script.return_value = AsyncMock(side_effect=RedisConnectionError("down"))
+        limiter = RedisRateLimiter(redis)
+        limiter.LIMITS = {**RateLimiter.LIMITS, "test": (2, 0.2)}
+
+        await limiter.acquire("test")
+        await limiter.acquire("test")
+
+        with pytest.raises(TwitterRateLimitError):
+            await limiter.acquire("test")
+        assert redis.register_script.return_value.await_count == 1
@@ -0,0 +1,94 @@
+import json
+import random
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.core.entities import Account, Tweet
+from app.infrastructure.twitter.mapper import parse_tweets_page
+from app.main import app
+from app.presentation.api.rendering import (
+    encode_tweet,
+    grouped_tweets_response,
+    tweets_response,
+)
+from app.presentation.schemas.tweet import TweetSchema
+
+ALPHABET = "aé€😀 \t\n\"\\/<>&\x00\x1f\x7f #_@"
+
+
+def random_text(rng: random.Random) -> str:
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randrange(40)))
+
+
+def random_tweets(rng: random.Random, count: int) -> list[Tweet]:
+    accounts = [
+        Account(fullname=random_text(rng), href=f"/{random_text(rng)}", id=rng.randrange(2**63))
+        for _ in range(5)
+    ]
+    return [
+        Tweet(
+            account=rng.choice(accounts),
+            created_at=rng.choice([None, rng.randrange(-(2**35), 2**35)]),
+            hashtags=tuple(f"#{random_text(rng)}" for _ in range(rng.randrange(4))),
+            likes=rng.randrange(10**7),
+            replies=rng.randrange(10**5),
+            retweets=rng.randrange(10**6),
+            text=random_text(rng),
+            id=rng.randrange(2**63),
+        )
+        for _ in range(count)
+    ]
+
+
+def schema_body(content: object) -> bytes:
+    """What FastAPI rendered for the response_model before the fast path"""
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+class TestRendering:
+    def test_tweets_response_matches_schema_rendering(self):
+        rng = random.Random(47)
+        for _ in range(200):
+            tweets = random_tweets(rng, rng.randrange(20))
+
+            response = tweets_response(tweets)
+
+            assert response.body == schema_body([TweetSchema.from_entity(t) for t in tweets])
+            assert response.media_type == "application/json"
+
+    def test_grouped_tweets_response_matches_schema_rendering(self):
+        rng = random.Random(470)
+        groups = {f"#{random_text(rng)}": random_tweets(rng, 10) for _ in range(5)}
+
+        expected = schema_body(
+            {key: [TweetSchema.from_entity(t) for t in tweets] for key, tweets in groups.items()}
+        )
+        assert grouped_tweets_response(groups).body == expected
+
+    def test_encode_tweet_matches_model_dump_json(self):
+        for tweet in random_tweets(random.Random(4700), 200):
+            assert encode_tweet(tweet) == TweetSchema.from_entity(tweet).model_dump_json().encode()
+
+    def test_unparseable_created_at_renders_empty_date(self):
+        # Until tweets kept epoch seconds, the raw upstream string was echoed as date
+        payload = {
+            "data": [
+                {"id": "1", "author_id": "2", "text": "t", "created_at": "invalid-date-format"}
+            ],
+            "includes": {"users": [{"id": "2", "username": "u", "name": "U"}]},
+        }
+        tweets, _ = parse_tweets_page(json.dumps(payload).encode())
+
+        assert json.loads(tweets_response(tweets).body)[0]["date"] == ""
+        assert TweetSchema.from_entity(tweets[0]).date == ""
+
+    def test_openapi_keeps_tweet_schema_responses(self):
+        paths = app.openapi()["paths"]
+        tweet_list = {"$ref": "#/components/schemas/TweetSchema"}
+
+        for path in ("/api/v1/hashtags/{hashtag}", "/api/v1/users/{username}", "/api/v1/users"):
+            schema = paths[path]["get"]["responses"]["200"]["content"]["application/json"]
+            assert schema["schema"]["items"] == tweet_list
+        search = paths["/api/v1/search/hashtags"]["get"]["responses"]["200"]["content"]
+        assert search["application/json"]["schema"]["additionalProperties"]["items"] == tweet_list
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+from starlette.types import Message, Receive, Scope, Send
+
+from app.core.exceptions import DeadlineExceededError
+from app.presentation.middleware.request_context import TIMEOUT_HEADER, RequestContextMiddleware
+
+
+async def slow_stream(_scope: Scope, _receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b'{"id":1}\n', "more_body": True})
+    await asyncio.sleep(5)
+    await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def http_scope(timeout: str) -> Scope:
+    return {
+        "type": "http",
+        "method": "GET",
+        "path": "/api/v1/hashtags/python/stream",
+        "headers": [(TIMEOUT_HEADER.lower().encode(), timeout.encode())],
+    }
+
+
+class TestRequestContextMiddleware:
+    @pytest.mark.asyncio
+    async def test_deadline_after_response_started_aborts_the_stream(self):
+        sent: list[Message] = []
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        middleware = RequestContextMiddleware(slow_stream)
+
+        with pytest.raises(DeadlineExceededError):
+            await middleware(http_scope("0.05"), receive, send)
+
+        # No final chunk: the server drops the connection and the client sees
+        # an incomplete transfer instead of a cleanly finished 200
+        assert [message["type"] for message in sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+        assert sent[-1]["more_body"] is True
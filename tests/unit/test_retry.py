@@ -0,0 +1,153 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from app.core.context import begin_request
+from app.core.exceptions import (
+    DeadlineExceededError,
+    TwitterResourceNotFoundError,
+    TwitterServiceUnavailableError,
+)
+from app.infrastructure.http.retry import RetryBudget, RetryPolicy
+from app.utils.metrics import metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class TestRetryBudget:
+    def test_spends_burst_then_refills_by_ratio(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=2)
+
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+        budget.deposit()
+        assert not budget.try_spend()
+        budget.deposit()
+        assert budget.try_spend()
+
+    def test_deposits_are_capped(self):
+        budget = RetryBudget(ratio=1, max_tokens=2)
+
+        for _ in range(10):
+            budget.deposit()
+
+        assert budget.tokens == 2
+
+
+class TestRetryPolicy:
+    def test_backoff_uses_full_jitter_within_cap(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=4.0)
+        error = httpx.ConnectError("down")
+
+        delays = [policy.backoff(retry, error) for retry in range(6) for _ in range(50)]
+
+        assert all(0 <= delay <= 4.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_backoff_honours_retry_after_hint(self):
+        policy = RetryPolicy(base_delay=0.01)
+        error = TwitterServiceUnavailableError(retry_after=3.0)
+
+        assert policy.backoff(0, error) == 3.0
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors_until_success(self):
+        policy = RetryPolicy(base_delay=0.001)
+        attempt = AsyncMock(side_effect=[httpx.ConnectError("down"), "ok"])
+
+        result = await policy.call("search_tweets", attempt)
+
+        assert result == "ok"
+        assert attempt.await_count == 2
+        assert metrics.get("upstream_retries", endpoint="search_tweets") == 1
+
+    @pytest.mark.asyncio
+    async def test_attempts_receive_remaining_budget(self):
+        policy = RetryPolicy(base_delay=0.001, total_timeout=5.0)
+        attempt = AsyncMock(side_effect=[httpx.ConnectError("down"), "ok"])
+
+        await policy.call("search_tweets", attempt)
+
+        first, second = (call.args[0] for call in attempt.await_args_list)
+        assert 4.9 < first <= 5.0
+        assert second < first
+
+    @pytest.mark.asyncio
+    async def test_does_not_retry_other_errors(self):
+        policy = RetryPolicy(base_delay=0.001)
+        attempt = AsyncMock(side_effect=TwitterResourceNotFoundError())
+
+        with pytest.raises(TwitterResourceNotFoundError):
+            await policy.call("get_user", attempt)
+
+        assert attempt.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_when_hint_exceeds_deadline(self):
+        policy = RetryPolicy(base_delay=0.001, total_timeout=1.0)
+        attempt = AsyncMock(side_effect=TwitterServiceUnavailableError(retry_after=30))
+
+        start = time.perf_counter()
+        with pytest.raises(TwitterServiceUnavailableError):
+            await policy.call("search_tweets", attempt)
+
+        assert time.perf_counter() - start < 0.5
+        assert attempt.await_count == 1
+        assert metrics.get(
+            "upstream_retries_abandoned", endpoint="search_tweets", reason="deadline"
+        ) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_caps_retries(self):
+        policy = RetryPolicy(base_delay=0.001, budget=RetryBudget(ratio=0, max_tokens=1))
+        attempt = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+        with pytest.raises(httpx.ConnectError):
+            await policy.call("search_tweets", attempt)
+
+        assert attempt.await_count == 2
+        assert metrics.get(
+            "upstream_retries_abandoned", endpoint="search_tweets", reason="budget"
+        ) == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2, base_delay=0.001)
+        attempt = AsyncMock(side_effect=httpx.ConnectError("down"))
+
+        with pytest.raises(httpx.ConnectError):
+            await policy.call("search_tweets", attempt)
+
+        assert attempt.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_request_deadline_shortens_budget(self):
+        policy = RetryPolicy(base_delay=0.001, total_timeout=10.0)
+        attempt = AsyncMock(return_value="ok")
+        begin_request(timeout=0.5)
+
+        await policy.call("search_tweets", attempt)
+
+        assert attempt.await_args.args[0] <= 0.5
+
+    @pytest.mark.asyncio
+    async def test_expired_request_deadline_skips_upstream(self):
+        policy = RetryPolicy()
+        attempt = AsyncMock(return_value="ok")
+        begin_request(timeout=0.001)
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(DeadlineExceededError):
+            await policy.call("search_tweets", attempt)
+
+        attempt.assert_not_called()
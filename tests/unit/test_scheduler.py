@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from app.core.context import Priority, priority
+from app.core.exceptions import TwitterRateLimitError
+from app.infrastructure.twitter.rate_limiter import RateLimiter
+from app.infrastructure.twitter.scheduler import UpstreamScheduler
+
+
+class SmallRateLimiter(RateLimiter):
+    LIMITS = {"search_tweets": (10, 60)}
+
+
+async def use_slots(limiter: RateLimiter, count: int) -> None:
+    for _ in range(count):
+        await limiter.acquire("search_tweets")
+
+
+class TestUpstreamScheduler:
+    @pytest.mark.asyncio
+    async def test_interactive_calls_use_the_whole_window(self):
+        limiter = SmallRateLimiter()
+        scheduler = UpstreamScheduler(limiter, background_reserve=0.5, max_defer=0)
+        await use_slots(limiter, 9)
+
+        await scheduler.acquire("search_tweets")
+
+        assert limiter.headroom("search_tweets") == 0
+
+    @pytest.mark.asyncio
+    async def test_background_calls_stop_at_reserve(self):
+        limiter = SmallRateLimiter()
+        scheduler = UpstreamScheduler(limiter, background_reserve=0.2, max_defer=0)
+
+        with priority(Priority.BACKGROUND):
+            for _ in range(8):
+                await scheduler.acquire("search_tweets")
+            with pytest.raises(TwitterRateLimitError):
+                await scheduler.acquire("search_tweets")
+
+        assert limiter.headroom("search_tweets") == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_keeps_a_larger_reserve_than_background(self):
+        limiter = SmallRateLimiter()
+        scheduler = UpstreamScheduler(
+            limiter, background_reserve=0.2, bulk_reserve=0.5, max_defer=0
+        )
+        await use_slots(limiter, 5)
+
+        with priority(Priority.BULK), pytest.raises(TwitterRateLimitError):
+            await scheduler.acquire("search_tweets")
+        with priority(Priority.BACKGROUND):
+            await scheduler.acquire("search_tweets")
+
+    @pytest.mark.asyncio
+    async def test_reserve_follows_upstream_window(self):
+        limiter = SmallRateLimiter()
+        scheduler = UpstreamScheduler(limiter, bulk_reserve=0.5, max_defer=0)
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "300",
+                "x-rate-limit-reset": "9999999999",
+            },
+        )
+
+        with priority(Priority.BULK):
+            await scheduler.acquire("search_tweets")
+
+        assert limiter.headroom("search_tweets") == 299
+
+    @pytest.mark.asyncio
+    async def test_deferred_call_proceeds_when_headroom_returns(self):
+        limiter = SmallRateLimiter()
+        scheduler = UpstreamScheduler(limiter, background_reserve=0.2, max_defer=1.0)
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "10",
+                "x-rate-limit-remaining": "1",
+                "x-rate-limit-reset": "9999999999",
+            },
+        )
+
+        async def background() -> None:
+            with priority(Priority.BACKGROUND):
+                await scheduler.acquire("search_tweets")
+
+        task = asyncio.create_task(background())
+        await asyncio.sleep(0.05)
+        assert not task.done()
+
+        limiter.update_from_headers(
+            "search_tweets",
+            {
+                "x-rate-limit-limit": "10",
+                "x-rate-limit-remaining": "10",
+                "x-rate-limit-reset": "9999999998",
+            },
+        )
+        await asyncio.wait_for(task, timeout=1.0)
+
+        assert limiter.headroom("search_tweets") == 9
@@ -1,9 +1,13 @@
-from unittest.mock import AsyncMock
+import time
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.application.admission import AdmissionController
 from app.application.services import TweetService
-from app.core.entities import Account, Tweet
+from app.core.context import Priority, begin_request, current_priority
+from app.core.entities import Account, CachedTweets, Tweet
+from app.core.exceptions import ServiceOverloadedError, TwitterCircuitOpenError
 
 
 class TestTweetService:
@@ -12,14 +16,14 @@ class TestTweetService:
         self, tweet_service: TweetService
     ):
         # Mock cache miss
-        tweet_service.cache_service.get = AsyncMock(return_value=None)
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=None)
 
         # Mock repository response
         mock_tweets = [
             Tweet(
                 account=Account(fullname="Test", href="/test", id=123),
-                date="1 Jan 2024",
-                hashtags=["#test"],
+                created_at=1704067200,
+                hashtags=("#test",),
                 likes=10,
                 replies=5,
                 retweets=3,
@@ -45,15 +49,17 @@ class TestTweetService:
         cached_tweets = [
             Tweet(
                 account=Account(fullname="Cached", href="/cached", id=999),
-                date="1 Jan 2024",
-                hashtags=["#cached"],
+                created_at=1704067200,
+                hashtags=("#cached",),
                 likes=100,
                 replies=50,
                 retweets=30,
                 text="Cached tweet",
             )
         ]
-        tweet_service.cache_service.get = AsyncMock(return_value=cached_tweets)
+        tweet_service.cache_service.get_entry = AsyncMock(
+            return_value=CachedTweets(cached_tweets, newest_id=0, expires_at=time.time() + 60, fetched_at=time.time())
+        )
         tweet_service.tweet_repository.get_tweets_by_hashtag = AsyncMock()
 
         result = await tweet_service.get_tweets_by_hashtag("test")
@@ -62,17 +68,197 @@ class TestTweetService:
         # Repository should not be called
         tweet_service.tweet_repository.get_tweets_by_hashtag.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_refreshed_with_since_id(
+        self, tweet_service: TweetService
+    ):
+        def make_tweet(tweet_id: int) -> Tweet:
+            return Tweet(
+                account=Account(fullname="Test", href="/test", id=123),
+                created_at=1704067200,
+                hashtags=("#test",),
+                likes=0,
+                replies=0,
+                retweets=0,
+                text=f"Tweet {tweet_id}",
+                id=tweet_id,
+            )
+
+        stale = CachedTweets(
+            tweets=[make_tweet(3), make_tweet(2), make_tweet(1)],
+            newest_id=3,
+            expires_at=time.time() - 1,
+            fetched_at=time.time() - 301,
+        )
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=stale)
+        tweet_service.cache_service.set = AsyncMock()
+        tweet_service.tweet_repository.get_tweets_by_hashtag = AsyncMock(
+            return_value=[make_tweet(5), make_tweet(4)]
+        )
+
+        result = await tweet_service.get_tweets_by_hashtag("test", limit=4)
+
+        assert [tweet.id for tweet in result] == [5, 4, 3, 2]
+        tweet_service.tweet_repository.get_tweets_by_hashtag.assert_called_once_with(
+            "test", 4, since_id=3
+        )
+        tweet_service.cache_service.set.assert_called_once_with(
+            "hashtag:test:limit:4", result, 300, fetched_at=stale.fetched_at
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_fetched_in_full_after_stale_ttl(
+        self, tweet_service: TweetService
+    ):
+        cached = Tweet(
+            account=Account(fullname="Test", href="/test", id=123),
+            created_at=1704067200,
+            hashtags=(),
+            likes=0,
+            replies=0,
+            retweets=0,
+            text="Cached tweet",
+            id=1,
+        )
+        refetched = Tweet(
+            account=cached.account,
+            created_at=cached.created_at,
+            hashtags=(),
+            likes=42,
+            replies=0,
+            retweets=0,
+            text="Cached tweet",
+            id=1,
+        )
+        stale = CachedTweets(
+            [cached],
+            newest_id=1,
+            expires_at=time.time() - 1,
+            fetched_at=time.time() - tweet_service.settings.cache_stale_ttl - 1,
+        )
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=stale)
+        tweet_service.cache_service.set = AsyncMock()
+        tweet_service.tweet_repository.get_tweets_by_hashtag = AsyncMock(
+            return_value=[refetched]
+        )
+
+        result = await tweet_service.get_tweets_by_hashtag("test", limit=4)
+
+        assert result == [refetched]
+        tweet_service.tweet_repository.get_tweets_by_hashtag.assert_called_once_with("test", 4)
+        tweet_service.cache_service.set.assert_called_once_with(
+            "hashtag:test:limit:4", result, 300, fetched_at=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_while_circuit_is_open(
+        self, tweet_service: TweetService
+    ):
+        sample_tweet = Tweet(
+            account=Account(fullname="Test", href="/test", id=123),
+            created_at=1704067200,
+            hashtags=(),
+            likes=0,
+            replies=0,
+            retweets=0,
+            text="Cached tweet",
+            id=1,
+        )
+        stale = CachedTweets(
+            [sample_tweet], newest_id=0, expires_at=time.time() - 1, fetched_at=time.time() - 301
+        )
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=stale)
+        tweet_service.cache_service.set = AsyncMock()
+        tweet_service.tweet_repository.get_tweets_by_user = AsyncMock(
+            side_effect=TwitterCircuitOpenError("user_timeline", 10.0)
+        )
+        state = begin_request()
+
+        result = await tweet_service.get_tweets_by_user("test", limit=10)
+
+        assert result == [sample_tweet]
+        assert state.degraded
+        tweet_service.cache_service.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_without_cache_entry_raises(self, tweet_service: TweetService):
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=None)
+        tweet_service.tweet_repository.get_tweets_by_user = AsyncMock(
+            side_effect=TwitterCircuitOpenError("user_timeline", 10.0)
+        )
+
+        with pytest.raises(TwitterCircuitOpenError):
+            await tweet_service.get_tweets_by_user("test", limit=10)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_bypasses_saturated_admission(self, tweet_service: TweetService):
+        mock_tweet = Tweet(
+            account=Account(fullname="Test", href="/test", id=123),
+            created_at=1704067200,
+            hashtags=("#test",),
+            likes=0,
+            replies=0,
+            retweets=0,
+            text="Cached tweet",
+            id=1,
+        )
+        tweet_service.admission = AdmissionController(max_concurrent=1, max_queue=0)
+        tweet_service.cache_service.get_entry = AsyncMock(
+            side_effect=[
+                CachedTweets(
+                    [mock_tweet], newest_id=1, expires_at=time.time() + 60, fetched_at=time.time()
+                ),
+                None,
+            ]
+        )
+        tweet_service.tweet_repository.get_tweets_by_hashtag = AsyncMock(return_value=[])
+
+        async with tweet_service.admission.slot():
+            assert await tweet_service.get_tweets_by_hashtag("test", limit=10) == [mock_tweet]
+            with pytest.raises(ServiceOverloadedError):
+                await tweet_service.get_tweets_by_hashtag("other", limit=10)
+
+        tweet_service.tweet_repository.get_tweets_by_hashtag.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_since_id_filters_fresh_cache_hit(
+        self, tweet_service: TweetService
+    ):
+        cached_tweets = [
+            Tweet(
+                account=Account(fullname="Cached", href="/cached", id=999),
+                created_at=1704067200,
+                hashtags=("#cached",),
+                likes=0,
+                replies=0,
+                retweets=0,
+                text=f"Cached tweet {tweet_id}",
+                id=tweet_id,
+            )
+            for tweet_id in (30, 20, 10)
+        ]
+        tweet_service.cache_service.get_entry = AsyncMock(
+            return_value=CachedTweets(cached_tweets, newest_id=30, expires_at=time.time() + 60, fetched_at=time.time()
+            )
+        )
+        tweet_service.tweet_repository.get_tweets_by_user = AsyncMock()
+
+        result = await tweet_service.get_tweets_by_user("cached", since_id=20)
+
+        assert result == cached_tweets[:1]
+        tweet_service.tweet_repository.get_tweets_by_user.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_get_tweets_by_user(
         self, tweet_service: TweetService
     ):
-        tweet_service.cache_service.get = AsyncMock(return_value=None)
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=None)
 
         mock_tweets = [
             Tweet(
                 account=Account(fullname="User", href="/user", id=456),
-                date="2 Jan 2024",
-                hashtags=["#user"],
+                created_at=1704153600,
+                hashtags=("#user",),
                 likes=20,
                 replies=10,
                 retweets=5,
@@ -93,7 +279,7 @@ class TestTweetService:
     async def test_normalize_limit_too_high(
         self, tweet_service: TweetService
     ):
-        tweet_service.cache_service.get = AsyncMock(return_value=None)
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=None)
         tweet_service.tweet_repository.get_tweets_by_hashtag = AsyncMock(return_value=[])
 
         await tweet_service.get_tweets_by_hashtag("test", limit=200)
@@ -104,7 +290,7 @@ class TestTweetService:
     async def test_normalize_limit_too_low(
         self, tweet_service: TweetService
     ):
-        tweet_service.cache_service.get = AsyncMock(return_value=None)
+        tweet_service.cache_service.get_entry = AsyncMock(return_value=None)
         tweet_service.tweet_repository.get_tweets_by_hashtag = AsyncMock(return_value=[])
 
         await tweet_service.get_tweets_by_hashtag("test", limit=0)
@@ -112,3 +298,134 @@ class TestTweetService:
         # limit=0 is falsy, so default 30 is used
         tweet_service.tweet_repository.get_tweets_by_hashtag.assert_called_once_with("test", 30)
 
+
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_users_merges_by_recency(
+        self, tweet_service: TweetService
+    ):
+        def make_tweet(fullname: str, created_at: int) -> Tweet:
+            return Tweet(
+                account=Account(fullname=fullname, href=f"/{fullname}", id=1),
+                created_at=created_at,
+                hashtags=(),
+                likes=0,
+                replies=0,
+                retweets=0,
+                text=f"{fullname} at {created_at}",
+            )
+
+        alice = [make_tweet("alice", 1704229200), make_tweet("alice", 1704096000)]
+        bobby = [make_tweet("bobby", 1704189600), make_tweet("bobby", 1704150000)]
+
+        tweet_service.cache_service.get = AsyncMock(
+            side_effect=lambda key: alice if key == "user:alice:limit:3" else None
+        )
+        tweet_service.cache_service.set = AsyncMock()
+        tweet_service.tweet_repository.get_tweets_by_users = AsyncMock(
+            return_value={"bobby": bobby}
+        )
+
+        result = await tweet_service.get_tweets_by_users(["@alice", "bobby", "alice"], limit=3)
+
+        assert [tweet.created_at for tweet in result] == [1704229200, 1704189600, 1704150000]
+        tweet_service.tweet_repository.get_tweets_by_users.assert_called_once_with(["bobby"], 3)
+        tweet_service.cache_service.set.assert_called_once_with("user:bobby:limit:3", bobby, 300)
+
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_hashtags_fills_per_hashtag_cache(
+        self, tweet_service: TweetService
+    ):
+        cached_tweets = [
+            Tweet(
+                account=Account(fullname="Cached", href="/cached", id=999),
+                created_at=1704067200,
+                hashtags=("#python",),
+                likes=1,
+                replies=0,
+                retweets=0,
+                text="Cached tweet",
+            )
+        ]
+        fetched_tweets = [
+            Tweet(
+                account=Account(fullname="Fetched", href="/fetched", id=1),
+                created_at=1704067200,
+                hashtags=("#rust",),
+                likes=1,
+                replies=0,
+                retweets=0,
+                text="Fetched tweet",
+            )
+        ]
+        tweet_service.cache_service.get = AsyncMock(
+            side_effect=lambda key: cached_tweets if key == "hashtag:python:limit:30" else None
+        )
+        tweet_service.cache_service.set = AsyncMock()
+        tweet_service.tweet_repository.get_tweets_by_hashtags = AsyncMock(
+            return_value={"rust": fetched_tweets, "go": []}
+        )
+
+        result = await tweet_service.get_tweets_by_hashtags(["#python", "rust", "go", "Rust"])
+
+        assert result == {"python": cached_tweets, "rust": fetched_tweets, "go": []}
+        tweet_service.tweet_repository.get_tweets_by_hashtags.assert_called_once_with(
+            ["rust", "go"], 30
+        )
+        tweet_service.cache_service.set.assert_called_once_with(
+            "hashtag:rust:limit:30", fetched_tweets, 300
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_tweets_by_hashtag_yields_pages_without_cache(
+        self, tweet_service: TweetService
+    ):
+        tweet = Tweet(
+            account=Account(fullname="Test", href="/test", id=123),
+            created_at=1704067200,
+            hashtags=("#test",),
+            likes=10,
+            replies=5,
+            retweets=3,
+            text="Test tweet",
+        )
+
+        async def pages(*_args):
+            yield [tweet, tweet]
+            yield [tweet]
+
+        tweet_service.tweet_repository.iter_tweets_by_hashtag = MagicMock(side_effect=pages)
+        tweet_service.cache_service.set = AsyncMock()
+
+        result = [t async for t in tweet_service.stream_tweets_by_hashtag("#test", limit=5000)]
+
+        assert len(result) == 3
+        tweet_service.tweet_repository.iter_tweets_by_hashtag.assert_called_once_with("test", 1000)
+        tweet_service.cache_service.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_continuation_pages_are_fetched_at_bulk_priority(
+        self, tweet_service: TweetService
+    ):
+        tweet = Tweet(
+            account=Account(fullname="Test", href="/test", id=123),
+            created_at=1704067200,
+            hashtags=("#test",),
+            likes=10,
+            replies=5,
+            retweets=3,
+            text="Test tweet",
+        )
+        priorities: list[Priority] = []
+
+        async def pages(*_args):
+            for _ in range(3):
+                priorities.append(current_priority())
+                yield [tweet]
+
+        tweet_service.tweet_repository.iter_tweets_by_hashtag = MagicMock(side_effect=pages)
+
+        result = [t async for t in tweet_service.stream_tweets_by_hashtag("#test", limit=30)]
+
+        assert len(result) == 3
+        assert priorities == [Priority.INTERACTIVE, Priority.BULK, Priority.BULK]
+        assert current_priority() is Priority.INTERACTIVE
@@ -0,0 +1,81 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.infrastructure.ratelimit.redis_token_bucket import RedisTokenBucketStore
+from app.infrastructure.ratelimit.token_bucket import ShardedTokenBucketStore
+
+
+class TestShardedTokenBucketStore:
+    def test_burst_then_reject(self):
+        store = ShardedTokenBucketStore(rate=1.0, burst=3)
+
+        results = [store.take_now("ip:1", 100.0) for _ in range(4)]
+
+        assert [result.allowed for result in results] == [True, True, True, False]
+        assert [result.remaining for result in results] == [2, 1, 0, 0]
+        assert results[-1].retry_after == pytest.approx(1.0)
+        assert results[-1].reset_after == pytest.approx(3.0)
+
+    def test_refills_at_sustained_rate(self):
+        store = ShardedTokenBucketStore(rate=2.0, burst=2)
+        store.take_now("ip:1", 100.0)
+        store.take_now("ip:1", 100.0)
+
+        assert not store.take_now("ip:1", 100.1).allowed
+        assert store.take_now("ip:1", 100.6).allowed
+
+    def test_clients_have_separate_buckets(self):
+        store = ShardedTokenBucketStore(rate=1.0, burst=1)
+
+        assert store.take_now("ip:1", 100.0).allowed
+        assert store.take_now("ip:2", 100.0).allowed
+        assert not store.take_now("ip:1", 100.0).allowed
+
+    def test_refilled_buckets_are_swept_lazily(self):
+        store = ShardedTokenBucketStore(rate=1.0, burst=2, shards=1, sweep_interval=10.0)
+        store.take_now("ip:1", 100.0)
+        store.take_now("ip:2", 100.0)
+        assert len(store) == 2
+
+        store.take_now("ip:3", 105.0)
+        assert len(store) == 3
+
+        store.take_now("ip:3", 111.0)
+        assert len(store) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_drops_buckets(self):
+        store = ShardedTokenBucketStore(rate=1.0, burst=2)
+        store.take_now("ip:1", 100.0)
+
+        await store.close()
+
+        assert len(store) == 0
+
+
+class TestRedisTokenBucketStore:
+    @pytest.mark.asyncio
+    async def test_buckets_are_shared_between_workers(self):
+        redis = FakeAsyncRedis()
+        first = RedisTokenBucketStore(redis, rate=0.01, burst=2)
+        second = RedisTokenBucketStore(redis, rate=0.01, burst=2)
+
+        assert (await first.take("ip:1")).allowed
+        assert (await second.take("ip:1")).remaining == 0
+        result = await first.take("ip:1")
+
+        assert not result.allowed
+        assert result.retry_after > 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_buckets_when_redis_fails(self):
+        redis = MagicMock()
+        redis.register_script.return_value = AsyncMock(side_effect=RedisConnectionError("down"))
+        store = RedisTokenBucketStore(redis, rate=0.01, burst=1)
+
+        assert (await store.take("ip:1")).allowed
+        assert not (await store.take("ip:1")).allowed
+        assert redis.register_script.return_value.await_count == 1
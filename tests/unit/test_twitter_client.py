@@ -1,24 +1,62 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock
 
 import httpx
 import pytest
 
+from app.bootstrap.config import Settings
 from app.core.exceptions import (
     TwitterAuthenticationError,
+    TwitterCircuitOpenError,
     TwitterRateLimitError,
     TwitterResourceNotFoundError,
     TwitterServiceUnavailableError,
 )
+from app.infrastructure.http.hedging import LatencyTracker
+from app.infrastructure.http.retry import RetryPolicy
+from app.infrastructure.twitter.circuit_breaker import CircuitBreakers, CircuitState
 from app.infrastructure.twitter.client import TwitterClient
+from app.infrastructure.twitter.rate_limiter import RateLimiter
 from tests.fixtures.twitter_responses import (
     MOCK_ERROR_RESPONSE_401,
     MOCK_ERROR_RESPONSE_404,
     MOCK_TWEET_SEARCH_RESPONSE,
     MOCK_USER_LOOKUP_RESPONSE,
     MOCK_USER_TIMELINE_RESPONSE,
+    MOCK_USERS_LOOKUP_RESPONSE,
 )
 
 
+def json_bytes(data: dict) -> bytes:
+    return json.dumps(data).encode()
+
+
+def search_page(
+    tweets: list[tuple[int, list[str]]], next_token: str | None = None
+) -> MagicMock:
+    """Search response with the given (id, hashtags) tweets, newest first"""
+    response = MagicMock(spec=httpx.Response)
+    response.status_code = 200
+    response.headers = {}
+    response.content = json_bytes({
+        "data": [
+            {
+                "id": str(tweet_id),
+                "text": " ".join(f"#{tag}" for tag in tags),
+                "author_id": "1",
+                "entities": {"hashtags": [{"tag": tag} for tag in tags]},
+            }
+            for tweet_id, tags in tweets
+        ],
+        "includes": {"users": [{"id": "1", "name": "Test", "username": "test"}]},
+        "meta": {"next_token": next_token} if next_token else {},
+    })
+    return response
+
+
 class TestTwitterClient:
     @pytest.mark.asyncio
     async def test_get_tweets_by_hashtag_success(
@@ -26,7 +64,8 @@ class TestTwitterClient:
     ):
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_TWEET_SEARCH_RESPONSE
+        mock_response.headers = {}
+        mock_response.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
         mock_http_client.get.return_value = mock_response
 
         tweets = await twitter_client.get_tweets_by_hashtag("Python", limit=10)
@@ -34,7 +73,7 @@ class TestTwitterClient:
         assert len(tweets) == 2
         assert tweets[0].text == "Check out this amazing #Python tutorial!"
         assert tweets[0].likes == 169
-        assert tweets[0].hashtags == ["#Python"]
+        assert tweets[0].hashtags == ("#Python",)
         assert tweets[1].text == "Learning #Python is fun! #coding"
 
     @pytest.mark.asyncio
@@ -43,7 +82,8 @@ class TestTwitterClient:
     ):
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_TWEET_SEARCH_RESPONSE
+        mock_response.headers = {}
+        mock_response.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
         mock_http_client.get.return_value = mock_response
 
         await twitter_client.get_tweets_by_hashtag("#Python", limit=10)
@@ -51,17 +91,182 @@ class TestTwitterClient:
         call_args = mock_http_client.get.call_args
         assert call_args.kwargs["params"]["query"] == "#Python"
 
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_hashtag_since_id(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
+        mock_http_client.get.return_value = mock_response
+
+        tweets = await twitter_client.get_tweets_by_hashtag("Python", limit=10, since_id=42)
+
+        assert [tweet.id for tweet in tweets] == [1234567890, 1234567891]
+        assert mock_http_client.get.call_args.kwargs["params"]["since_id"] == "42"
+
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_hashtags_shares_one_search(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
+        mock_http_client.get.return_value = mock_response
+
+        results = await twitter_client.get_tweets_by_hashtags(
+            ["#python", "Coding", "rust"], limit=10
+        )
+
+        mock_http_client.get.assert_called_once()
+        params = mock_http_client.get.call_args.kwargs["params"]
+        assert params["query"] == "#python OR #Coding OR #rust"
+        assert params["max_results"] == 100
+        assert len(results["python"]) == 2
+        assert [tweet.text for tweet in results["Coding"]] == ["Learning #Python is fun! #coding"]
+        assert results["rust"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_hashtags_follows_next_token_until_buckets_fill(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        mock_http_client.get.side_effect = [
+            search_page([(4, ["python"]), (3, ["coding"])], next_token="page-2"),
+            search_page([(2, ["python", "coding"]), (1, ["python"])]),
+        ]
+
+        results = await twitter_client.get_tweets_by_hashtags(["python", "coding"], limit=2)
+
+        assert mock_http_client.get.await_count == 2
+        params = mock_http_client.get.call_args.kwargs["params"]
+        assert params["query"] == "#python OR #coding"
+        assert params["next_token"] == "page-2"
+        assert [tweet.id for tweet in results["python"]] == [4, 2]
+        assert [tweet.id for tweet in results["coding"]] == [3, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_hashtags_narrows_query_to_short_hashtags(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        mock_http_client.get.side_effect = [
+            search_page([(5, ["busy"]), (4, ["busy"]), (3, ["quiet"])], next_token="page-2"),
+            search_page([(2, ["quiet"])]),
+        ]
+
+        results = await twitter_client.get_tweets_by_hashtags(["busy", "quiet"], limit=2)
+
+        assert mock_http_client.get.await_count == 2
+        params = mock_http_client.get.call_args.kwargs["params"]
+        assert params["query"] == "#quiet"
+        assert params["until_id"] == "3"
+        assert "next_token" not in params
+        assert [tweet.id for tweet in results["busy"]] == [5, 4]
+        assert [tweet.id for tweet in results["quiet"]] == [3, 2]
+
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_hashtags_routes_tweets_to_their_own_query(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        twitter_client.settings.twitter_max_query_length = 128
+        first, second = "a" * 64, "b" * 64  # too long to share one query
+        shared = [(3, [first, second]), (2, [first, second])]
+
+        # Both queries get a page of tweets tagged with both hashtags
+        mock_http_client.get.side_effect = [search_page(shared), search_page(shared)]
+
+        results = await twitter_client.get_tweets_by_hashtags([first, second], limit=10)
+
+        assert mock_http_client.get.await_count == 2
+        assert [tweet.id for tweet in results[first]] == [3, 2]
+        assert [tweet.id for tweet in results[second]] == [3, 2]
+
+    def test_build_hashtag_queries_splits_on_length(self, twitter_client: TwitterClient):
+        twitter_client.settings.twitter_max_query_length = 64
+        hashtags = [f"hashtag{i:02d}" for i in range(8)]
+
+        queries = twitter_client._build_hashtag_queries(hashtags)
+
+        assert len(queries) == 2
+        assert all(len(query) <= 64 for query in queries)
+        assert " OR ".join(queries) == " OR ".join(f"#{hashtag}" for hashtag in hashtags)
+        assert [tag for tags in queries.values() for tag in tags] == hashtags
+
+    @pytest.mark.asyncio
+    async def test_iter_tweets_by_hashtag_follows_next_token(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        first_page = MagicMock(spec=httpx.Response)
+        first_page.status_code = 200
+        first_page.headers = {}
+        first_page.content = json_bytes({
+            **MOCK_TWEET_SEARCH_RESPONSE,
+            "meta": {"result_count": 2, "next_token": "page-2"},
+        })
+        second_page = MagicMock(spec=httpx.Response)
+        second_page.status_code = 200
+        second_page.headers = {}
+        second_page.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
+        mock_http_client.get.side_effect = [first_page, second_page]
+
+        pages = [page async for page in twitter_client.iter_tweets_by_hashtag("Python", 3)]
+
+        assert [len(page) for page in pages] == [2, 1]
+        first_params = mock_http_client.get.call_args_list[0].kwargs["params"]
+        second_params = mock_http_client.get.call_args_list[1].kwargs["params"]
+        assert "next_token" not in first_params
+        assert second_params["next_token"] == "page-2"
+        assert second_params["max_results"] == 10
+
+    @pytest.mark.asyncio
+    async def test_iter_tweets_by_user_acquires_rate_limit_per_page(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        user_response = MagicMock(spec=httpx.Response)
+        user_response.status_code = 200
+        user_response.headers = {}
+        user_response.content = json_bytes(MOCK_USER_LOOKUP_RESPONSE)
+        timeline_page = MagicMock(spec=httpx.Response)
+        timeline_page.status_code = 200
+        timeline_page.headers = {}
+        timeline_page.content = json_bytes({
+            **MOCK_USER_TIMELINE_RESPONSE,
+            "meta": {"next_token": "more"},
+        })
+        mock_http_client.get.side_effect = [user_response] + [timeline_page] * 3
+        twitter_client.rate_limiter.acquire = AsyncMock()
+
+        tweets = [
+            tweet
+            async for page in twitter_client.iter_tweets_by_user("twitter", 3)
+            for tweet in page
+        ]
+
+        assert len(tweets) == 3
+        acquired = [call.args[0] for call in twitter_client.rate_limiter.acquire.call_args_list]
+        assert acquired == [
+            "get_user:token0",
+            "user_timeline:token0",
+            "user_timeline:token0",
+            "user_timeline:token0",
+        ]
+        last_params = mock_http_client.get.call_args.kwargs["params"]
+        assert last_params["pagination_token"] == "more"
+
     @pytest.mark.asyncio
     async def test_get_tweets_by_user_success(
         self, twitter_client: TwitterClient, mock_http_client: AsyncMock
     ):
         user_response = MagicMock(spec=httpx.Response)
         user_response.status_code = 200
-        user_response.json.return_value = MOCK_USER_LOOKUP_RESPONSE
+        user_response.headers = {}
+        user_response.content = json_bytes(MOCK_USER_LOOKUP_RESPONSE)
 
         timeline_response = MagicMock(spec=httpx.Response)
         timeline_response.status_code = 200
-        timeline_response.json.return_value = MOCK_USER_TIMELINE_RESPONSE
+        timeline_response.headers = {}
+        timeline_response.content = json_bytes(MOCK_USER_TIMELINE_RESPONSE)
 
         mock_http_client.get.side_effect = [user_response, timeline_response]
 
@@ -72,6 +277,33 @@ class TestTwitterClient:
         assert tweets[0].likes == 287
         assert tweets[0].account.fullname == "Twitter"
 
+    @pytest.mark.asyncio
+    async def test_get_tweets_by_users_batches_lookup(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        users_response = MagicMock(spec=httpx.Response)
+        users_response.status_code = 200
+        users_response.headers = {}
+        users_response.content = json_bytes(MOCK_USERS_LOOKUP_RESPONSE)
+
+        timeline_response = MagicMock(spec=httpx.Response)
+        timeline_response.status_code = 200
+        timeline_response.headers = {}
+        timeline_response.content = json_bytes(MOCK_USER_TIMELINE_RESPONSE)
+
+        mock_http_client.get.side_effect = [users_response, timeline_response, timeline_response]
+
+        timelines = await twitter_client.get_tweets_by_users(
+            ["@twitter", "raymondh", "ghost_user"], limit=10
+        )
+
+        assert set(timelines) == {"twitter", "raymondh"}
+        assert timelines["twitter"][0].likes == 287
+        assert mock_http_client.get.call_count == 3
+        lookup_call = mock_http_client.get.call_args_list[0]
+        assert lookup_call.args[0].endswith("/users/by")
+        assert lookup_call.kwargs["params"]["usernames"] == "twitter,raymondh,ghost_user"
+
     @pytest.mark.asyncio
     async def test_authentication_error_401(
         self, twitter_client: TwitterClient, mock_http_client: AsyncMock
@@ -88,6 +320,32 @@ class TestTwitterClient:
         with pytest.raises(TwitterAuthenticationError):
             await twitter_client.get_tweets_by_hashtag("Python", limit=10)
 
+    @pytest.mark.asyncio
+    async def test_single_token_is_retried_by_next_request_after_401(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        unauthorized = MagicMock(spec=httpx.Response)
+        unauthorized.status_code = 401
+        unauthorized.is_success = False
+        unauthorized.json.return_value = MOCK_ERROR_RESPONSE_401
+        unauthorized.text = "Unauthorized"
+        unauthorized.url = "https://api.twitter.com/2/tweets/search/recent"
+        unauthorized.headers = {}
+        ok = MagicMock(spec=httpx.Response)
+        ok.status_code = 200
+        ok.is_success = True
+        ok.headers = {}
+        ok.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
+        mock_http_client.get.side_effect = [unauthorized, ok]
+
+        with pytest.raises(TwitterAuthenticationError):
+            await twitter_client.get_tweets_by_hashtag("Python", limit=10)
+        tweets = await twitter_client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert len(twitter_client.authenticator.tokens) == 1
+        assert len(tweets) == 2
+        assert mock_http_client.get.await_count == 2
+
     @pytest.mark.asyncio
     async def test_resource_not_found_404(
         self, twitter_client: TwitterClient, mock_http_client: AsyncMock
@@ -122,13 +380,77 @@ class TestTwitterClient:
 
         assert exc_info.value.reset_time == 1234567890
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_update_limiter(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        mock_http_client.get.return_value = httpx.Response(
+            200,
+            json=MOCK_TWEET_SEARCH_RESPONSE,
+            headers={
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "0",
+                "x-rate-limit-reset": "4102444800",
+            },
+        )
+
+        await twitter_client.get_tweets_by_hashtag("Python", limit=10)
+
+        with pytest.raises(TwitterRateLimitError) as exc_info:
+            await twitter_client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert exc_info.value.reset_time == 4102444800
+        mock_http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_requests_route_to_token_with_most_headroom(
+        self, test_settings: Settings, mock_http_client: AsyncMock
+    ):
+        test_settings.twitter_bearer_tokens = ["second_bearer_token"]
+        client = TwitterClient(test_settings, mock_http_client, RateLimiter())
+        mock_http_client.get.return_value = httpx.Response(
+            200,
+            json=MOCK_TWEET_SEARCH_RESPONSE,
+            headers={
+                "x-rate-limit-limit": "450",
+                "x-rate-limit-remaining": "1",
+                "x-rate-limit-reset": "4102444800",
+            },
+        )
+
+        await client.get_tweets_by_hashtag("Python", limit=10)
+        await client.get_tweets_by_hashtag("Python", limit=10)
+
+        used = [
+            call.kwargs["headers"]["Authorization"]
+            for call in mock_http_client.get.call_args_list
+        ]
+        assert used == ["Bearer test_bearer_token", "Bearer second_bearer_token"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_token_fails_over_to_next(
+        self, test_settings: Settings, mock_http_client: AsyncMock
+    ):
+        test_settings.twitter_bearer_tokens = ["second_bearer_token"]
+        client = TwitterClient(test_settings, mock_http_client, RateLimiter())
+        mock_http_client.get.side_effect = [
+            httpx.Response(429, json={}, headers={"x-rate-limit-reset": "4102444800"}),
+            httpx.Response(200, json=MOCK_TWEET_SEARCH_RESPONSE),
+        ]
+
+        tweets = await client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert len(tweets) == 2
+        assert client.authenticator.available_tokens() == [client.authenticator.tokens[1]]
+
     @pytest.mark.asyncio
     async def test_limit_validation(
         self, twitter_client: TwitterClient, mock_http_client: AsyncMock
     ):
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = MOCK_TWEET_SEARCH_RESPONSE
+        mock_response.headers = {}
+        mock_response.content = json_bytes(MOCK_TWEET_SEARCH_RESPONSE)
         mock_http_client.get.return_value = mock_response
 
         await twitter_client.get_tweets_by_hashtag("Python", limit=200)
@@ -165,13 +487,144 @@ class TestTwitterClient:
 
         assert "Twitter API error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_server_error_retry_after_is_honoured(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        mock_http_client.get.side_effect = [
+            httpx.Response(
+                503,
+                json={},
+                headers={"retry-after": "0.05"},
+                request=httpx.Request("GET", "https://api.twitter.com/2/tweets/search/recent"),
+            ),
+            httpx.Response(200, json=MOCK_TWEET_SEARCH_RESPONSE),
+        ]
+
+        start = time.perf_counter()
+        tweets = await twitter_client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert len(tweets) == 2
+        assert time.perf_counter() - start >= 0.05
+        assert mock_http_client.get.await_args.kwargs["timeout"] <= 10
+
+    @pytest.mark.asyncio
+    async def test_server_error_ignores_rate_limit_reset(
+        self, twitter_client: TwitterClient, mock_http_client: AsyncMock
+    ):
+        # Twitter sends the rate-limit headers on every response, 5xx included
+        rate_limit_headers = {
+            "x-rate-limit-limit": "450",
+            "x-rate-limit-remaining": "449",
+            "x-rate-limit-reset": str(int(time.time()) + 600),
+        }
+        mock_http_client.get.side_effect = [
+            httpx.Response(
+                503,
+                json={},
+                headers=rate_limit_headers,
+                request=httpx.Request("GET", "https://api.twitter.com/2/tweets/search/recent"),
+            ),
+            httpx.Response(200, json=MOCK_TWEET_SEARCH_RESPONSE, headers=rate_limit_headers),
+        ]
+
+        tweets = await twitter_client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert len(tweets) == 2
+        assert mock_http_client.get.await_count == 2
+
+    def test_server_error_retry_after_comes_only_from_retry_after(
+        self, twitter_client: TwitterClient
+    ):
+        response = httpx.Response(
+            503,
+            json={},
+            headers={"x-rate-limit-reset": str(int(time.time()) + 600)},
+            request=httpx.Request("GET", "https://api.twitter.com/2/tweets/search/recent"),
+        )
+
+        with pytest.raises(TwitterServiceUnavailableError) as exc_info:
+            twitter_client._handle_response_errors(response)
+
+        assert exc_info.value.retry_after is None
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(
+        self, test_settings: Settings, mock_http_client: AsyncMock
+    ):
+        breakers = CircuitBreakers(failure_threshold=1)
+        client = TwitterClient(
+            test_settings,
+            mock_http_client,
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breakers=breakers,
+        )
+        mock_http_client.get.side_effect = httpx.ConnectError("Connection refused")
+
+        with pytest.raises(TwitterServiceUnavailableError):
+            await client.get_tweets_by_hashtag("Python", limit=10)
+        with pytest.raises(TwitterCircuitOpenError):
+            await client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert mock_http_client.get.call_count == 1
+        assert breakers.get("search_tweets").state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_hedged_request_takes_rate_limit_slot(
+        self, test_settings: Settings, mock_http_client: AsyncMock
+    ):
+        test_settings.twitter_hedging_enabled = True
+        test_settings.twitter_hedge_min_headroom = 1
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("search_tweets", 0.01)
+        limiter = RateLimiter()
+        client = TwitterClient(
+            test_settings, mock_http_client, limiter, latency_tracker=tracker
+        )
+        responses = iter([1.0, 0.0])
+
+        async def get(*_args, **_kwargs):
+            await asyncio.sleep(next(responses))
+            return httpx.Response(200, json=MOCK_TWEET_SEARCH_RESPONSE)
+
+        mock_http_client.get.side_effect = get
+
+        tweets = await client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert len(tweets) == 2
+        assert mock_http_client.get.call_count == 2
+        assert limiter.headroom("search_tweets:token0") == 10
+
+    @pytest.mark.asyncio
+    async def test_hedging_disabled_when_headroom_is_low(
+        self, test_settings: Settings, mock_http_client: AsyncMock
+    ):
+        test_settings.twitter_hedging_enabled = True
+        test_settings.twitter_hedge_min_headroom = 12
+        tracker = LatencyTracker(min_samples=1)
+        tracker.record("search_tweets", 0.01)
+        client = TwitterClient(
+            test_settings, mock_http_client, RateLimiter(), latency_tracker=tracker
+        )
+
+        async def get(*_args, **_kwargs):
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json=MOCK_TWEET_SEARCH_RESPONSE)
+
+        mock_http_client.get.side_effect = get
+
+        await client.get_tweets_by_hashtag("Python", limit=10)
+
+        assert mock_http_client.get.call_count == 1
+
     @pytest.mark.asyncio
     async def test_empty_response_data(
         self, twitter_client: TwitterClient, mock_http_client: AsyncMock
     ):
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": [], "includes": {"users": []}}
+        mock_response.headers = {}
+        mock_response.content = json_bytes({"data": [], "includes": {"users": []}})
         mock_http_client.get.return_value = mock_response
 
         tweets = await twitter_client.get_tweets_by_hashtag("RareHashtag", limit=10)
@@ -184,6 +637,8 @@ class TestTwitterClient:
     ):
         mock_response = MagicMock(spec=httpx.Response)
         mock_response.status_code = 404
+        mock_response.is_success = False
+        mock_response.headers = {}
         mock_response.json.return_value = MOCK_ERROR_RESPONSE_404
         mock_response.text = "User not found"
         mock_http_client.get.return_value = mock_response
@@ -191,3 +646,36 @@ class TestTwitterClient:
         with pytest.raises(TwitterResourceNotFoundError):
             await twitter_client.get_tweets_by_user("nonexistent_user", limit=10)
 
+
+    @pytest.mark.asyncio
+    async def test_large_pages_are_mapped_on_the_executor(
+        self, test_settings: Settings, mock_http_client: AsyncMock
+    ):
+        test_settings.mapping_offload_threshold = 1000
+        tweet = MOCK_TWEET_SEARCH_RESPONSE["data"][0]
+        small = {**MOCK_TWEET_SEARCH_RESPONSE, "data": [tweet]}
+        large = {
+            **MOCK_TWEET_SEARCH_RESPONSE,
+            "data": [{**tweet, "id": str(tweet_id)} for tweet_id in range(1, 21)],
+        }
+        responses = []
+        for body in (small, large):
+            response = MagicMock(spec=httpx.Response)
+            response.status_code = 200
+            response.headers = {}
+            response.content = json_bytes(body)
+            responses.append(response)
+        mock_http_client.get.side_effect = responses
+        assert len(responses[0].content) < 1000 <= len(responses[1].content)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit = MagicMock(wraps=executor.submit)
+            client = TwitterClient(test_settings, mock_http_client, mapping_executor=executor)
+
+            small_tweets = await client.get_tweets_by_hashtag("Python", limit=10)
+            assert executor.submit.call_count == 0
+            large_tweets = await client.get_tweets_by_hashtag("Python", limit=20)
+            assert executor.submit.call_count == 1
+
+        assert len(small_tweets) == 1
+        assert [tweet.id for tweet in large_tweets] == list(range(1, 21))
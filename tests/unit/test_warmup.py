@@ -0,0 +1,114 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.bootstrap.config import Settings
+from app.bootstrap.container import Container
+from app.bootstrap.lifecycle import create_lifespan
+from app.bootstrap.routes import setup_routes
+from app.bootstrap.warmup import warm_up
+from app.core.context import Priority, current_priority
+
+
+def build_container(settings: Settings, **overrides: object) -> Container:
+    container = Container.build(settings.model_copy(update=overrides))
+    container.http_client = AsyncMock()  # type: ignore[assignment]
+    container.cache_service.ping = AsyncMock()  # type: ignore[method-assign]
+    container.rate_limiter.ping = AsyncMock()  # type: ignore[method-assign]
+    return container
+
+
+class TestWarmUp:
+    @pytest.mark.asyncio
+    async def test_opens_configured_number_of_connections(self, test_settings: Settings):
+        container = build_container(test_settings, warmup_connections=3)
+
+        await warm_up(container)
+
+        assert container.http_client.head.await_count == 3
+        container.http_client.head.assert_awaited_with(test_settings.twitter_api_base_url)
+
+    @pytest.mark.asyncio
+    async def test_pings_cache_and_rate_limiter(self, test_settings: Settings):
+        container = build_container(test_settings, warmup_connections=0)
+
+        await warm_up(container)
+
+        container.cache_service.ping.assert_awaited_once()
+        container.rate_limiter.ping.assert_awaited_once()
+        container.http_client.head.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failures_do_not_abort_warmup(self, test_settings: Settings):
+        container = build_container(test_settings, warmup_connections=2, warmup_hashtags=["python"])
+        container.http_client.head.side_effect = ConnectionError("dns")
+        container.cache_service.ping.side_effect = ConnectionError("redis down")
+        container.tweet_service = AsyncMock()  # type: ignore[assignment]
+
+        await warm_up(container)
+
+        container.tweet_service.get_tweets_by_hashtag.assert_awaited_once_with("python")
+
+    @pytest.mark.asyncio
+    async def test_prefetches_hot_feeds_at_background_priority(self, test_settings: Settings):
+        container = build_container(
+            test_settings,
+            warmup_connections=0,
+            warmup_hashtags=["python", "rust"],
+            warmup_users=["raymondh"],
+        )
+        priorities = []
+
+        async def fetch(_: str) -> list[object]:
+            priorities.append(current_priority())
+            return []
+
+        container.tweet_service = AsyncMock()  # type: ignore[assignment]
+        container.tweet_service.get_tweets_by_hashtag.side_effect = fetch
+        container.tweet_service.get_tweets_by_user.side_effect = fetch
+
+        await warm_up(container)
+
+        assert priorities == [Priority.BACKGROUND] * 3
+        assert current_priority() is Priority.INTERACTIVE
+
+    @pytest.mark.asyncio
+    async def test_is_bounded_by_timeout(self, test_settings: Settings):
+        container = build_container(test_settings, warmup_connections=0, warmup_timeout=0.05)
+
+        async def hang() -> None:
+            await asyncio.sleep(10)
+
+        container.cache_service.ping.side_effect = hang
+
+        await asyncio.wait_for(warm_up(container), timeout=1)
+
+
+class TestReadiness:
+    def test_not_ready_without_lifespan(self):
+        app = FastAPI()
+        setup_routes(app)
+
+        response = TestClient(app).get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["status"] == "warming_up"
+
+    def test_ready_once_warmup_completes(self):
+        app = FastAPI(lifespan=create_lifespan())
+        setup_routes(app)
+
+        async def wait_for_warmup() -> None:
+            await app.state.warmup
+
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            client.portal.call(wait_for_warmup)  # type: ignore[union-attr]
+
+            response = client.get("/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"